@@ -0,0 +1,42 @@
+"""
+Session middleware limited to the paths that use the session.
+"""
+from typing import Any, Tuple
+
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SessionGateMiddleware:
+    """
+    Pure ASGI wrapper that runs SessionMiddleware only for session paths.
+
+    Every endpoint that reads or writes request.session lives under
+    /api/, so static files, pages and the health check skip the signed
+    cookie verification and re-signing SessionMiddleware does per request.
+    Requests outside the session paths have no "session" in their scope.
+    """
+
+    SESSION_PATH_PREFIXES: Tuple[str, ...] = ("/api/",)
+
+    def __init__(self, app: ASGIApp, secret_key: str, **session_options: Any):
+        """
+        Initialize the gate around a SessionMiddleware.
+
+        Args:
+            app: Downstream ASGI application
+            secret_key: Key used to sign the session cookie
+            **session_options: Remaining SessionMiddleware options
+                (session_cookie, max_age, same_site, ...)
+        """
+        self.app = app
+        self.session_app = SessionMiddleware(app, secret_key=secret_key, **session_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and not scope["path"].startswith(
+            self.SESSION_PATH_PREFIXES
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await self.session_app(scope, receive, send)
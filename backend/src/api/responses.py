@@ -0,0 +1,51 @@
+"""
+JSON response classes: orjson-backed default and pre-encoded static bodies.
+"""
+import json
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse, Response
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Serialize content the same way Starlette's JSONResponse does.
+
+    Args:
+        content: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded compact JSON
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class StaticJSONResponse(Response):
+    """
+    JSON response for a body pre-encoded with encode_json().
+
+    A new instance must be created per request (middleware may append headers
+    such as Set-Cookie to the response), but the body bytes are shared.
+    """
+
+    media_type = "application/json"
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse serialized with orjson (C) instead of the stdlib json module.
+
+    Defined here rather than using fastapi.responses.ORJSONResponse, which
+    newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content)
@@ -0,0 +1,132 @@
+"""
+Static files app serving every asset from memory.
+"""
+import gzip
+import mimetypes
+import os
+from email.utils import formatdate
+from hashlib import md5
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+
+class _CachedFile(NamedTuple):
+    """A static file's body and headers, plus its gzip variant if it has one."""
+
+    content: bytes
+    headers: Headers
+    gzipped: Optional[Tuple[bytes, Headers]]
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that reads its directory once at startup and serves from memory.
+
+    Each file's body and response headers (content-type, content-length,
+    last-modified, etag) are built when the app is created, so a hit is a
+    dict lookup with no stat() or file read. Headers and conditional request
+    handling match StaticFiles. Files added or edited after startup are not
+    picked up; paths that are not cached, and Range requests, fall back to
+    StaticFiles.
+
+    Files GZipMiddleware would compress are also gzipped once at startup and
+    served with Content-Encoding: gzip to clients that accept it, which
+    GZipMiddleware then passes through untouched.
+    """
+
+    def __init__(self, *, directory: str, gzip_minimum_size: int = 500, **options):
+        """
+        Initialize and load every file under directory.
+
+        Args:
+            directory: Directory of static assets
+            gzip_minimum_size: Smallest file to precompress; match the
+                GZipMiddleware minimum_size
+            **options: Remaining StaticFiles options
+        """
+        super().__init__(directory=directory, **options)
+        self.gzip_minimum_size = gzip_minimum_size
+        self._cache: Dict[str, _CachedFile] = {}
+
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                full_path = os.path.join(root, filename)
+                self._cache[os.path.relpath(full_path, directory)] = self._load(full_path)
+
+    def _load(self, full_path: str) -> _CachedFile:
+        """
+        Read a file and build the headers FileResponse would send for it.
+
+        Args:
+            full_path: Path to the file
+
+        Returns:
+            Cached body and headers, with a gzip variant for compressible files
+        """
+        with open(full_path, "rb") as f:
+            content = f.read()
+        stat_result = os.stat(full_path)
+
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+        etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}".encode()
+        etag = md5(etag_base, usedforsecurity=False).hexdigest()
+        content_type = media_type
+        if media_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+
+        raw_headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", content_type.encode("latin-1")),
+            (b"accept-ranges", b"bytes"),
+            (b"content-length", str(len(content)).encode("latin-1")),
+            (b"last-modified", formatdate(stat_result.st_mtime, usegmt=True).encode("latin-1")),
+            (b"etag", f'"{etag}"'.encode("latin-1")),
+        ]
+
+        gzipped = None
+        media_types = {media_type, media_type.partition("/")[0] + "/*"}
+        compressible = media_types.isdisjoint(DEFAULT_EXCLUDED_CONTENT_TYPES)
+        if compressible and len(content) >= self.gzip_minimum_size:
+            # mtime=0 keeps the output identical across restarts
+            compressed = gzip.compress(content, compresslevel=9, mtime=0)
+            if len(compressed) < len(content):
+                gzip_length = str(len(compressed)).encode("latin-1")
+                gzip_headers = [
+                    (name, gzip_length if name == b"content-length" else value)
+                    for name, value in raw_headers
+                ]
+                gzip_headers += [(b"content-encoding", b"gzip"), (b"vary", b"Accept-Encoding")]
+                gzipped = (compressed, Headers(raw=gzip_headers))
+
+        return _CachedFile(content, Headers(raw=raw_headers), gzipped)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """
+        Serve a cached file, or defer to StaticFiles for anything else.
+
+        Args:
+            path: Requested path relative to the directory
+            scope: ASGI request scope
+
+        Returns:
+            200 with the cached body, 304 if the client copy is current
+        """
+        cached = self._cache.get(path)
+        request_headers = Headers(scope=scope)
+        if cached is None or scope["method"] not in ("GET", "HEAD") or "range" in request_headers:
+            return await super().get_response(path, scope)
+
+        content, headers = cached.content, cached.headers
+        if cached.gzipped is not None and "gzip" in request_headers.get("accept-encoding", ""):
+            content, headers = cached.gzipped
+
+        if self.is_not_modified(headers, request_headers):
+            return NotModifiedResponse(headers)
+
+        response = Response(content)
+        response.raw_headers = list(headers.raw)
+        return response
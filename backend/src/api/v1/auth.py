@@ -1,11 +1,13 @@
 """
 OAuth2 authentication endpoints for Google Sheets integration.
 """
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
+from datetime import timezone
+from backend.src.api.responses import StaticJSONResponse, encode_json
 from backend.src.models.user_preference import UserPreference
 import os
 import logging
@@ -20,6 +22,74 @@ CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 REDIRECT_URI = os.getenv("REDIRECT_URI", "http://localhost:8000/api/v1/auth/callback")
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# Client configuration is static for the process lifetime, so build it once
+_CLIENT_CONFIG = {
+    "web": {
+        "client_id": CLIENT_ID,
+        "client_secret": CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/v2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+}
+
+
+def _make_flow() -> Flow:
+    """
+    Build an OAuth2 flow from the shared client configuration.
+
+    A new Flow is returned per call because it holds per-request state
+    (fetched credentials, PKCE verifier) and must not be shared.
+
+    Returns:
+        Configured Flow instance
+    """
+    return Flow.from_client_config(
+        _CLIENT_CONFIG,
+        scopes=SCOPES,
+        redirect_uri=REDIRECT_URI
+    )
+
+
+# Error response bodies are fixed, so serialize them once at import
+_AUTH_INIT_FAILED_BODY = encode_json({
+    "error_code": "AUTH_INIT_FAILED",
+    "message": "Failed to initiate authentication"
+})
+
+_MISSING_AUTH_CODE_BODY = encode_json({
+    "error_code": "MISSING_AUTH_CODE",
+    "message": "Authorization code not provided"
+})
+
+_AUTH_FAILED_BODY = encode_json({
+    "error_code": "AUTH_FAILED",
+    "message": "Failed to authenticate with Google"
+})
+
+_NOT_AUTHENTICATED_BODY = encode_json({
+    "error_code": "NOT_AUTHENTICATED",
+    "message": "Please authenticate with Google Sheets first"
+})
+
+_INVALID_SPREADSHEET_ID_BODY = encode_json({
+    "error_code": "INVALID_SPREADSHEET_ID",
+    "message": "Spreadsheet ID must be 44 characters (letters, digits, '-' or '_')"
+})
+
+_INVALID_SHEET_NAME_BODY = encode_json({
+    "error_code": "INVALID_SHEET_NAME",
+    "message": "Sheet tab name cannot be empty"
+})
+
+# Status for a session with no OAuth token - the common polling case
+_STATUS_UNAUTHENTICATED_BODY = encode_json({
+    "authenticated": False,
+    "spreadsheet_configured": False,
+    "token_expires_at": None,
+    "spreadsheet_id": None,
+    "sheet_tab_name": None
+})
+
 
 class SetupRequest(BaseModel):
     """Request model for setup endpoint."""
@@ -37,18 +107,7 @@ async def initiate_auth():
     """
     try:
         # Create flow instance
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": CLIENT_ID,
-                    "client_secret": CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/v2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                }
-            },
-            scopes=SCOPES,
-            redirect_uri=REDIRECT_URI
-        )
+        flow = _make_flow()
 
         # Generate authorization URL
         auth_url, state = flow.authorization_url(
@@ -61,13 +120,7 @@ async def initiate_auth():
 
     except Exception as e:
         logger.error(f"Failed to generate authorization URL: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "AUTH_INIT_FAILED",
-                "message": "Failed to initiate authentication"
-            }
-        )
+        return StaticJSONResponse(_AUTH_INIT_FAILED_BODY, status_code=500)
 
 
 @router.get("/api/v1/auth/callback")
@@ -83,39 +136,26 @@ async def handle_callback(request: Request, code: str = None):
         Redirect to setup page
     """
     if not code:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "MISSING_AUTH_CODE",
-                "message": "Authorization code not provided"
-            }
-        )
+        return StaticJSONResponse(_MISSING_AUTH_CODE_BODY, status_code=400)
 
     try:
         # Exchange code for token
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": CLIENT_ID,
-                    "client_secret": CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/v2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                }
-            },
-            scopes=SCOPES,
-            redirect_uri=REDIRECT_URI
-        )
+        flow = _make_flow()
 
         flow.fetch_token(code=code)
         creds = flow.credentials
 
         # Store token in session (encrypted)
         # TODO: Implement proper session management with SECRET_KEY encryption
-        if hasattr(request, 'session'):
-            request.session['oauth_token'] = creds.token
-            request.session['token_expiry'] = creds.expiry.isoformat() if creds.expiry else None
-            request.session['refresh_token'] = creds.refresh_token
-            request.session['user_id'] = 'default_user'  # TODO: Extract from Google user info
+        session = request.session
+        session['oauth_token'] = creds.token
+        session['token_expiry'] = creds.expiry.isoformat() if creds.expiry else None
+        # google-auth reports expiry as naive UTC
+        session['token_expiry_ts'] = (
+            creds.expiry.replace(tzinfo=timezone.utc).timestamp() if creds.expiry else 0.0
+        )
+        session['refresh_token'] = creds.refresh_token
+        session['user_id'] = 'default_user'  # TODO: Extract from Google user info
 
         logger.info("OAuth2 callback successful, token acquired")
 
@@ -123,13 +163,7 @@ async def handle_callback(request: Request, code: str = None):
 
     except Exception as e:
         logger.error(f"OAuth2 token exchange failed: {e}")
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error_code": "AUTH_FAILED",
-                "message": "Failed to authenticate with Google"
-            }
-        )
+        return StaticJSONResponse(_AUTH_FAILED_BODY, status_code=401)
 
 
 @router.post("/api/v1/auth/setup")
@@ -145,35 +179,17 @@ async def save_preferences(request: Request, data: SetupRequest):
         JSON response with success message
     """
     # Check authentication
-    session = request.session if hasattr(request, 'session') else {}
+    session = request.session
     if not session.get('oauth_token'):
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error_code": "NOT_AUTHENTICATED",
-                "message": "Please authenticate with Google Sheets first"
-            }
-        )
+        return StaticJSONResponse(_NOT_AUTHENTICATED_BODY, status_code=401)
 
-    # Validate spreadsheet_id
-    if len(data.spreadsheet_id) != 44:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "INVALID_SPREADSHEET_ID",
-                "message": "Spreadsheet ID must be 44 characters"
-            }
-        )
+    # Validate spreadsheet_id (44 URL-safe characters, as in the sheet URL)
+    if not UserPreference.SPREADSHEET_ID_PATTERN.fullmatch(data.spreadsheet_id):
+        return StaticJSONResponse(_INVALID_SPREADSHEET_ID_BODY, status_code=400)
 
     # Validate sheet_tab_name
-    if not data.sheet_tab_name or not data.sheet_tab_name.strip():
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "INVALID_SHEET_NAME",
-                "message": "Sheet tab name cannot be empty"
-            }
-        )
+    if not data.sheet_tab_name or data.sheet_tab_name.isspace():
+        return StaticJSONResponse(_INVALID_SHEET_NAME_BODY, status_code=400)
 
     # Create and save user preference
     user_session_id = session.get('user_id', 'default_user')
@@ -204,16 +220,19 @@ async def check_auth_status(request: Request):
     Returns:
         JSON response with authentication status
     """
-    session = request.session if hasattr(request, 'session') else {}
+    session = request.session
 
     authenticated = bool(session.get('oauth_token'))
+    token_expiry_str = session.get('token_expiry')
+
+    if not authenticated and token_expiry_str is None:
+        return StaticJSONResponse(_STATUS_UNAUTHENTICATED_BODY)
+
     user_session_id = session.get('user_id', 'default_user')
 
     user_pref = UserPreference.load_by_session_id(user_session_id) if authenticated else None
     spreadsheet_configured = user_pref is not None
 
-    token_expiry_str = session.get('token_expiry')
-
     return {
         "authenticated": authenticated,
         "spreadsheet_configured": spreadsheet_configured,
@@ -238,7 +257,7 @@ async def disconnect_spreadsheet(request: Request):
     Returns:
         JSON response with success message
     """
-    session = request.session if hasattr(request, 'session') else {}
+    session = request.session
     user_session_id = session.get('user_id', 'default_user')
 
     # Delete user preferences file
@@ -248,9 +267,8 @@ async def disconnect_spreadsheet(request: Request):
         logger.info(f"Deleted preferences for user {user_session_id}")
 
     # Clear session
-    if hasattr(request, 'session'):
-        request.session.clear()
-        logger.info(f"Cleared session for user {user_session_id}")
+    session.clear()
+    logger.info(f"Cleared session for user {user_session_id}")
 
     return {
         "success": True,
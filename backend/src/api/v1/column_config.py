@@ -2,9 +2,10 @@
 Column configuration endpoints for managing column mappings.
 """
 from fastapi import APIRouter, HTTPException, Request, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Tuple
+from backend.src.api.responses import ORJSONResponse, StaticJSONResponse, encode_json
 from backend.src.models.user_preference import UserPreference
 from backend.src.models.column_mapping import ColumnMappingConfiguration
 from backend.src.services.column_validator import ColumnValidator
@@ -14,6 +15,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Error response bodies are fixed, so serialize them once at import
+_AUTH_REQUIRED_BODY = encode_json({
+    "error_code": "AUTH_REQUIRED",
+    "message": "Authentication required. Please log in."
+})
+
+_CONFIGURATION_REQUIRED_BODY = encode_json({
+    "error_code": "AUTH_REQUIRED",
+    "message": "Google Sheets configuration required."
+})
+
+_COLUMN_MAPPINGS_NOT_CONFIGURED_BODY = encode_json({
+    "error_code": "COLUMN_MAPPINGS_NOT_CONFIGURED",
+    "message": "Column mappings have not been configured yet."
+})
+
+_MISSING_DATE_COLUMN_BODY = encode_json({
+    "error_code": "MISSING_REQUIRED_FIELD",
+    "field": "date_column",
+    "message": "date_column is required"
+})
+
+_MISSING_DESCRIPTION_COLUMN_BODY = encode_json({
+    "error_code": "MISSING_REQUIRED_FIELD",
+    "field": "description_column",
+    "message": "description_column is required"
+})
+
+_MISSING_PRICE_COLUMN_BODY = encode_json({
+    "error_code": "MISSING_REQUIRED_FIELD",
+    "field": "price_column",
+    "message": "price_column is required"
+})
+
+_MISSING_COLUMN_FIELD_BODY = encode_json({
+    "error_code": "MISSING_COLUMN_FIELD",
+    "message": "column field is required"
+})
+
 
 class ColumnMappingsRequest(BaseModel):
     """Request model for saving column mappings."""
@@ -27,33 +67,26 @@ class ValidateColumnRequest(BaseModel):
     column: Optional[str] = None
 
 
-@router.get("/api/v1/column-config")
-async def get_column_mappings(
+def _resolve_user_pref(
     request: Request,
-    session_id: Optional[str] = Header(None, alias="session_id")
-):
+    session_id: Optional[str]
+) -> Tuple[Optional[UserPreference], Optional[Response]]:
     """
-    Get configured column mappings for the authenticated user.
+    Authenticate the caller and load their preference in one step.
 
     Supports two authentication methods:
-    1. Browser session cookies (for web UI)
-    2. session_id header (for testing/API clients)
+    1. session_id header (for testing/API clients)
+    2. Browser session cookies (for web UI)
 
     Args:
         request: FastAPI request object (for session access)
         session_id: Optional session ID from header
 
     Returns:
-        JSON with date_column, description_column, price_column
-
-    Raises:
-        HTTPException 401: If user not authenticated
-        HTTPException 404: If column mappings are not configured
+        Tuple of (user_pref, error_response)
+        - (UserPreference, None) if authenticated and configured
+        - (None, Response) with a 401 error otherwise
     """
-    # Check authentication - support both session cookies and header
-    oauth_token = None
-    user_session_id = None
-
     # Method 1: Try session_id header (for tests/API)
     if session_id:
         user_session_id = session_id
@@ -61,43 +94,51 @@ async def get_column_mappings(
         oauth_token = "header-auth"
     else:
         # Method 2: Try session cookies (for browser)
-        try:
-            session = request.session
-        except AttributeError:
-            session = {}
-
+        session = request.session
         oauth_token = session.get('oauth_token')
         user_session_id = session.get('user_id', 'default_user')
 
     if not oauth_token:
-        return JSONResponse(
-            status_code=401,
-            content={
-                "error_code": "AUTH_REQUIRED",
-                "message": "Authentication required. Please log in."
-            }
-        )
+        return None, StaticJSONResponse(_AUTH_REQUIRED_BODY, status_code=401)
 
     # Load user preference
     user_pref = UserPreference.load_by_session_id(user_session_id)
     if not user_pref:
-        return JSONResponse(
-            status_code=401,
-            content={
-                "error_code": "AUTH_REQUIRED",
-                "message": "Google Sheets configuration required."
-            }
-        )
+        return None, StaticJSONResponse(_CONFIGURATION_REQUIRED_BODY, status_code=401)
+
+    return user_pref, None
+
+
+@router.get("/api/v1/column-config")
+async def get_column_mappings(
+    request: Request,
+    session_id: Optional[str] = Header(None, alias="session_id")
+):
+    """
+    Get configured column mappings for the authenticated user.
+
+    Supports two authentication methods:
+    1. Browser session cookies (for web UI)
+    2. session_id header (for testing/API clients)
+
+    Args:
+        request: FastAPI request object (for session access)
+        session_id: Optional session ID from header
+
+    Returns:
+        JSON with date_column, description_column, price_column
+
+    Raises:
+        HTTPException 401: If user not authenticated
+        HTTPException 404: If column mappings are not configured
+    """
+    user_pref, error_response = _resolve_user_pref(request, session_id)
+    if error_response:
+        return error_response
 
     # Check if column mappings are configured
     if not user_pref.has_column_mappings():
-        return JSONResponse(
-            status_code=404,
-            content={
-                "error_code": "COLUMN_MAPPINGS_NOT_CONFIGURED",
-                "message": "Column mappings have not been configured yet."
-            }
-        )
+        return StaticJSONResponse(_COLUMN_MAPPINGS_NOT_CONFIGURED_BODY, status_code=404)
 
     # Return configured mappings
     mappings = user_pref.get_column_mappings()
@@ -133,75 +174,19 @@ async def save_column_mappings(
         HTTPException 401: If user not authenticated
         HTTPException 400: If validation fails
     """
-    # Check authentication - support both session cookies and header
-    oauth_token = None
-    user_session_id = None
-
-    # Method 1: Try session_id header (for tests/API)
-    if session_id:
-        user_session_id = session_id
-        # Assume header-based auth is valid (tests handle their own mocking)
-        oauth_token = "header-auth"
-    else:
-        # Method 2: Try session cookies (for browser)
-        try:
-            session = request.session
-        except AttributeError:
-            session = {}
-
-        oauth_token = session.get('oauth_token')
-        user_session_id = session.get('user_id', 'default_user')
-
-    if not oauth_token:
-        return JSONResponse(
-            status_code=401,
-            content={
-                "error_code": "AUTH_REQUIRED",
-                "message": "Authentication required. Please log in."
-            }
-        )
-
-    # Load user preference
-    user_pref = UserPreference.load_by_session_id(user_session_id)
-    if not user_pref:
-        return JSONResponse(
-            status_code=401,
-            content={
-                "error_code": "AUTH_REQUIRED",
-                "message": "Google Sheets configuration required."
-            }
-        )
+    user_pref, error_response = _resolve_user_pref(request, session_id)
+    if error_response:
+        return error_response
 
     # Check for missing fields
-    if not data.date_column or not data.date_column.strip():
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error_code": "MISSING_REQUIRED_FIELD",
-                "field": "date_column",
-                "message": "date_column is required"
-            }
-        )
+    if not data.date_column or data.date_column.isspace():
+        return StaticJSONResponse(_MISSING_DATE_COLUMN_BODY, status_code=400)
 
-    if not data.description_column or not data.description_column.strip():
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error_code": "MISSING_REQUIRED_FIELD",
-                "field": "description_column",
-                "message": "description_column is required"
-            }
-        )
+    if not data.description_column or data.description_column.isspace():
+        return StaticJSONResponse(_MISSING_DESCRIPTION_COLUMN_BODY, status_code=400)
 
-    if not data.price_column or not data.price_column.strip():
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error_code": "MISSING_REQUIRED_FIELD",
-                "field": "price_column",
-                "message": "price_column is required"
-            }
-        )
+    if not data.price_column or data.price_column.isspace():
+        return StaticJSONResponse(_MISSING_PRICE_COLUMN_BODY, status_code=400)
 
     # Create configuration
     config = ColumnMappingConfiguration(
@@ -211,30 +196,14 @@ async def save_column_mappings(
     )
 
     # Validate configuration
-    is_valid, error = config.validate()
-    if not is_valid:
-        # Determine which field caused the error
-        field_name = None
-        error_code = None
-
-        if "date_column" in error:
-            field_name = "date_column"
-            error_code = error.split(": ")[1] if ": " in error else error
-        elif "description_column" in error:
-            field_name = "description_column"
-            error_code = error.split(": ")[1] if ": " in error else error
-        elif "price_column" in error:
-            field_name = "price_column"
-            error_code = error.split(": ")[1] if ": " in error else error
-        else:
-            error_code = error
-
-        return JSONResponse(
+    error = config.get_validation_error()
+    if error is not None:
+        return ORJSONResponse(
             status_code=400,
             content={
-                "error_code": error_code,
-                "field": field_name,
-                "message": error
+                "error_code": error.error_code,
+                "field": error.field,
+                "message": error.message
             }
         )
 
@@ -242,7 +211,9 @@ async def save_column_mappings(
     user_pref.set_column_mappings(config)
     user_pref.save()
 
-    logger.info(f"Column mappings saved for session {user_session_id}: {config.to_dict()}")
+    logger.info(
+        f"Column mappings saved for session {user_pref.user_session_id}: {config.to_dict()}"
+    )
 
     return {
         "success": True,
@@ -271,13 +242,7 @@ async def validate_column(data: ValidateColumnRequest):
     """
     # Check if column field is provided
     if data.column is None:
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error_code": "MISSING_COLUMN_FIELD",
-                "message": "column field is required"
-            }
-        )
+        return StaticJSONResponse(_MISSING_COLUMN_FIELD_BODY, status_code=400)
 
     column_ref = data.column
 
@@ -293,15 +258,20 @@ async def validate_column(data: ValidateColumnRequest):
             "index": index
         }
     else:
-        # Return failure with error code and message
-        error_messages = {
-            "INVALID_COLUMN_FORMAT": f"Column '{column_ref}' has invalid format. Must be A-ZZ (uppercase letters only).",
-            "COLUMN_OUT_OF_RANGE": f"Column '{column_ref}' is out of range. Valid range is A-ZZ."
-        }
+        # Return failure with error code and message (only the matching message is formatted)
+        if error_code == "INVALID_COLUMN_FORMAT":
+            message = (
+                f"Column '{column_ref}' has invalid format. "
+                "Must be A-ZZ (uppercase letters only)."
+            )
+        elif error_code == "COLUMN_OUT_OF_RANGE":
+            message = f"Column '{column_ref}' is out of range. Valid range is A-ZZ."
+        else:
+            message = f"Invalid column: {error_code}"
 
         return {
             "valid": False,
             "column": column_ref,
             "error_code": error_code,
-            "message": error_messages.get(error_code, f"Invalid column: {error_code}")
+            "message": message
         }
@@ -1,21 +1,55 @@
 """
 Save endpoint for confirmed receipt data to Google Sheets.
 """
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
+from backend.src.api.responses import ORJSONResponse, StaticJSONResponse, encode_json
 from backend.src.models.google_sheets_row import GoogleSheetsRow
 from backend.src.models.user_preference import UserPreference
-from backend.src.services.sheets_service import SheetsService
+from backend.src.services.sheets_batcher import SheetsAppendBatcher
 from backend.src.storage.temp_storage import TempStorageService
 from dateutil import parser as date_parser
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 storage_service = TempStorageService()
+sheets_batcher = SheetsAppendBatcher()
+
+# Error response bodies are fixed, so serialize them once at import
+_MISSING_REQUIRED_FIELDS_BODY = encode_json({
+    "error_code": "MISSING_REQUIRED_FIELDS",
+    "message": "All fields (transaction_date, items, total_amount) are required"
+})
+
+_INVALID_DATE_BODY = encode_json({
+    "error_code": "INVALID_DATE",
+    "message": "Transaction date must be a valid date"
+})
+
+_INVALID_AMOUNT_BODY = encode_json({
+    "error_code": "INVALID_AMOUNT",
+    "message": "Total amount must be a positive number"
+})
+
+_NOT_AUTHENTICATED_BODY = encode_json({
+    "error_code": "NOT_AUTHENTICATED",
+    "message": "Google Sheets authentication required"
+})
+
+_NOT_CONFIGURED_BODY = encode_json({
+    "error_code": "NOT_AUTHENTICATED",
+    "message": "Google Sheets configuration required"
+})
+
+_COLUMN_MAPPINGS_REQUIRED_BODY = encode_json({
+    "error_code": "COLUMN_MAPPINGS_REQUIRED",
+    "message": "Please configure column mappings before processing receipts"
+})
 
 
 class SaveRequest(BaseModel):
@@ -23,7 +57,7 @@ class SaveRequest(BaseModel):
     receipt_id: str
     transaction_date: str
     items: str
-    total_amount: float
+    total_amount: Decimal
 
 
 @router.post("/api/v1/save")
@@ -36,89 +70,48 @@ async def save_receipt(request: Request, data: SaveRequest):
         data: SaveRequest with receipt data
 
     Returns:
-        JSON response with success, spreadsheet_url, and row_number
-
-    Raises:
-        HTTPException: For validation or save errors
+        JSON response with success, spreadsheet_url, and row_number,
+        or an error response with error_code and message
     """
     # Validate all fields present
     if not all([data.receipt_id, data.transaction_date, data.items, data.total_amount is not None]):
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "MISSING_REQUIRED_FIELDS",
-                "message": "All fields (transaction_date, items, total_amount) are required"
-            }
-        )
+        return StaticJSONResponse(_MISSING_REQUIRED_FIELDS_BODY, status_code=400)
 
     # Validate and parse transaction_date
+    # Fast path: the review form sends ISO 8601 (YYYY-MM-DD)
     try:
-        parsed_date = date_parser.parse(data.transaction_date).date()
-    except (ValueError, date_parser.ParserError):
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "INVALID_DATE",
-                "message": "Transaction date must be a valid date"
-            }
-        )
-
-    # Validate total_amount
-    try:
-        amount = Decimal(str(data.total_amount))
-        if amount < 0:
-            raise ValueError("Negative amount")
-    except (ValueError, ArithmeticError):
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "INVALID_AMOUNT",
-                "message": "Total amount must be a positive number"
-            }
-        )
+        parsed_date = date.fromisoformat(data.transaction_date)
+    except ValueError:
+        # Fall back to dateutil for other formats
+        try:
+            parsed_date = date_parser.parse(data.transaction_date).date()
+        except (ValueError, OverflowError, date_parser.ParserError):
+            return StaticJSONResponse(_INVALID_DATE_BODY, status_code=400)
+
+    # Validate total_amount (already parsed to Decimal by Pydantic)
+    amount = data.total_amount
+    if amount < 0:
+        return StaticJSONResponse(_INVALID_AMOUNT_BODY, status_code=400)
 
     # Check authentication (session-based)
     # TODO: Implement proper session management
-    session = request.session if hasattr(request, 'session') else {}
+    session = request.session
     oauth_token = session.get('oauth_token')
-    token_expiry_str = session.get('token_expiry')
+    # Stored as a Unix timestamp at login; a missing value counts as expired
+    token_expiry = session.get('token_expiry_ts', 0.0)
     user_session_id = session.get('user_id', 'default_user')
 
     if not oauth_token:
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error_code": "NOT_AUTHENTICATED",
-                "message": "Google Sheets authentication required"
-            }
-        )
-
-    # Parse token expiry
-    try:
-        token_expiry = datetime.fromisoformat(token_expiry_str) if token_expiry_str else datetime.utcnow()
-    except ValueError:
-        token_expiry = datetime.utcnow()
+        return StaticJSONResponse(_NOT_AUTHENTICATED_BODY, status_code=401)
 
     # Load user preferences
     user_pref = UserPreference.load_by_session_id(user_session_id)
     if not user_pref:
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error_code": "NOT_AUTHENTICATED",
-                "message": "Google Sheets configuration required"
-            }
-        )
+        return StaticJSONResponse(_NOT_CONFIGURED_BODY, status_code=401)
 
     # Check if column mappings are configured
     if not user_pref.has_column_mappings():
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": "COLUMN_MAPPINGS_REQUIRED",
-                "message": "Please configure column mappings before processing receipts"
-            }
-        )
+        return StaticJSONResponse(_COLUMN_MAPPINGS_REQUIRED_BODY, status_code=400)
 
     # Construct GoogleSheetsRow
     sheets_row = GoogleSheetsRow.from_extracted_data(
@@ -127,8 +120,9 @@ async def save_receipt(request: Request, data: SaveRequest):
         total_amount=amount
     )
 
-    # Append to Google Sheets
-    success, response = SheetsService.append_row(
+    # Append to Google Sheets (coalesced with other saves to the same sheet,
+    # network call runs off the event loop)
+    success, response = await sheets_batcher.submit(
         row_data=sheets_row,
         user_pref=user_pref,
         oauth_token=oauth_token,
@@ -150,17 +144,13 @@ async def save_receipt(request: Request, data: SaveRequest):
         else:
             status_code = 500
 
-        raise HTTPException(status_code=status_code, detail=response)
+        return ORJSONResponse(status_code=status_code, content=response)
 
     # Delete receipt file after successful save
-    # Construct file path from receipt_id (simplified - in production use proper tracking)
+    # Files are stored under a path derived from receipt_id, so no directory scan is needed
     try:
-        from pathlib import Path
-        upload_dir = Path("shared/uploads")
-        # Find file with receipt_id in name
-        for file_path in upload_dir.glob(f"{data.receipt_id}*"):
-            storage_service.delete_file(str(file_path))
-            logger.info(f"Deleted receipt file after save: {file_path}")
+        if await asyncio.to_thread(storage_service.delete_receipt_file, data.receipt_id):
+            logger.info(f"Deleted receipt file after save: {data.receipt_id}")
     except Exception as e:
         logger.warning(f"Failed to delete receipt file: {e}")
 
@@ -1,19 +1,47 @@
 """
 Upload endpoint for receipt image processing.
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File
+from backend.src.api.file_validation import FileValidationRoute
+from backend.src.api.responses import StaticJSONResponse, encode_json
 from backend.src.models.receipt import Receipt
 from backend.src.models.extracted_data import ExtractedData
 from backend.src.services.ocr_service import OCRService
 from backend.src.services.parser_service import ParserService
 from backend.src.storage.temp_storage import TempStorageService
+from typing import BinaryIO
+import asyncio
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Upload size/type checks run only for this router's routes
+router = APIRouter(route_class=FileValidationRoute)
 storage_service = TempStorageService()
 
+# Error response bodies are fixed, so serialize them once at import
+_VALIDATION_ERROR_BODIES = {
+    error_code: encode_json({"error_code": error_code, "message": message})
+    for error_code, message in {
+        "FILE_TOO_LARGE": "File size exceeds 5MB limit",
+        "INVALID_FORMAT": "Only JPG and PNG formats are supported",
+        "MISSING_FILE": "No file provided in request"
+    }.items()
+}
+
+_OCR_FAILED_BODY = encode_json({
+    "error_code": "OCR_FAILED",
+    "message": "Unable to process image"
+})
+
+
+def _measure_file(src: BinaryIO) -> int:
+    """Return the size of a seekable file object, leaving it at the start."""
+    size = src.seek(0, os.SEEK_END)
+    src.seek(0)
+    return size
+
 
 @router.post("/api/v1/upload")
 async def upload_receipt(file: UploadFile = File(...)):
@@ -24,18 +52,19 @@ async def upload_receipt(file: UploadFile = File(...)):
         file: Uploaded receipt image (JPG/PNG, max 5MB)
 
     Returns:
-        JSON response with receipt_id, status, extracted_data, and processing_time_ms
-
-    Raises:
-        HTTPException: For validation or processing errors
+        JSON response with receipt_id, status, extracted_data, and processing_time_ms,
+        or a 400/500 error response with error_code and message
     """
-    # Read file content
-    file_content = await file.read()
+    # The form parser has already spooled the upload; measure it instead of
+    # reading the whole file into memory
+    file_size = file.size
+    if file_size is None:
+        file_size = await asyncio.to_thread(_measure_file, file.file)
 
     # Create Receipt instance for validation
     receipt = Receipt.create(
         filename=file.filename or "unknown.jpg",
-        file_size=len(file_content),
+        file_size=file_size,
         file_type=file.content_type or "application/octet-stream",
         file_path=""  # Will be set after save
     )
@@ -45,33 +74,31 @@ async def upload_receipt(file: UploadFile = File(...)):
     if not is_valid:
         logger.warning(f"Upload validation failed: {error_code}")
 
-        error_messages = {
-            "FILE_TOO_LARGE": "File size exceeds 5MB limit",
-            "INVALID_FORMAT": "Only JPG and PNG formats are supported",
-            "MISSING_FILE": "No file provided in request"
-        }
-
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error_code": error_code,
-                "message": error_messages.get(error_code, "Invalid file")
-            }
-        )
+        body = _VALIDATION_ERROR_BODIES.get(error_code) or encode_json({
+            "error_code": error_code,
+            "message": "Invalid file"
+        })
+        return StaticJSONResponse(body, status_code=400)
 
     try:
         # Save file to temporary storage
-        file_path = storage_service.save_file(file_content, receipt.filename)
+        # Blocking disk/CPU work runs in worker threads to keep the event loop responsive
+        await file.seek(0)
+        file_path = await asyncio.to_thread(
+            storage_service.save_receipt_stream, file.file, receipt.id, receipt.file_type
+        )
         receipt.file_path = file_path
 
         # Mark as processing
         receipt.mark_processing()
 
         # Process with OCR
-        raw_ocr_text, processing_time_ms = OCRService.process_image(file_path)
+        raw_ocr_text, processing_time_ms = await asyncio.to_thread(
+            OCRService.process_image, file_path
+        )
 
         # Parse extracted data
-        parsed_data = ParserService.parse_receipt_data(raw_ocr_text)
+        parsed_data = await asyncio.to_thread(ParserService.parse_receipt_data, raw_ocr_text)
 
         # Create ExtractedData instance
         extracted_data = ExtractedData.create(
@@ -100,10 +127,4 @@ async def upload_receipt(file: UploadFile = File(...)):
         receipt.mark_failed()
         logger.error(f"OCR processing failed: {str(e)}")
 
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "OCR_FAILED",
-                "message": "Unable to process image"
-            }
-        )
+        return StaticJSONResponse(_OCR_FAILED_BODY, status_code=500)
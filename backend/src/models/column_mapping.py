@@ -1,12 +1,69 @@
 """
 ColumnMappingConfiguration model for user's column mapping preferences.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List
 from backend.src.services.column_validator import ColumnValidator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ColumnMappingValidationError:
+    """
+    Describes why a column mapping configuration is invalid.
+
+    Attributes:
+        field: Name of the offending field (e.g. "date_column")
+        error_code: Machine-readable code (e.g. "INVALID_COLUMN_FORMAT")
+        message: Human-readable description
+    """
+
+    field: str
+    error_code: str
+    message: str
+
+
+@lru_cache(maxsize=1024)
+def _get_validation_error(
+    date_column: str,
+    description_column: str,
+    price_column: str
+) -> Optional[ColumnMappingValidationError]:
+    """Cached implementation of ColumnMappingConfiguration.get_validation_error()."""
+    fields = (
+        ("date_column", date_column),
+        ("description_column", description_column),
+        ("price_column", price_column),
+    )
+
+    # Single pass: a missing field anywhere takes precedence over a format
+    # error, so remember the first format error and keep scanning
+    invalid_field = None
+    invalid_error = None
+    for field_name, column in fields:
+        if not column or column.isspace():
+            return ColumnMappingValidationError(
+                field=field_name,
+                error_code="MISSING_REQUIRED_FIELD",
+                message=f"{field_name} is required"
+            )
+
+        if invalid_field is None:
+            is_valid, error = ColumnValidator.validate(column)
+            if not is_valid:
+                invalid_field, invalid_error = field_name, error
+
+    if invalid_field is not None:
+        return ColumnMappingValidationError(
+            field=invalid_field,
+            error_code=invalid_error,
+            message=f"{invalid_field}: {invalid_error}"
+        )
+
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnMappingConfiguration:
     """
     Represents user's column mapping preferences for receipt data fields.
@@ -21,6 +78,15 @@ class ColumnMappingConfiguration:
     description_column: str
     price_column: str
 
+    # to_dict() result, built on first use (the instance is frozen)
+    _cached_dict: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # get_column_indices() result, built on first use
+    _cached_indices: Optional[Tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def validate(self) -> Tuple[bool, Optional[str]]:
         """
         Validate all column references.
@@ -35,32 +101,25 @@ class ColumnMappingConfiguration:
             2. Each field must pass ColumnValidator.validate()
             3. Returns first validation error encountered
         """
-        # Check all fields are non-empty
-        if not self.date_column or not self.date_column.strip():
-            return False, "date_column is required"
-
-        if not self.description_column or not self.description_column.strip():
-            return False, "description_column is required"
-
-        if not self.price_column or not self.price_column.strip():
-            return False, "price_column is required"
+        error = self.get_validation_error()
+        if error is not None:
+            return False, error.message
 
-        # Validate date_column
-        is_valid, error = ColumnValidator.validate(self.date_column)
-        if not is_valid:
-            return False, f"date_column: {error}"
+        return True, None
 
-        # Validate description_column
-        is_valid, error = ColumnValidator.validate(self.description_column)
-        if not is_valid:
-            return False, f"description_column: {error}"
+    def get_validation_error(self) -> Optional["ColumnMappingValidationError"]:
+        """
+        Validate all column references and describe the first failure.
 
-        # Validate price_column
-        is_valid, error = ColumnValidator.validate(self.price_column)
-        if not is_valid:
-            return False, f"price_column: {error}"
+        Applies the same rules as validate(), but reports which field failed
+        and the machine-readable error code separately. Results are memoized
+        per (date, description, price) triple - a saved mapping is validated
+        on every request that uses it, and the returned error is immutable.
 
-        return True, None
+        Returns:
+            ColumnMappingValidationError for the first invalid field, or None if valid
+        """
+        return _get_validation_error(self.date_column, self.description_column, self.price_column)
 
     def to_dict(self) -> Dict[str, str]:
         """
@@ -69,12 +128,17 @@ class ColumnMappingConfiguration:
         Returns:
             Dictionary with keys: date, description, price
             Example: {"date": "A", "description": "B", "price": "C"}
+            The same dict is returned on every call - callers must not mutate it
         """
-        return {
-            "date": self.date_column,
-            "description": self.description_column,
-            "price": self.price_column
-        }
+        cached = self._cached_dict
+        if cached is None:
+            cached = {
+                "date": self.date_column,
+                "description": self.description_column,
+                "price": self.price_column
+            }
+            object.__setattr__(self, "_cached_dict", cached)
+        return cached
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "ColumnMappingConfiguration":
@@ -105,6 +169,27 @@ class ColumnMappingConfiguration:
         """
         return ColumnValidator.to_index(column_ref)
 
+    def get_column_indices(self) -> Tuple[int, int, int]:
+        """
+        Get the zero-based indices of all three mapped columns.
+
+        Computed on first call and reused afterwards, so appending many rows
+        with the same configuration converts each column only once. Only
+        call this on a configuration that passes validate().
+
+        Returns:
+            Tuple of (date_index, description_index, price_index)
+        """
+        cached = self._cached_indices
+        if cached is None:
+            cached = (
+                ColumnValidator.to_index(self.date_column),
+                ColumnValidator.to_index(self.description_column),
+                ColumnValidator.to_index(self.price_column),
+            )
+            object.__setattr__(self, "_cached_indices", cached)
+        return cached
+
     def has_duplicates(self) -> bool:
         """
         Check if any columns are assigned to multiple fields.
@@ -112,8 +197,8 @@ class ColumnMappingConfiguration:
         Returns:
             True if duplicates exist, False otherwise
         """
-        columns = [self.date_column, self.description_column, self.price_column]
-        return len(columns) != len(set(columns))
+        date, description, price = self.date_column, self.description_column, self.price_column
+        return date == description or date == price or description == price
 
     def get_duplicate_columns(self) -> Dict[str, List[str]]:
         """
@@ -124,25 +209,16 @@ class ColumnMappingConfiguration:
             Example: {"A": ["date", "price"]} if both date and price map to column A
             Returns empty dict if no duplicates
         """
-        column_to_fields = {}
-
-        # Map each column to its field name(s)
-        fields = [
-            (self.date_column, "date"),
-            (self.description_column, "description"),
-            (self.price_column, "price")
-        ]
-
-        for column, field in fields:
-            if column not in column_to_fields:
-                column_to_fields[column] = []
-            column_to_fields[column].append(field)
-
-        # Filter to only columns with multiple fields (duplicates)
-        duplicates = {
-            column: field_list
-            for column, field_list in column_to_fields.items()
-            if len(field_list) > 1
-        }
-
-        return duplicates
+        date, description, price = self.date_column, self.description_column, self.price_column
+
+        # With three fields there are only four ways columns can collide
+        if date == description:
+            if date == price:
+                return {date: ["date", "description", "price"]}
+            return {date: ["date", "description"]}
+        if date == price:
+            return {date: ["date", "price"]}
+        if description == price:
+            return {description: ["description", "price"]}
+
+        return {}
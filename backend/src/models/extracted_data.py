@@ -5,10 +5,13 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
-import uuid
+from backend.src.models.ids import new_id
 
+# Bound once so default factories skip the attribute lookup per instance
+_utcnow = datetime.utcnow
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExtractedData:
     """
     Represents OCR-parsed data from a receipt.
@@ -26,7 +29,7 @@ class ExtractedData:
         extraction_timestamp: When OCR completed
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     receipt_id: str = ""
     transaction_date: Optional[date] = None
     transaction_date_confidence: float = 0.0
@@ -35,7 +38,7 @@ class ExtractedData:
     total_amount: Optional[Decimal] = None
     total_amount_confidence: float = 0.0
     raw_ocr_text: str = ""
-    extraction_timestamp: datetime = field(default_factory=datetime.utcnow)
+    extraction_timestamp: datetime = field(default_factory=_utcnow)
 
     # Constants
     MAX_ITEMS_LENGTH = 500
@@ -48,16 +51,19 @@ class ExtractedData:
             Tuple of (is_valid, error_message)
         """
         # Confidence scores must be in valid range
-        for conf in [self.transaction_date_confidence, self.items_confidence, self.total_amount_confidence]:
-            if not (0.0 <= conf <= 1.0):
-                return False, "Invalid confidence score"
+        if not (
+            0.0 <= self.transaction_date_confidence <= 1.0
+            and 0.0 <= self.items_confidence <= 1.0
+            and 0.0 <= self.total_amount_confidence <= 1.0
+        ):
+            return False, "Invalid confidence score"
 
         # Total amount must be non-negative
         if self.total_amount is not None and self.total_amount < 0:
             return False, "Total amount must be positive or zero"
 
         # Items must be non-empty if present
-        if self.items is not None and not self.items.strip():
+        if self.items is not None and (not self.items or self.items.isspace()):
             return False, "Items cannot be empty string"
 
         # Items length limit
@@ -65,7 +71,7 @@ class ExtractedData:
             return False, f"Items exceed {self.MAX_ITEMS_LENGTH} character limit"
 
         # At least one field must be non-null
-        if all(v is None for v in [self.transaction_date, self.items, self.total_amount]):
+        if self.transaction_date is None and self.items is None and self.total_amount is None:
             return False, "At least one field must be extracted"
 
         return True, None
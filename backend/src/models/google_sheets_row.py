@@ -7,8 +7,11 @@ from decimal import Decimal
 from typing import List, Optional
 from backend.src.models.extracted_data import ExtractedData
 
+# Bound once to skip the attribute lookup per row
+_utcnow = datetime.utcnow
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GoogleSheetsRow:
     """
     Represents the data structure appended to Google Sheets.
@@ -35,7 +38,7 @@ class GoogleSheetsRow:
         if self.transaction_date is None:
             return False, "Transaction date is required"
 
-        if not self.items or not self.items.strip():
+        if not self.items or self.items.isspace():
             return False, "Items are required"
 
         if self.total_amount is None:
@@ -53,8 +56,9 @@ class GoogleSheetsRow:
         Returns:
             List of values matching Google Sheets column order
         """
+        # date.isoformat() yields YYYY-MM-DD without the strftime format parser
         return [
-            self.transaction_date.strftime("%Y-%m-%d"),
+            self.transaction_date.isoformat(),
             self.items,
             float(self.total_amount),
             self.uploaded_at.isoformat()
@@ -82,5 +86,5 @@ class GoogleSheetsRow:
             transaction_date=transaction_date,
             items=items,
             total_amount=total_amount,
-            uploaded_at=datetime.utcnow()
+            uploaded_at=_utcnow()
         )
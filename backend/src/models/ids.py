@@ -0,0 +1,21 @@
+"""
+Identifier generation for model default IDs.
+"""
+import os
+
+
+def new_id() -> str:
+    """
+    Generate a random RFC 4122 version 4 UUID string.
+
+    Produces the same canonical form as str(uuid.uuid4()) from 16 bytes of
+    os.urandom(), without constructing a UUID object.
+
+    Returns:
+        Hyphenated lowercase UUID string (e.g. "1b4e28ba-2fa1-41d2-883f-0016d3cca427")
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -3,19 +3,42 @@ Receipt data model representing uploaded receipt image file.
 """
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
-from pathlib import Path
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional
-import uuid
 import re
+import sys
+from backend.src.models.ids import new_id
 
 
-class ProcessingStatus(Enum):
+# Path traversal sequences stripped from uploaded filenames
+_TRAVERSAL_PATTERN = re.compile(r'\.\.[\\/]')
+
+# Maps both path separators to '_' in a single translate() pass
+_SEPARATOR_TABLE = str.maketrans('/\\', '__')
+
+# Bound once so default factories skip the attribute lookup per instance
+_utcnow = datetime.utcnow
+
+# Receipts are deleted this long after upload
+_DELETION_DELTA = timedelta(hours=24)
+
+
+class ProcessingStatus(IntEnum):
     """Receipt processing status states."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    PENDING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    FAILED = 3
+
+    @property
+    def label(self) -> str:
+        """Serialized status name (e.g. "pending"), indexed by value."""
+        return _STATUS_LABELS[self]
+
+
+# Serialized names for ProcessingStatus, in value order
+_STATUS_LABELS = ("pending", "processing", "completed", "failed")
 
 
 @dataclass
@@ -34,18 +57,18 @@ class Receipt:
         processing_status: Current processing state
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     filename: str = ""
     file_path: str = ""
     file_size: int = 0
     file_type: str = ""
-    upload_timestamp: datetime = field(default_factory=datetime.utcnow)
-    deletion_scheduled_at: datetime = field(default_factory=lambda: datetime.utcnow() + timedelta(hours=24))
+    upload_timestamp: datetime = field(default_factory=_utcnow)
+    deletion_scheduled_at: datetime = field(default_factory=lambda: _utcnow() + _DELETION_DELTA)
     processing_status: ProcessingStatus = ProcessingStatus.PENDING
 
     # Constants
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB in bytes
-    ALLOWED_TYPES = {"image/jpeg", "image/png"}
+    ALLOWED_TYPES = frozenset({sys.intern("image/jpeg"), sys.intern("image/png")})
 
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -58,19 +81,7 @@ class Receipt:
         Returns:
             Sanitized filename safe for storage
         """
-        # Remove path traversal sequences
-        filename = re.sub(r'\.\.[\\/]', '', filename)
-        filename = filename.replace('/', '_').replace('\\', '_')
-
-        # Keep only basename
-        filename = Path(filename).name
-
-        # Limit length
-        if len(filename) > 255:
-            name, ext = Path(filename).stem, Path(filename).suffix
-            filename = name[:250] + ext
-
-        return filename
+        return _sanitize_filename(filename)
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """
@@ -121,6 +132,40 @@ class Receipt:
         return cls(
             filename=sanitized_filename,
             file_size=file_size,
-            file_type=file_type,
+            # Interned so ALLOWED_TYPES lookups hit the identity fast path
+            file_type=sys.intern(file_type),
             file_path=file_path
         )
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_filename(filename: str) -> str:
+    """
+    Cached implementation of Receipt.sanitize_filename.
+
+    Args:
+        filename: Original filename from upload
+
+    Returns:
+        Sanitized filename safe for storage
+    """
+    # Remove path traversal sequences
+    filename = _TRAVERSAL_PATTERN.sub('', filename)
+    filename = filename.translate(_SEPARATOR_TABLE)
+
+    # Keep only basename - with no separators left, only "." has none
+    if filename == '.':
+        filename = ''
+
+    # Limit length
+    if len(filename) > 255:
+        # Same split as Path.stem/Path.suffix: a leading or trailing dot is
+        # not an extension
+        dot = filename.rfind('.')
+        if 0 < dot < len(filename) - 1:
+            name, ext = filename[:dot], filename[dot:]
+        else:
+            name, ext = filename, ''
+        filename = name[:250] + ext
+
+    return filename
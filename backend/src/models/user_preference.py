@@ -3,10 +3,112 @@ UserPreference model for Google Sheets configuration.
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict
-import uuid
-import json
+from typing import Optional, Dict, Tuple
+import orjson
+import os
+import re
+import threading
 from pathlib import Path
+from backend.src.models.ids import new_id
+
+
+class _PreferenceStore:
+    """
+    In-process copy of the preferences file.
+
+    The parsed JSON is kept in memory together with the identity of the file
+    it came from (path, mtime_ns, size), so reads only cost an os.stat while
+    the file is unchanged, and edits made outside this process are still
+    picked up. Writes go to a temporary file that replaces the original
+    atomically.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._data: Dict[str, Dict] = {}
+        self._file_key: Optional[Tuple[str, int, int]] = None
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock to hold across a read-modify-write of the preferences."""
+        return self._lock
+
+    def get(self, path: Path) -> Dict[str, Dict]:
+        """
+        Return the parsed preferences stored at path.
+
+        Args:
+            path: Preferences JSON file
+
+        Returns:
+            Mapping of session ID to stored preference data (do not mutate)
+        """
+        if not path.exists():
+            return {}
+
+        with self._lock:
+            file_key = self._stat_key(path, path)
+            if file_key is not None and file_key == self._file_key:
+                return self._data
+
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+
+            self._data = data
+            self._file_key = file_key
+            return data
+
+    def write(self, path: Path, preferences: Dict[str, Dict]) -> None:
+        """
+        Atomically replace the preferences stored at path.
+
+        Args:
+            path: Preferences JSON file
+            preferences: Complete mapping of session ID to preference data
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with self._lock:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(preferences))
+
+            # os.replace() keeps the temp file's mtime, so its stat identifies
+            # the new file contents
+            file_key = self._stat_key(tmp_path, path)
+            os.replace(tmp_path, path)
+
+            self._data = preferences
+            self._file_key = file_key
+
+    def clear(self) -> None:
+        """Forget the cached preferences."""
+        with self._lock:
+            self._data = {}
+            self._file_key = None
+
+    @staticmethod
+    def _stat_key(stat_path: Path, path: Path) -> Optional[Tuple[str, int, int]]:
+        """
+        Identify a version of the preferences file.
+
+        Args:
+            stat_path: File to stat
+            path: Preferences file the key is recorded for
+
+        Returns:
+            Tuple of (path, mtime_ns, size), or None if stat_path cannot be stat'ed
+        """
+        try:
+            stat_result = os.stat(stat_path)
+        except OSError:
+            return None
+        return str(path), stat_result.st_mtime_ns, stat_result.st_size
+
+
+_PREFERENCE_STORE = _PreferenceStore()
+
+# Bound once so default factories skip the attribute lookup per instance
+_utcnow = datetime.utcnow
 
 
 @dataclass
@@ -24,16 +126,17 @@ class UserPreference:
         created_at: Creation timestamp
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     user_session_id: str = ""
     spreadsheet_id: str = ""
     sheet_tab_name: str = ""
     column_mappings: Optional[Dict] = None
-    last_updated_at: datetime = field(default_factory=datetime.utcnow)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    last_updated_at: datetime = field(default_factory=_utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
 
     # Constants
     SPREADSHEET_ID_LENGTH = 44
+    SPREADSHEET_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{44}")
     MAX_SHEET_NAME_LENGTH = 100
     STORAGE_FILE = Path("shared") / "user_preferences.json"
 
@@ -44,10 +147,10 @@ class UserPreference:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if len(self.spreadsheet_id) != self.SPREADSHEET_ID_LENGTH:
+        if not self.SPREADSHEET_ID_PATTERN.fullmatch(self.spreadsheet_id):
             return False, "INVALID_SPREADSHEET_ID"
 
-        if not self.sheet_tab_name or not self.sheet_tab_name.strip():
+        if not self.sheet_tab_name or self.sheet_tab_name.isspace():
             return False, "INVALID_SHEET_NAME"
 
         if len(self.sheet_tab_name) > self.MAX_SHEET_NAME_LENGTH:
@@ -90,18 +193,13 @@ class UserPreference:
         Side Effects:
             Updates last_updated_at timestamp
         """
-        self.column_mappings = config.to_dict()
-        self.last_updated_at = datetime.utcnow()
+        # Copied: to_dict() returns the config's shared dict and this one is mutable
+        self.column_mappings = dict(config.to_dict())
+        self.last_updated_at = _utcnow()
 
     def save(self) -> None:
         """Save preference to persistent storage."""
-        self.last_updated_at = datetime.utcnow()
-
-        # Load existing preferences
-        preferences = {}
-        if self.STORAGE_FILE.exists():
-            with open(self.STORAGE_FILE, 'r') as f:
-                preferences = json.load(f)
+        self.last_updated_at = _utcnow()
 
         # Update with current preference
         pref_data = {
@@ -114,36 +212,38 @@ class UserPreference:
 
         # Include column_mappings if configured
         if self.column_mappings is not None:
-            pref_data["column_mappings"] = self.column_mappings
+            pref_data["column_mappings"] = dict(self.column_mappings)
 
-        preferences[self.user_session_id] = pref_data
+        with _PREFERENCE_STORE.lock:
+            # Load existing preferences
+            preferences = dict(_PREFERENCE_STORE.get(self.STORAGE_FILE))
+            preferences[self.user_session_id] = pref_data
 
-        # Ensure directory exists
-        self.STORAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure directory exists
+            self.STORAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save back
-        with open(self.STORAGE_FILE, 'w') as f:
-            json.dump(preferences, f, indent=2)
+            # Save back
+            _PREFERENCE_STORE.write(self.STORAGE_FILE, preferences)
 
     def delete(self) -> None:
         """Delete this user's preference from persistent storage."""
-        if not self.STORAGE_FILE.exists():
-            return
+        with _PREFERENCE_STORE.lock:
+            preferences = _PREFERENCE_STORE.get(self.STORAGE_FILE)
 
-        # Load existing preferences
-        with open(self.STORAGE_FILE, 'r') as f:
-            preferences = json.load(f)
+            # Nothing stored for this user - leave the file untouched
+            if self.user_session_id not in preferences:
+                return
 
-        # Remove this user's preference
-        if self.user_session_id in preferences:
+            # Remove this user's preference
+            preferences = dict(preferences)
             del preferences[self.user_session_id]
 
-        # Save back (or delete file if empty)
-        if preferences:
-            with open(self.STORAGE_FILE, 'w') as f:
-                json.dump(preferences, f, indent=2)
-        else:
-            self.STORAGE_FILE.unlink()  # Delete file if no preferences remain
+            # Save back (or delete file if empty)
+            if preferences:
+                _PREFERENCE_STORE.write(self.STORAGE_FILE, preferences)
+            else:
+                self.STORAGE_FILE.unlink()  # Delete file if no preferences remain
+                _PREFERENCE_STORE.clear()
 
     @classmethod
     def load_by_session_id(cls, session_id: str) -> Optional["UserPreference"]:
@@ -156,19 +256,18 @@ class UserPreference:
         Returns:
             UserPreference instance or None if not found
         """
-        if not cls.STORAGE_FILE.exists():
-            return None
-
-        with open(cls.STORAGE_FILE, 'r') as f:
-            preferences = json.load(f)
+        preferences = cls._read_store()
 
         if session_id not in preferences:
             return None
 
         data = preferences[session_id]
 
-        # Load column_mappings if present (backward compatibility)
+        # Load column_mappings if present (backward compatibility); copied so
+        # callers can mutate it without touching the stored data
         column_mappings = data.get("column_mappings", None)
+        if column_mappings is not None:
+            column_mappings = dict(column_mappings)
 
         return cls(
             id=data["id"],
@@ -180,6 +279,21 @@ class UserPreference:
             created_at=datetime.fromisoformat(data["created_at"])
         )
 
+    @classmethod
+    def _read_store(cls) -> Dict[str, Dict]:
+        """
+        Read the stored preferences of all users.
+
+        Returns:
+            Mapping of session ID to stored preference data (do not mutate)
+        """
+        return _PREFERENCE_STORE.get(cls.STORAGE_FILE)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the cached preferences (e.g. after swapping STORAGE_FILE)."""
+        _PREFERENCE_STORE.clear()
+
     @classmethod
     def create(cls, session_id: str, spreadsheet_id: str, sheet_tab_name: str) -> "UserPreference":
         """
@@ -4,6 +4,7 @@ Cleanup service for scheduled deletion of old receipt files.
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from backend.src.storage.temp_storage import TempStorageService
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,9 @@ logger = logging.getLogger(__name__)
 class CleanupService:
     """Service for scheduling and executing file cleanup tasks."""
 
+    # Worker threads for the sweep, so unlinks of a large backlog overlap
+    CLEANUP_WORKERS = 4
+
     def __init__(self, storage_service: TempStorageService):
         """
         Initialize cleanup service.
@@ -21,11 +25,20 @@ class CleanupService:
         """
         self.storage_service = storage_service
         self.scheduler = AsyncIOScheduler()
+        # Dedicated workers (started lazily on first run) so a large sweep
+        # never takes threads from the default pool that request handlers
+        # offload OCR and storage to
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.CLEANUP_WORKERS, thread_name_prefix="cleanup"
+        )
 
-    def cleanup_task(self) -> None:
+    async def cleanup_task(self) -> None:
         """Execute cleanup task - delete files older than 24 hours."""
         try:
-            deleted_count = self.storage_service.cleanup_old_files(hours=24)
+            # Filesystem sweep and unlinks run off the event loop
+            deleted_count = await self.storage_service.cleanup_old_files_async(
+                24, executor=self.executor
+            )
             logger.info(f"Cleanup: Deleted {deleted_count} receipt file(s) older than 24 hours")
         except Exception as e:
             logger.error(f"Cleanup task failed: {e}")
@@ -53,7 +66,10 @@ class CleanupService:
             logger.info("Cleanup scheduler started")
 
     def stop(self) -> None:
-        """Stop the scheduler gracefully."""
+        """Stop the scheduler gracefully and release the cleanup workers."""
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
             logger.info("Cleanup scheduler stopped")
+
+        # Finish the unlink in progress; queued ones are dropped
+        self.executor.shutdown(wait=True, cancel_futures=True)
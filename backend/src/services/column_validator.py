@@ -1,24 +1,73 @@
 """
 ColumnValidator service for validating column references and converting between formats.
 """
-import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Maximum valid column index (ZZ = 701)
+_MAX_COLUMN_INDEX = 701
+
+
+def _ref_to_index(column_ref: str) -> int:
+    """Base-26 arithmetic behind ColumnValidator.to_index()."""
+    if len(column_ref) == 1:
+        # Single letter: A=0, B=1, ..., Z=25
+        return ord(column_ref) - 65
+    # Double letter: AA=26, AB=27, ..., ZZ=701
+    # (ord(first) - 64) * 26 + (ord(second) - 65), with ord('A') == 65
+    return ord(column_ref[0]) * 26 + ord(column_ref[1]) - 1729
+
+
+def _index_to_ref(index: int) -> str:
+    """Base-26 arithmetic behind ColumnValidator.from_index()."""
+    if index < 26:
+        # Single letter: 0=A, 1=B, ..., 25=Z
+        return chr(ord('A') + index)
+    else:
+        # Double letter: 26=AA, 27=AB, ..., 701=ZZ
+        first_index = (index // 26) - 1
+        second_index = index % 26
+        return chr(ord('A') + first_index) + chr(ord('A') + second_index)
+
+
+# The whole A-ZZ domain, precomputed in both directions
+_COLUMN_REFS: Tuple[str, ...] = tuple(_index_to_ref(i) for i in range(_MAX_COLUMN_INDEX + 1))
+_COLUMN_INDEX: Dict[str, int] = {ref: i for i, ref in enumerate(_COLUMN_REFS)}
+
+
+@lru_cache(maxsize=1024)
+def _validate(column_ref: str) -> Tuple[bool, Optional[str]]:
+    """Cached implementation of ColumnValidator.validate()."""
+    # One or two ASCII uppercase letters is always within A-ZZ (0-701),
+    # so a format match needs no separate range check
+    length = len(column_ref)
+    if length == 1:
+        if 'A' <= column_ref <= 'Z':
+            return True, None
+    elif length == 2:
+        if 'A' <= column_ref[0] <= 'Z' and 'A' <= column_ref[1] <= 'Z':
+            return True, None
+
+    # Special case: 3+ uppercase letters should be OUT_OF_RANGE, not INVALID_FORMAT
+    if length > 2 and column_ref.isupper() and column_ref.isalpha():
+        return False, "COLUMN_OUT_OF_RANGE"
+
+    return False, "INVALID_COLUMN_FORMAT"
 
 
 class ColumnValidator:
     """Validates column references and provides conversion utilities."""
 
-    # Regex pattern for valid column references (A-ZZ)
-    COLUMN_PATTERN = re.compile(r"^[A-Z]{1,2}$")
-
     # Maximum valid column index (ZZ = 701)
-    MAX_COLUMN_INDEX = 701
+    MAX_COLUMN_INDEX = _MAX_COLUMN_INDEX
 
     @staticmethod
     def validate(column_ref: str) -> Tuple[bool, Optional[str]]:
         """
         Validate a single column reference.
 
+        Results are memoized - saved mappings reuse a small set of references.
+
         Args:
             column_ref: Column reference string (e.g., "A", "AA", "ZZ")
 
@@ -28,20 +77,7 @@ class ColumnValidator:
             - (False, "INVALID_COLUMN_FORMAT") if format is invalid
             - (False, "COLUMN_OUT_OF_RANGE") if beyond ZZ (index 701)
         """
-        # Special case: 3+ uppercase letters should be OUT_OF_RANGE, not INVALID_FORMAT
-        if len(column_ref) > 2 and column_ref.isupper() and column_ref.isalpha():
-            return False, "COLUMN_OUT_OF_RANGE"
-
-        # Check format with regex
-        if not ColumnValidator.COLUMN_PATTERN.match(column_ref):
-            return False, "INVALID_COLUMN_FORMAT"
-
-        # Check range (must be within 0-701)
-        index = ColumnValidator.to_index(column_ref)
-        if index > ColumnValidator.MAX_COLUMN_INDEX:
-            return False, "COLUMN_OUT_OF_RANGE"
-
-        return True, None
+        return _validate(column_ref)
 
     @staticmethod
     def to_index(column_ref: str) -> int:
@@ -55,6 +91,8 @@ class ColumnValidator:
             Zero-based index (A=0, B=1, ..., Z=25, AA=26, ..., ZZ=701)
 
         Algorithm:
+            A-ZZ is looked up in a table precomputed at import. Anything else
+            falls back to the arithmetic:
             Single letter (A-Z):
                 index = ord(letter) - ord('A')
             Double letter (AA-ZZ):
@@ -62,14 +100,10 @@ class ColumnValidator:
                 second_index = ord(second) - ord('A')     (A=0, B=1, ..., Z=25)
                 index = first_index * 26 + second_index
         """
-        if len(column_ref) == 1:
-            # Single letter: A=0, B=1, ..., Z=25
-            return ord(column_ref) - ord('A')
-        else:
-            # Double letter: AA=26, AB=27, ..., ZZ=701
-            first = ord(column_ref[0]) - ord('A') + 1  # A=1, B=2, ..., Z=26
-            second = ord(column_ref[1]) - ord('A')      # A=0, B=1, ..., Z=25
-            return first * 26 + second
+        index = _COLUMN_INDEX.get(column_ref)
+        if index is None:
+            return _ref_to_index(column_ref)
+        return index
 
     @staticmethod
     def from_index(index: int) -> str:
@@ -83,6 +117,8 @@ class ColumnValidator:
             Column reference (A, B, ..., Z, AA, AB, ..., ZZ)
 
         Algorithm:
+            0-701 is looked up in a table precomputed at import. Anything else
+            falls back to the arithmetic:
             If index < 26: Single letter
                 column = chr(ord('A') + index)
             Else: Double letter
@@ -90,11 +126,6 @@ class ColumnValidator:
                 second_index = index % 26
                 column = chr(ord('A') + first_index) + chr(ord('A') + second_index)
         """
-        if index < 26:
-            # Single letter: 0=A, 1=B, ..., 25=Z
-            return chr(ord('A') + index)
-        else:
-            # Double letter: 26=AA, 27=AB, ..., 701=ZZ
-            first_index = (index // 26) - 1
-            second_index = index % 26
-            return chr(ord('A') + first_index) + chr(ord('A') + second_index)
+        if 0 <= index <= _MAX_COLUMN_INDEX:
+            return _COLUMN_REFS[index]
+        return _index_to_ref(index)
@@ -1,15 +1,54 @@
 """
 OCR service using pytesseract for receipt text extraction.
 """
-import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
-from pathlib import Path
-import time
+import hashlib
+import io
 import logging
-from typing import Tuple
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Tuple, Union
+
+import pytesseract
+from PIL import Image, ImageStat
 
 logger = logging.getLogger(__name__)
 
+# Threshold lookup table for Image.point(): luminance < 128 -> 0, else 255
+_THRESHOLD_LUT = bytes([0] * 128 + [255] * 128)
+
+# Every luminance value once, for building per-value lookup tables
+_GRAY_RAMP = Image.frombytes('L', (256, 1), bytes(range(256)))
+
+# OCR text keyed by image content digest and the settings that shape the
+# result, most recently used last.
+# process_image runs in worker threads, so access goes through the lock.
+_OCR_CACHE: "OrderedDict[Tuple[str, int, int, bool], str]" = OrderedDict()
+_OCR_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _contrast_threshold_lut(mean: int, factor: float) -> bytes:
+    """
+    Build a lookup table equal to ImageEnhance.Contrast followed by thresholding.
+
+    Contrast blends every pixel with a solid image of the rounded mean, so its
+    result depends only on the pixel value. Running the blend over the
+    256-value ramp gives that mapping exactly; the threshold is applied on top.
+
+    Args:
+        mean: Rounded mean luminance of the image being enhanced
+        factor: Contrast enhancement factor
+
+    Returns:
+        256-entry table for Image.point(..., '1')
+    """
+    degenerate = Image.new('L', _GRAY_RAMP.size, mean)
+    enhanced = Image.blend(degenerate, _GRAY_RAMP, factor).tobytes()
+    return bytes(_THRESHOLD_LUT[value] for value in enhanced)
+
 
 class OCRService:
     """Service for processing receipt images with OCR."""
@@ -18,14 +57,21 @@ class OCRService:
     PSM_MODE = 6  # Assume uniform block of text
     CONFIDENCE_THRESHOLD = 60
     TARGET_WIDTH = 1500
+    CACHE_SIZE = 128  # Distinct images whose OCR text is kept
+    # Contrast boost + 1-bit threshold before OCR. Tesseract's LSTM engine
+    # binarizes internally and reads grayscale at least as well, so off by default.
+    BINARIZE = False
 
     @classmethod
-    def preprocess_image(cls, image_path: str) -> Image.Image:
+    def preprocess_image(cls, image_path: Union[str, BinaryIO]) -> Image.Image:
         """
         Preprocess image for better OCR results.
 
+        Resizes and converts to grayscale; contrast enhancement and
+        thresholding only run when BINARIZE is set.
+
         Args:
-            image_path: Path to image file
+            image_path: Path to image file, or a binary file object holding it
 
         Returns:
             Preprocessed PIL Image
@@ -41,13 +87,13 @@ class OCRService:
         # Convert to grayscale
         img = img.convert('L')
 
-        # Enhance contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(2.0)
-
-        # Apply adaptive thresholding via PIL
-        # Note: For true adaptive thresholding, use opencv
-        img = img.point(lambda x: 0 if x < 128 else 255, '1')
+        if cls.BINARIZE:
+            # Enhance contrast and apply thresholding in a single point() pass,
+            # same output as ImageEnhance.Contrast(img).enhance(2.0) followed
+            # by the threshold, without the full-size intermediate images
+            # Note: For true adaptive thresholding, use opencv
+            mean = int(ImageStat.Stat(img).mean[0] + 0.5)
+            img = img.point(_contrast_threshold_lut(mean, 2.0), '1')
 
         return img
 
@@ -56,11 +102,16 @@ class OCRService:
         """
         Extract text from receipt image using OCR.
 
+        Results are cached by image content and the OCR settings (PSM_MODE,
+        TARGET_WIDTH, BINARIZE), so reprocessing the same receipt (retries,
+        duplicate uploads) skips preprocessing and tesseract.
+
         Args:
             file_path: Path to receipt image file
 
         Returns:
-            Tuple of (raw_ocr_text, processing_time_ms)
+            Tuple of (raw_ocr_text, processing_time_ms); processing_time_ms
+            is 0 when the text came from the cache
 
         Raises:
             Exception: If OCR processing fails
@@ -68,8 +119,25 @@ class OCRService:
         start_time = time.time()
 
         try:
-            # Preprocess image
-            img = cls.preprocess_image(file_path)
+            image_bytes = Path(file_path).read_bytes()
+            key = (
+                hashlib.blake2b(image_bytes, digest_size=16).hexdigest(),
+                cls.PSM_MODE,
+                cls.TARGET_WIDTH,
+                cls.BINARIZE,
+            )
+
+            with _OCR_CACHE_LOCK:
+                raw_text = _OCR_CACHE.get(key)
+                if raw_text is not None:
+                    _OCR_CACHE.move_to_end(key)
+
+            if raw_text is not None:
+                logger.info(f"OCR result reused from cache for {file_path}")
+                return raw_text, 0
+
+            # Preprocess image from the bytes already read for the key
+            img = cls.preprocess_image(io.BytesIO(image_bytes))
 
             # Configure tesseract
             custom_config = f'--psm {cls.PSM_MODE}'
@@ -80,6 +148,12 @@ class OCRService:
                 config=custom_config
             )
 
+            with _OCR_CACHE_LOCK:
+                _OCR_CACHE[key] = raw_text
+                _OCR_CACHE.move_to_end(key)
+                while len(_OCR_CACHE) > cls.CACHE_SIZE:
+                    _OCR_CACHE.popitem(last=False)
+
             # Calculate processing time
             processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -94,3 +168,9 @@ class OCRService:
         except Exception as e:
             logger.error(f"OCR processing failed: {str(e)}")
             raise Exception("OCR_FAILED") from e
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached OCR results."""
+        with _OCR_CACHE_LOCK:
+            _OCR_CACHE.clear()
@@ -1,33 +1,138 @@
 """
 Parser service for extracting structured data from OCR text.
 """
+import logging
 import re
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Tuple
-from dateutil import parser as date_parser
-import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Thousands/decimal separators removed from amount strings
+_AMOUNT_SEPARATORS = str.maketrans('', '', '.,')
+
+# Month names and the abbreviations printed on receipts
+_MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_date(date_text: str, date_format: str) -> date:
+    """Cached datetime.strptime() for a matched date string."""
+    return datetime.strptime(date_text, date_format).date()
+
+
+@lru_cache(maxsize=512)
+def _date_from_parts(day_text: str, month_text: str, year_text: str) -> date:
+    """
+    Build a date from the day/month/year groups of a DATE_PATTERNS match.
+
+    Results are memoized - the same date literals recur across receipts.
+
+    Args:
+        day_text: Day digits
+        month_text: Month name or digits
+        year_text: Two- or four-digit year
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If the month name is unknown or the date is invalid
+    """
+    day = int(day_text)
+    year = int(year_text) + 2000 if len(year_text) == 2 else int(year_text)
+
+    if month_text.isdigit():
+        month = int(month_text)
+        # Month first, like 09/28/2025 - unless the first part cannot be
+        # a month, as in 28.09.2025
+        if month > 12:
+            month, day = day, month
+    else:
+        month = _MONTHS.get(month_text.lower())
+        if month is None:
+            raise ValueError(f"Unknown month name: {month_text}")
+
+    return date(year, month, day)
+
 
 class ParserService:
     """Service for parsing receipt data from OCR text."""
 
-    # Date regex patterns (in priority order)
+    # Date regex patterns (in priority order), compiled once at import
     DATE_PATTERNS = [
-        (r'\d{4}-\d{2}-\d{2}', '%Y-%m-%d', 0.9),  # ISO 8601: 2025-09-28
-        (r'\d{2}/\d{2}/\d{4}', '%m/%d/%Y', 0.9),  # US format: 09/28/2025
-        (r'\d{2}-\d{2}-\d{4}', '%d-%m-%Y', 0.9),  # EU format: 28-09-2025
-        (r'\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}', None, 0.9),  # Textual: 22 Sep 2025 or 22 September 2025
-        (r'[A-Za-z]{3}\s+\d{1,2},?\s+\d{4}', None, 0.9),  # Textual: Jan 15, 2025
+        # ISO 8601: 2025-09-28
+        (re.compile(r'\d{4}-\d{2}-\d{2}', re.IGNORECASE), '%Y-%m-%d', 0.9),
+        # US format: 09/28/2025
+        (re.compile(r'\d{2}/\d{2}/\d{4}', re.IGNORECASE), '%m/%d/%Y', 0.9),
+        # EU format: 28-09-2025
+        (re.compile(r'\d{2}-\d{2}-\d{4}', re.IGNORECASE), '%d-%m-%Y', 0.9),
+        # Textual: 22 Sep 2025 or 22 September 2025
+        (
+            re.compile(
+                r'\b(?P<day>\d{1,2})\s+(?P<month>[A-Za-z]{3,9})\s+(?P<year>\d{4})', re.IGNORECASE
+            ),
+            None,
+            0.9,
+        ),
+        # Textual: Jan 15, 2025, Dec. 1, 2023 or January 15, 2024
+        (
+            re.compile(
+                r'\b(?P<month>[A-Za-z]{3,9})\.?\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})',
+                re.IGNORECASE
+            ),
+            None,
+            0.9,
+        ),
+        # Short numeric: 9/28/25, 28.09.2025
+        (
+            re.compile(
+                r'(?<!\d)(?P<month>\d{1,2})[./-](?P<day>\d{1,2})[./-](?P<year>\d{4}|\d{2})(?!\d)'
+            ),
+            None,
+            0.7,
+        ),
     ]
 
     # Item exclusion keywords
     EXCLUSION_KEYWORDS = {'subtotal', 'tax', 'total', 'amount', 'due', 'balance', 'change'}
 
+    # Keyword checks without lowercasing each line. re.ASCII keeps case
+    # folding to ASCII letters, which is all str.lower() can produce for
+    # the letters in these keywords.
+    EXCLUSION_PATTERN = re.compile(
+        '|'.join(sorted(EXCLUSION_KEYWORDS, key=len, reverse=True)),
+        re.ASCII | re.IGNORECASE
+    )
+    # A line mentioning "total" anywhere but "subtotal" nowhere
+    TOTAL_LINE_PATTERN = re.compile(r'(?!.*subtotal).*total', re.ASCII | re.IGNORECASE)
+
     # Amount pattern
-    AMOUNT_PATTERN = r'\$?\s*(\d+[,.]?\d*\.?\d{2})'
+    AMOUNT_PATTERN = re.compile(r'\$?\s*(\d+[,.]?\d*\.?\d{2})')
+
+    # Item lines are those holding a quantity marker (x1, x2, ...) or an
+    # amount with optional currency prefix, i.e. r'x\d+' or
+    # r'(?:Rp|USD|\$|€|£)?\s*\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2,3})?'.
+    # Both need a digit and the amount pattern matches at any digit, so a
+    # single digit scan is equivalent. Amount patterns also need a digit.
+    DIGIT_PATTERN = re.compile(r'\d')
+    DIGITS_ONLY_PATTERN = re.compile(r'\d+')  # used with fullmatch()
+
+    # Total amount patterns
+    # Matches: $15.95, Rp 300.150, 300,150, 15.95, etc.
+    TOTAL_AMOUNT_PATTERNS = (
+        # International format
+        re.compile(r'(?:Rp|USD|\$|€|£)?\s*(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)'),
+        # Original US format
+        re.compile(r'\$?\s*(\d+[,.]?\d*\.?\d{2})'),
+    )
 
     @classmethod
     def extract_date(cls, ocr_text: str) -> Tuple[Optional[date], float]:
@@ -40,72 +145,84 @@ class ParserService:
         Returns:
             Tuple of (extracted_date, confidence_score)
         """
-        # Try regex patterns first
+        # Every date pattern needs a digit
+        if not cls.DIGIT_PATTERN.search(ocr_text):
+            logger.warning("No date found in OCR text")
+            return None, 0.0
+
+        # Try regex patterns first. A match that is not a real date, like
+        # "2 pcs 2000", must not hide a later one, so every match is tried.
         for pattern, date_format, confidence in cls.DATE_PATTERNS:
-            matches = re.search(pattern, ocr_text, re.IGNORECASE)
-            if matches:
+            for match in pattern.finditer(ocr_text):
                 try:
                     if date_format:
-                        extracted_date = datetime.strptime(matches.group(), date_format).date()
+                        extracted_date = _parse_date(match.group(), date_format)
                     else:
-                        # Use dateutil for textual dates
-                        extracted_date = date_parser.parse(matches.group(), fuzzy=True).date()
-
-                    logger.info(f"Date extracted: {extracted_date} (confidence: {confidence})")
-                    return extracted_date, confidence
-                except (ValueError, date_parser.ParserError):
+                        # Textual and short numeric dates carry named parts
+                        extracted_date = _date_from_parts(*match.group('day', 'month', 'year'))
+                except ValueError:
                     continue
 
-        # Fallback: dateutil fuzzy parsing
-        try:
-            extracted_date = date_parser.parse(ocr_text, fuzzy=True).date()
-            logger.info(f"Date extracted via fuzzy parsing: {extracted_date} (confidence: 0.7)")
-            return extracted_date, 0.7
-        except (ValueError, date_parser.ParserError):
-            logger.warning("No date found in OCR text")
-            return None, 0.0
+                logger.info(f"Date extracted: {extracted_date} (confidence: {confidence})")
+                return extracted_date, confidence
+
+        logger.warning("No date found in OCR text")
+        return None, 0.0
 
     @classmethod
-    def extract_items(cls, ocr_text: str) -> Tuple[Optional[str], float]:
+    def extract_items(
+        cls,
+        ocr_text: str,
+        lines: Optional[List[str]] = None
+    ) -> Tuple[Optional[str], float]:
         """
         Extract line items from OCR text.
 
         Args:
             ocr_text: Raw OCR text
+            lines: ocr_text split into lines, if the caller already has it
 
         Returns:
             Tuple of (concatenated_items, confidence_score)
         """
         items = []
-        lines = ocr_text.split('\n')
+        if lines is None:
+            lines = ocr_text.split('\n')
 
-        # Enhanced patterns for international currencies
-        item_amount_pattern = r'(?:Rp|USD|\$|€|£)?\s*\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2,3})?'
+        # Concatenated items are truncated to max_length, so stop collecting
+        # once the joined length (items plus '; ' delimiters) reaches it
+        max_length = 500
+        joined_length = -2
 
         for line in lines:
-            line_lower = line.lower().strip()
             original_line = line.strip()
 
             # Skip empty lines
-            if not line_lower:
+            if not original_line:
                 continue
 
             # Skip lines with exclusion keywords
-            if any(keyword in line_lower for keyword in cls.EXCLUSION_KEYWORDS):
+            if cls.EXCLUSION_PATTERN.search(line):
                 continue
 
             # Look for lines with quantity and amounts (x1, x2, etc. followed by price)
-            # Also match lines with just amounts
-            if re.search(r'x\d+', line_lower) or re.search(item_amount_pattern, line):
+            # Also match lines with just amounts (see DIGIT_PATTERN)
+            if cls.DIGIT_PATTERN.search(line):
                 # Keep the full line, preserving quantity and price information
                 # Clean up excessive whitespace while keeping structure
                 cleaned_line = ' '.join(original_line.split())
 
                 # Skip if it's just a number or phone number-like pattern
-                if re.match(r'^\d+$', cleaned_line) or len(cleaned_line.replace(' ', '').replace('.', '')) > 15:
+                if (
+                    cls.DIGITS_ONLY_PATTERN.fullmatch(cleaned_line)
+                    or len(cleaned_line.replace(' ', '').replace('.', '')) > 15
+                ):
                     continue
 
                 items.append(cleaned_line)
+                joined_length += len(cleaned_line) + 2
+                if joined_length >= max_length:
+                    break
 
         if not items:
             logger.warning("No items found in OCR text")
@@ -115,7 +232,6 @@ class ParserService:
         concatenated = "; ".join(items)
 
         # Truncate to max length
-        max_length = 500
         if len(concatenated) > max_length:
             concatenated = concatenated[:max_length]
 
@@ -123,72 +239,46 @@ class ParserService:
         return concatenated, 0.85
 
     @classmethod
-    def extract_total_amount(cls, ocr_text: str) -> Tuple[Optional[Decimal], float]:
+    def extract_total_amount(
+        cls,
+        ocr_text: str,
+        lines: Optional[List[str]] = None
+    ) -> Tuple[Optional[Decimal], float]:
         """
         Extract total amount from OCR text.
 
         Args:
             ocr_text: Raw OCR text
+            lines: ocr_text split into lines, if the caller already has it
 
         Returns:
             Tuple of (total_amount, confidence_score)
         """
-        # Enhanced pattern for international currencies
-        # Matches: $15.95, Rp 300.150, 300,150, 15.95, etc.
-        amount_patterns = [
-            r'(?:Rp|USD|\$|€|£)?\s*(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)',  # International format
-            r'\$?\s*(\d+[,.]?\d*\.?\d{2})',  # Original US format
-        ]
-
         # Look for total amount near "Total" keyword
-        lines = ocr_text.split('\n')
+        if lines is None:
+            lines = ocr_text.split('\n')
         total_candidates = []
 
+        # Lines within ±1 of a "Total" line, each listed once even when total
+        # lines share neighbours (ascending, the order they were first seen)
+        search_indices = []
+        next_unlisted = 0
         for i, line in enumerate(lines):
-            line_lower = line.lower()
-
             # Check if line contains "total" keyword
-            if 'total' in line_lower and 'subtotal' not in line_lower:
-                # Extract amounts from this line and nearby lines (±1)
-                search_lines = lines[max(0, i-1):min(len(lines), i+2)]
-                for search_line in search_lines:
-                    for pattern in amount_patterns:
-                        for match in re.finditer(pattern, search_line):
-                            try:
-                                # Clean and parse amount
-                                amount_str = match.group(1)
-                                # Remove thousands separators (dots or commas)
-                                # Detect decimal separator (last dot/comma)
-                                if '.' in amount_str and ',' in amount_str:
-                                    # Both present - last one is decimal
-                                    if amount_str.rindex('.') > amount_str.rindex(','):
-                                        amount_str = amount_str.replace(',', '')
-                                    else:
-                                        amount_str = amount_str.replace('.', '').replace(',', '.')
-                                elif '.' in amount_str:
-                                    # Check if dot is thousands separator (e.g., 300.150)
-                                    parts = amount_str.split('.')
-                                    if len(parts[-1]) == 3:  # Thousands separator
-                                        amount_str = amount_str.replace('.', '')
-                                    # else it's a decimal point
-                                elif ',' in amount_str:
-                                    # Comma - could be thousands or decimal
-                                    parts = amount_str.split(',')
-                                    if len(parts[-1]) == 2:  # Decimal
-                                        amount_str = amount_str.replace(',', '.')
-                                    else:  # Thousands separator
-                                        amount_str = amount_str.replace(',', '')
-
-                                amount_str = amount_str.replace(' ', '')
-
-                                # Skip if looks like phone number (too many digits)
-                                if len(amount_str.replace('.', '')) > 10:
-                                    continue
-
-                                amount = Decimal(amount_str)
-                                total_candidates.append((amount, 0.95))  # High confidence
-                            except (ValueError, ArithmeticError):
-                                continue
+            if cls.TOTAL_LINE_PATTERN.match(line):
+                search_indices.extend(range(max(next_unlisted, i - 1), min(len(lines), i + 2)))
+                next_unlisted = max(next_unlisted, i + 2)
+
+        # Extract amounts from those lines
+        for search_line in (lines[j] for j in search_indices):
+            # Amount patterns cannot match without a digit
+            if not cls.DIGIT_PATTERN.search(search_line):
+                continue
+            for pattern in cls.TOTAL_AMOUNT_PATTERNS:
+                for match in pattern.finditer(search_line):
+                    amount = cls._parse_amount(match.group(1))
+                    if amount is not None:
+                        total_candidates.append((amount, 0.95))  # High confidence
 
         # If we found total candidates, return the largest
         if total_candidates:
@@ -198,27 +288,11 @@ class ParserService:
 
         # Fallback: Find all amounts and return largest (excluding phone numbers)
         amounts = []
-        for pattern in amount_patterns:
-            for match in re.finditer(pattern, ocr_text):
-                try:
-                    amount_str = match.group(1).replace(',', '').replace(' ', '').replace('.', '')
-
-                    # Skip if looks like phone number
-                    if len(amount_str) > 10:
-                        continue
-
-                    # Re-parse with proper decimal handling
-                    amount_str = match.group(1)
-                    if '.' in amount_str:
-                        parts = amount_str.split('.')
-                        if len(parts[-1]) == 3:
-                            amount_str = amount_str.replace('.', '')
-                    amount_str = amount_str.replace(',', '').replace(' ', '')
-
-                    amount = Decimal(amount_str)
+        for pattern in cls.TOTAL_AMOUNT_PATTERNS:
+            for match in pattern.finditer(ocr_text):
+                amount = cls._parse_amount(match.group(1))
+                if amount is not None:
                     amounts.append(amount)
-                except (ValueError, ArithmeticError):
-                    continue
 
         if not amounts:
             logger.warning("No amounts found in OCR text")
@@ -230,6 +304,54 @@ class ParserService:
         logger.info(f"Total amount extracted: {total_amount} (confidence: 0.75)")
         return total_amount, 0.75
 
+    @staticmethod
+    def _parse_amount(amount_str: str) -> Optional[Decimal]:
+        """
+        Convert a TOTAL_AMOUNT_PATTERNS match to a Decimal.
+
+        The last dot/comma is the decimal separator when both appear. A lone
+        dot followed by three digits (300.150) and a lone comma not followed
+        by exactly two digits (300,150) are thousands separators.
+
+        Args:
+            amount_str: Digits with '.'/',' separators, e.g. "1.234,56"
+
+        Returns:
+            Parsed amount, or None if it looks like a phone number (more than
+            10 digits) or has more than one decimal separator
+        """
+        # Separators are located with rfind/count and stripped in one
+        # translate() pass instead of chained replace() calls
+        digits = amount_str.translate(_AMOUNT_SEPARATORS)
+
+        # Skip if looks like phone number (too many digits)
+        if len(digits) > 10:
+            return None
+
+        dot = amount_str.rfind('.')
+        comma = amount_str.rfind(',')
+        last = dot if dot > comma else comma
+        if last < 0:
+            return Decimal(digits)
+
+        trailing = len(amount_str) - last - 1
+        if dot >= 0 and comma >= 0:
+            # Both present - last one is decimal
+            decimal_sep = amount_str[last]
+        elif dot >= 0:
+            # Dot - thousands separator if 3 digits follow (e.g., 300.150)
+            decimal_sep = None if trailing == 3 else '.'
+        else:
+            # Comma - decimal if 2 digits follow, else thousands
+            decimal_sep = ',' if trailing == 2 else None
+
+        if decimal_sep is None:
+            return Decimal(digits)
+        if amount_str.count(decimal_sep) > 1:
+            return None
+
+        return Decimal(f"{digits[:-trailing]}.{digits[-trailing:]}")
+
     @classmethod
     def parse_receipt_data(cls, ocr_text: str) -> dict:
         """
@@ -241,9 +363,12 @@ class ParserService:
         Returns:
             Dictionary with extracted fields and confidence scores
         """
+        # Split once for both line-based extractors
+        lines = ocr_text.split('\n')
+
         transaction_date, date_conf = cls.extract_date(ocr_text)
-        items, items_conf = cls.extract_items(ocr_text)
-        total_amount, amount_conf = cls.extract_total_amount(ocr_text)
+        items, items_conf = cls.extract_items(ocr_text, lines)
+        total_amount, amount_conf = cls.extract_total_amount(ocr_text, lines)
 
         return {
             "transaction_date": transaction_date,
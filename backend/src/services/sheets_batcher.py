@@ -0,0 +1,138 @@
+"""
+Coalescing batcher for Google Sheets appends.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Set, Tuple
+
+from backend.src.models.google_sheets_row import GoogleSheetsRow
+from backend.src.models.user_preference import UserPreference
+from backend.src.services.sheets_service import SheetsService
+
+logger = logging.getLogger(__name__)
+
+
+class SheetsAppendBatcher:
+    """
+    Groups rows saved in quick succession into a single Sheets append call.
+
+    Rows are grouped by (user session, spreadsheet, sheet tab, OAuth token) so
+    a batch never mixes credentials or destinations, and keep submission order.
+    A group is flushed once it reaches max_batch_size rows or max_delay seconds
+    after its first row arrived, whichever comes first.
+    """
+
+    def __init__(self, max_batch_size: int = 10, max_delay: float = 0.05):
+        """
+        Initialize batcher.
+
+        Args:
+            max_batch_size: Flush a group as soon as it holds this many rows
+            max_delay: Maximum seconds a row waits for others to join its batch
+        """
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: Dict[Tuple, List[Tuple[GoogleSheetsRow, asyncio.Future]]] = {}
+        self._batch_context: Dict[Tuple, Tuple[UserPreference, str, float]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        # The event loop only keeps weak references to tasks
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        row_data: GoogleSheetsRow,
+        user_pref: UserPreference,
+        oauth_token: str,
+        token_expiry: float
+    ) -> Tuple[bool, Dict]:
+        """
+        Queue a row for appending and wait for its result.
+
+        Args:
+            row_data: GoogleSheetsRow instance with data to append
+            user_pref: UserPreference with spreadsheet configuration
+            oauth_token: OAuth2 access token
+            token_expiry: Token expiration as a Unix timestamp
+
+        Returns:
+            Tuple of (success, response_dict), as from SheetsService.append_row()
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            user_pref.user_session_id,
+            user_pref.spreadsheet_id,
+            user_pref.sheet_tab_name,
+            oauth_token,
+        )
+
+        future = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((row_data, future))
+
+        if len(group) == 1:
+            # First row of a new batch - its context is used for the whole group
+            self._batch_context[key] = (user_pref, oauth_token, token_expiry)
+            self._timers[key] = loop.call_later(self.max_delay, self._start_flush, key)
+
+        if len(group) >= self.max_batch_size:
+            self._start_flush(key)
+
+        return await future
+
+    def _start_flush(self, key: Tuple) -> None:
+        """Detach a pending group and append it in the background."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        group = self._pending.pop(key, None)
+        context = self._batch_context.pop(key, None)
+        if not group:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._flush(group, *context))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def close(self) -> None:
+        """
+        Flush every pending group now and wait for all in-flight appends.
+
+        Called on application shutdown so queued rows are still written and
+        no submit() caller is left waiting.
+        """
+        for key in list(self._pending):
+            self._start_flush(key)
+
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def _flush(
+        self,
+        group: List[Tuple[GoogleSheetsRow, asyncio.Future]],
+        user_pref: UserPreference,
+        oauth_token: str,
+        token_expiry: float
+    ) -> None:
+        """Append a detached group and resolve each row's future."""
+        rows = [row_data for row_data, _ in group]
+
+        try:
+            if len(rows) == 1:
+                results = [await asyncio.to_thread(
+                    SheetsService.append_row, rows[0], user_pref, oauth_token, token_expiry
+                )]
+            else:
+                logger.info(f"Appending batch of {len(rows)} rows to {user_pref.sheet_tab_name}")
+                results = await asyncio.to_thread(
+                    SheetsService.append_rows, rows, user_pref, oauth_token, token_expiry
+                )
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(group, results):
+            if not future.done():
+                future.set_result(result)
@@ -6,31 +6,47 @@ from google.oauth2.credentials import Credentials
 from backend.src.models.google_sheets_row import GoogleSheetsRow
 from backend.src.models.user_preference import UserPreference
 from backend.src.models.column_mapping import ColumnMappingConfiguration
-from datetime import datetime, timedelta
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
+import hashlib
 import logging
+import re
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Start cell of the A1 range part after the sheet name, e.g. "A5" in "Sheet1!A5:C7"
+UPDATED_RANGE_ROW_PATTERN = re.compile(r"[A-Z]+(\d+)")
+
+# Opened worksheets keyed by (token digest, spreadsheet_id, sheet_tab_name),
+# each stored with the Unix time it expires at. Appends run in worker
+# threads, so access goes through the lock.
+_WORKSHEET_CACHE: Dict[Tuple[bytes, str, str], Tuple[gspread.Worksheet, float]] = {}
+_WORKSHEET_CACHE_LOCK = threading.Lock()
+
 
 class SheetsService:
     """Service for Google Sheets integration."""
 
+    # Tokens this close to expiry are treated as already expired (seconds)
+    TOKEN_EXPIRY_MARGIN = 5 * 60
+
+    # How long an opened worksheet handle is reused (seconds)
+    WORKSHEET_CACHE_TTL = 5 * 60
+
     @staticmethod
-    def check_token_validity(token_expiry: datetime) -> Tuple[bool, str]:
+    def check_token_validity(token_expiry: float) -> Tuple[bool, str]:
         """
         Check if OAuth2 token is still valid.
 
         Args:
-            token_expiry: Token expiration datetime
+            token_expiry: Token expiration as a Unix timestamp
 
         Returns:
             Tuple of (is_valid, error_code)
         """
-        now = datetime.utcnow()
         # Check if expired or within 5 minutes of expiry
-        if token_expiry <= now or token_expiry <= (now + timedelta(minutes=5)):
+        if token_expiry <= time.time() + SheetsService.TOKEN_EXPIRY_MARGIN:
             logger.warning(f"OAuth2 token expired or expiring soon: {token_expiry}")
             return False, "AUTH_EXPIRED"
 
@@ -54,14 +70,12 @@ class SheetsService:
         Algorithm:
             1. Find max column index from all three mappings
             2. Initialize sparse array with empty strings
-            3. Collect values for each column (handle duplicates)
-            4. Concatenate duplicate values with ' | ' delimiter
+            3. Write each value at its column index
+            4. Concatenate values sharing a column with ' | ' delimiter
             5. Return sparse row array
         """
         # Get column indices
-        date_idx = mappings.get_column_index(mappings.date_column)
-        desc_idx = mappings.get_column_index(mappings.description_column)
-        price_idx = mappings.get_column_index(mappings.price_column)
+        date_idx, desc_idx, price_idx = mappings.get_column_indices()
 
         # Find max index to determine array size
         max_index = max(date_idx, desc_idx, price_idx)
@@ -69,31 +83,20 @@ class SheetsService:
         # Initialize sparse array with empty strings
         row = [''] * (max_index + 1)
 
-        # Map of column index to list of field values
-        column_values = {}
+        # Write values in date, description, price order; a column shared
+        # with an earlier field gets the values joined with ' | '
+        row[date_idx] = row_data.transaction_date.isoformat()  # YYYY-MM-DD
 
-        # Add date value
-        if date_idx not in column_values:
-            column_values[date_idx] = []
-        column_values[date_idx].append(row_data.transaction_date.strftime("%Y-%m-%d"))
+        if desc_idx == date_idx:
+            row[desc_idx] = f"{row[desc_idx]} | {row_data.items}"
+        else:
+            row[desc_idx] = row_data.items
 
-        # Add description value
-        if desc_idx not in column_values:
-            column_values[desc_idx] = []
-        column_values[desc_idx].append(row_data.items)
-
-        # Add price value
-        if price_idx not in column_values:
-            column_values[price_idx] = []
-        column_values[price_idx].append(str(float(row_data.total_amount)))
-
-        # Write values to sparse array (concatenate duplicates with ' | ')
-        for col_idx, values in column_values.items():
-            if len(values) == 1:
-                row[col_idx] = values[0]
-            else:
-                # Concatenate multiple values with ' | ' delimiter
-                row[col_idx] = ' | '.join(values)
+        price_value = str(float(row_data.total_amount))
+        if price_idx == date_idx or price_idx == desc_idx:
+            row[price_idx] = f"{row[price_idx]} | {price_value}"
+        else:
+            row[price_idx] = price_value
 
         return row
 
@@ -102,7 +105,7 @@ class SheetsService:
         row_data: GoogleSheetsRow,
         user_pref: UserPreference,
         oauth_token: str,
-        token_expiry: datetime
+        token_expiry: float
     ) -> Tuple[bool, Dict]:
         """
         Append row to Google Sheets.
@@ -111,7 +114,7 @@ class SheetsService:
             row_data: GoogleSheetsRow instance with data to append
             user_pref: UserPreference with spreadsheet configuration
             oauth_token: OAuth2 access token
-            token_expiry: Token expiration datetime
+            token_expiry: Token expiration as a Unix timestamp
 
         Returns:
             Tuple of (success, response_dict)
@@ -119,85 +122,302 @@ class SheetsService:
         Raises:
             Exception: On Google Sheets API errors
         """
+        precheck_error = SheetsService._precheck(user_pref, token_expiry)
+        if precheck_error:
+            return False, precheck_error
+
+        # Validate row data
+        is_valid, error_msg = row_data.validate()
+        if not is_valid:
+            return False, {"error_code": "INVALID_DATA", "message": error_msg}
+
+        try:
+            worksheet = SheetsService._open_worksheet(user_pref, oauth_token, token_expiry)
+
+            # Get column mappings and build mapped row
+            mappings = user_pref.get_column_mappings()
+            row = SheetsService.build_mapped_row(row_data, mappings)
+
+            response = SheetsService._append_with_backoff(worksheet, [row])
+
+            # Get row number from the updated range of the append response;
+            # left as None when the response has none (the grid size is not
+            # the last row with data, and reading the sheet costs a full fetch)
+            row_number = SheetsService._first_updated_row(response)
+
+            logger.info(f"Row appended successfully at row {row_number}")
+
+            return True, SheetsService._success_response(user_pref, row_number)
+
+        except Exception as e:
+            SheetsService._discard_worksheet_on_auth_error(e, user_pref, oauth_token)
+            return False, SheetsService._error_response(e)
+
+    @staticmethod
+    def append_rows(
+        rows_data: List[GoogleSheetsRow],
+        user_pref: UserPreference,
+        oauth_token: str,
+        token_expiry: float
+    ) -> List[Tuple[bool, Dict]]:
+        """
+        Append several rows to the same worksheet in one API call.
+
+        Args:
+            rows_data: GoogleSheetsRow instances, in the order they should appear
+            user_pref: UserPreference with spreadsheet configuration
+            oauth_token: OAuth2 access token
+            token_expiry: Token expiration as a Unix timestamp
+
+        Returns:
+            List of (success, response_dict) tuples, one per input row
+        """
+        precheck_error = SheetsService._precheck(user_pref, token_expiry)
+        if precheck_error:
+            return [(False, precheck_error) for _ in rows_data]
+
+        # Invalid rows fail individually; the rest are appended together
+        results: List[Optional[Tuple[bool, Dict]]] = [None] * len(rows_data)
+        valid_indices = []
+        for i, row_data in enumerate(rows_data):
+            is_valid, error_msg = row_data.validate()
+            if is_valid:
+                valid_indices.append(i)
+            else:
+                results[i] = (False, {"error_code": "INVALID_DATA", "message": error_msg})
+
+        if not valid_indices:
+            return results
+
+        try:
+            worksheet = SheetsService._open_worksheet(user_pref, oauth_token, token_expiry)
+
+            mappings = user_pref.get_column_mappings()
+            rows = [SheetsService.build_mapped_row(rows_data[i], mappings) for i in valid_indices]
+
+            response = SheetsService._append_with_backoff(worksheet, rows)
+
+            # Rows are contiguous; take the first row number from the updated
+            # range, or report None for every row if the response has none
+            first_row = SheetsService._first_updated_row(response)
+
+            logger.info(f"{len(rows)} rows appended successfully starting at row {first_row}")
+
+            for offset, i in enumerate(valid_indices):
+                row_number = None if first_row is None else first_row + offset
+                results[i] = (True, SheetsService._success_response(user_pref, row_number))
+
+        except Exception as e:
+            SheetsService._discard_worksheet_on_auth_error(e, user_pref, oauth_token)
+            error_response = SheetsService._error_response(e)
+            for i in valid_indices:
+                results[i] = (False, error_response)
+
+        return results
+
+    @staticmethod
+    def _precheck(user_pref: UserPreference, token_expiry: float) -> Optional[Dict]:
+        """
+        Run checks shared by all rows of an append request.
+
+        Args:
+            user_pref: UserPreference with spreadsheet configuration
+            token_expiry: Token expiration as a Unix timestamp
+
+        Returns:
+            Error response dict, or None if the append may proceed
+        """
         # Check token validity
         is_valid, error_code = SheetsService.check_token_validity(token_expiry)
         if not is_valid:
-            return False, {"error_code": error_code, "message": "Google Sheets authentication expired. Please reconnect."}
+            return {
+                "error_code": error_code,
+                "message": "Google Sheets authentication expired. Please reconnect."
+            }
 
         # Check if column mappings are configured
         if not user_pref.has_column_mappings():
-            return False, {
+            return {
                 "error_code": "COLUMN_MAPPINGS_REQUIRED",
                 "message": "Please configure column mappings before processing receipts"
             }
 
-        # Validate row data
-        is_valid, error_msg = row_data.validate()
-        if not is_valid:
-            return False, {"error_code": "INVALID_DATA", "message": error_msg}
+        return None
 
-        try:
-            # Create credentials
-            creds = Credentials(token=oauth_token)
+    @staticmethod
+    def _open_worksheet(
+        user_pref: UserPreference,
+        oauth_token: str,
+        token_expiry: float
+    ) -> gspread.Worksheet:
+        """
+        Authorize with the OAuth2 token and open the configured worksheet.
 
-            # Initialize gspread client
-            client = gspread.authorize(creds)
+        Handles are reused for WORKSHEET_CACHE_TTL seconds, and never beyond
+        the point where check_token_validity() would reject the token, so
+        repeated appends skip the authorize/open metadata requests.
 
-            # Open spreadsheet and worksheet
-            spreadsheet = client.open_by_key(user_pref.spreadsheet_id)
-            worksheet = spreadsheet.worksheet(user_pref.sheet_tab_name)
+        Args:
+            user_pref: UserPreference with spreadsheet configuration
+            oauth_token: OAuth2 access token
+            token_expiry: Token expiration as a Unix timestamp
 
-            # Get column mappings and build mapped row
-            mappings = user_pref.get_column_mappings()
-            row = SheetsService.build_mapped_row(row_data, mappings)
+        Returns:
+            gspread Worksheet handle
+        """
+        key = SheetsService._worksheet_cache_key(user_pref, oauth_token)
+        now = time.time()
 
-            # Append row with exponential backoff for rate limiting
-            max_retries = 3
-            retry_delay = 1
-
-            for attempt in range(max_retries):
-                try:
-                    worksheet.append_row(row)
-                    break
-                except gspread.exceptions.APIError as e:
-                    if e.response.status_code == 429 and attempt < max_retries - 1:
-                        # Rate limit exceeded, retry with backoff
-                        logger.warning(f"Rate limit hit, retrying in {retry_delay}s...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        raise
-
-            # Get row number (approximate - last row + 1)
-            row_number = len(worksheet.get_all_values()) + 1
-
-            # Construct spreadsheet URL
-            spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{user_pref.spreadsheet_id}/edit#gid=0"
+        with _WORKSHEET_CACHE_LOCK:
+            cached = _WORKSHEET_CACHE.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
 
-            logger.info(f"Row appended successfully at row {row_number}")
+        # Create credentials
+        creds = Credentials(token=oauth_token)
 
-            return True, {
-                "success": True,
-                "spreadsheet_url": spreadsheet_url,
-                "row_number": row_number
-            }
+        # Initialize gspread client
+        client = gspread.authorize(creds)
+
+        # Open spreadsheet and worksheet
+        spreadsheet = client.open_by_key(user_pref.spreadsheet_id)
+        worksheet = spreadsheet.worksheet(user_pref.sheet_tab_name)
+
+        expires_at = min(
+            token_expiry - SheetsService.TOKEN_EXPIRY_MARGIN,
+            now + SheetsService.WORKSHEET_CACHE_TTL
+        )
+        with _WORKSHEET_CACHE_LOCK:
+            # Drop expired handles so the cache stays bounded by live tokens
+            for stale_key in [k for k, (_, exp) in _WORKSHEET_CACHE.items() if exp <= now]:
+                del _WORKSHEET_CACHE[stale_key]
+            _WORKSHEET_CACHE[key] = (worksheet, expires_at)
+
+        return worksheet
+
+    @staticmethod
+    def _worksheet_cache_key(user_pref: UserPreference, oauth_token: str) -> Tuple[bytes, str, str]:
+        """Build the worksheet cache key; the token is kept only as a digest."""
+        token_digest = hashlib.blake2b(oauth_token.encode(), digest_size=16).digest()
+        return token_digest, user_pref.spreadsheet_id, user_pref.sheet_tab_name
+
+    @staticmethod
+    def _discard_worksheet_on_auth_error(
+        error: Exception,
+        user_pref: UserPreference,
+        oauth_token: str
+    ) -> None:
+        """
+        Forget a cached worksheet handle after a 401/403 from the Sheets API.
+
+        Args:
+            error: Exception raised while appending
+            user_pref: UserPreference with spreadsheet configuration
+            oauth_token: OAuth2 access token
+        """
+        if (
+            isinstance(error, gspread.exceptions.APIError)
+            and error.response.status_code in (401, 403)
+        ):
+            key = SheetsService._worksheet_cache_key(user_pref, oauth_token)
+            with _WORKSHEET_CACHE_LOCK:
+                _WORKSHEET_CACHE.pop(key, None)
+
+    @staticmethod
+    def clear_worksheet_cache() -> None:
+        """Drop all cached worksheet handles."""
+        with _WORKSHEET_CACHE_LOCK:
+            _WORKSHEET_CACHE.clear()
 
-        except gspread.exceptions.APIError as e:
+    @staticmethod
+    def _append_with_backoff(worksheet: gspread.Worksheet, rows: List[List[str]]) -> Dict:
+        """
+        Append rows with exponential backoff for rate limiting.
+
+        Args:
+            worksheet: Target worksheet
+            rows: Mapped rows to append
+
+        Returns:
+            Sheets API values.append response
+
+        Raises:
+            gspread.exceptions.APIError: If retries are exhausted or the error is not a 429
+        """
+        max_retries = 3
+        retry_delay = 1
+
+        for attempt in range(max_retries):
+            try:
+                return worksheet.append_rows(rows)
+            except gspread.exceptions.APIError as e:
+                if e.response.status_code == 429 and attempt < max_retries - 1:
+                    # Rate limit exceeded, retry with backoff
+                    logger.warning(f"Rate limit hit, retrying in {retry_delay}s...")
+                    time.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    raise
+
+    @staticmethod
+    def _first_updated_row(response: Dict) -> Optional[int]:
+        """
+        Extract the first row number from a values.append response.
+
+        Args:
+            response: Sheets API response, e.g. {"updates": {"updatedRange": "Sheet1!A5:C7"}}
+
+        Returns:
+            Row number (1-based) or None if it cannot be determined
+        """
+        try:
+            updated_range = response["updates"]["updatedRange"]
+        except (KeyError, TypeError):
+            return None
+
+        # Sheet names may contain '!', so split on the last one
+        cell_range = updated_range.rsplit("!", 1)[-1]
+        match = UPDATED_RANGE_ROW_PATTERN.match(cell_range)
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _success_response(user_pref: UserPreference, row_number: Optional[int]) -> Dict:
+        """Build the success payload returned to the client."""
+        # Construct spreadsheet URL
+        spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{user_pref.spreadsheet_id}/edit#gid=0"
+
+        return {
+            "success": True,
+            "spreadsheet_url": spreadsheet_url,
+            "row_number": row_number
+        }
+
+    @staticmethod
+    def _error_response(error: Exception) -> Dict:
+        """
+        Convert an exception raised while appending into an error payload.
+
+        Args:
+            error: Exception from gspread or the Sheets API
+
+        Returns:
+            Error response dict with GS-<status> error code
+        """
+        if isinstance(error, gspread.exceptions.APIError):
             # Extract HTTP status code and format error
-            status_code = e.response.status_code
+            status_code = error.response.status_code
             error_code = f"GS-{status_code}"
             error_message = f"Error {error_code}: Unable to save data"
 
-            logger.error(f"Google Sheets API error {status_code}: {e}")
+            logger.error(f"Google Sheets API error {status_code}: {error}")
 
-            return False, {
+            return {
                 "error_code": error_code,
                 "message": error_message
             }
 
-        except Exception as e:
-            logger.error(f"Unexpected error in sheets service: {e}")
-            return False, {
-                "error_code": "GS-500",
-                "message": "Error GS-500: Unable to save data"
-            }
+        logger.error(f"Unexpected error in sheets service: {error}")
+        return {
+            "error_code": "GS-500",
+            "message": "Error GS-500: Unable to save data"
+        }
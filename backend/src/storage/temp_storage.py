@@ -1,12 +1,16 @@
 """
 Temporary storage service for receipt file management.
 """
-from pathlib import Path
-from typing import List
-import uuid
-from datetime import datetime, timedelta
+import asyncio
 import logging
 import os
+import shutil
+import tempfile
+import time
+import uuid
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +18,13 @@ logger = logging.getLogger(__name__)
 class TempStorageService:
     """Service for managing temporary receipt file storage."""
 
+    # Stored extension per accepted MIME type; receipt files are named
+    # "<receipt_id><extension>" so they can be located without a directory scan
+    EXTENSIONS_BY_TYPE = {"image/jpeg": ".jpg", "image/png": ".png"}
+
+    # Bytes per sendfile()/read() call when streaming uploads to disk
+    COPY_CHUNK_SIZE = 1 << 20
+
     def __init__(self, upload_dir: str = "shared/uploads"):
         """
         Initialize temp storage service.
@@ -23,6 +34,7 @@ class TempStorageService:
         """
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self._upload_dir_str = str(self.upload_dir)
 
     def save_file(self, file_content: bytes, original_filename: str) -> str:
         """
@@ -34,53 +46,188 @@ class TempStorageService:
 
         Returns:
             Path to saved file
-
-        Raises:
-            ValueError: If path traversal attempt detected
         """
         # Generate UUID filename
         file_uuid = str(uuid.uuid4())
-        timestamp = int(datetime.utcnow().timestamp())
-        extension = Path(original_filename).suffix
+        timestamp = int(time.time())
 
-        filename = f"{file_uuid}_{timestamp}{extension}"
-        file_path = self.upload_dir / filename
+        # Only the extension comes from the client. With path separators
+        # stripped the name cannot leave the upload directory, so no
+        # resolve() round-trip is needed to check it.
+        extension = os.path.splitext(original_filename)[1]
+        extension = extension.replace('/', '').replace('\\', '')[:16]
 
-        # Ensure file is within upload directory (prevent path traversal)
-        if not file_path.resolve().is_relative_to(self.upload_dir.resolve()):
-            raise ValueError("Path traversal attempt detected")
+        filename = f"{file_uuid}_{timestamp}{extension}"
+        file_path = os.path.join(self._upload_dir_str, filename)
 
         # Save file
+        self._write_new_file(file_path, file_content)
+
+        logger.info(f"File saved: {file_path}")
+        return file_path
+
+    def save_receipt_file(self, file_content: bytes, receipt_id: str, file_type: str) -> str:
+        """
+        Save uploaded receipt under a path derived from its receipt ID.
+
+        Args:
+            file_content: File binary content
+            receipt_id: Receipt UUID
+            file_type: Validated MIME type (image/jpeg or image/png)
+
+        Returns:
+            Path to saved file
+
+        Raises:
+            ValueError: If receipt_id is not a UUID or file_type is not supported
+        """
+        file_path = self.get_receipt_file_path(receipt_id, file_type)
+        if file_path is None:
+            raise ValueError("Invalid receipt ID or file type")
+
         with open(file_path, 'wb') as f:
             f.write(file_content)
 
         logger.info(f"File saved: {file_path}")
         return str(file_path)
 
-    def delete_file(self, file_path: str) -> bool:
+    def save_receipt_stream(self, src: BinaryIO, receipt_id: str, file_type: str) -> str:
         """
-        Delete file from storage.
+        Stream an uploaded receipt to a path derived from its receipt ID.
+
+        Copies from the current position of src without loading the whole
+        file into memory. When src is backed by a real file (an upload
+        spooled to disk), the copy is done in the kernel with os.sendfile().
 
         Args:
-            file_path: Path to file to delete
+            src: Readable binary file object, e.g. UploadFile.file
+            receipt_id: Receipt UUID
+            file_type: Validated MIME type (image/jpeg or image/png)
 
         Returns:
-            True if deleted, False if file not found
+            Path to saved file
+
+        Raises:
+            ValueError: If receipt_id is not a UUID or file_type is not supported
         """
-        path = Path(file_path)
+        file_path = self.get_receipt_file_path(receipt_id, file_type)
+        if file_path is None:
+            raise ValueError("Invalid receipt ID or file type")
 
-        if not path.exists():
-            logger.warning(f"File not found for deletion: {file_path}")
-            return False
+        with open(file_path, 'wb') as dst:
+            src_fd = self._real_fileno(src)
+            if src_fd is None:
+                shutil.copyfileobj(src, dst, self.COPY_CHUNK_SIZE)
+            else:
+                offset = src.tell()
+                dst_fd = dst.fileno()
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, self.COPY_CHUNK_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
 
+        logger.info(f"File saved: {file_path}")
+        return str(file_path)
+
+    @staticmethod
+    def _real_fileno(src: BinaryIO) -> Optional[int]:
+        """
+        Get the OS file descriptor behind src, if it has one already.
+
+        A SpooledTemporaryFile keeps small uploads in an in-memory buffer
+        and calling fileno() would force it to disk, so only an already
+        rolled-over spool is used. The spool exposes no public rolled-over
+        flag; its _rolled attribute is read the way Starlette's UploadFile
+        does, and a spool without it is treated as in memory.
+
+        Args:
+            src: Readable binary file object
+
+        Returns:
+            File descriptor usable with os.sendfile(), or None
+        """
+        if not hasattr(os, "sendfile"):
+            return None
+
+        if isinstance(src, tempfile.SpooledTemporaryFile) and not getattr(src, "_rolled", False):
+            return None
+
+        try:
+            return src.fileno()
+        except (AttributeError, OSError, ValueError):
+            # io.UnsupportedOperation (e.g. BytesIO) is an OSError/ValueError subclass
+            return None
+
+    def get_receipt_file_path(self, receipt_id: str, file_type: str) -> Optional[Path]:
+        """
+        Build the storage path for a receipt file.
+
+        Args:
+            receipt_id: Receipt UUID
+            file_type: MIME type (image/jpeg or image/png)
+
+        Returns:
+            Path inside upload directory, or None if receipt_id is not a UUID
+            or file_type is not supported
+        """
+        extension = self.EXTENSIONS_BY_TYPE.get(file_type)
+        if extension is None:
+            return None
+
+        # Only canonical UUIDs are accepted, which also rules out path traversal
         try:
-            path.unlink()
+            receipt_id = str(uuid.UUID(receipt_id))
+        except ValueError:
+            return None
+
+        return self.upload_dir / f"{receipt_id}{extension}"
+
+    def delete_receipt_file(self, receipt_id: str) -> bool:
+        """
+        Delete the stored file for a receipt.
+
+        Args:
+            receipt_id: Receipt UUID
+
+        Returns:
+            True if a file was deleted, False otherwise
+        """
+        for file_type in self.EXTENSIONS_BY_TYPE:
+            file_path = self.get_receipt_file_path(receipt_id, file_type)
+            if file_path is None:
+                return False
+
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                continue
+            except PermissionError as e:
+                logger.error(f"Permission error deleting file {file_path}: {e}")
+                return False
+
             logger.info(f"File deleted: {file_path}")
             return True
-        except PermissionError as e:
-            logger.error(f"Permission error deleting file {file_path}: {e}")
+
+        logger.warning(f"No stored file found for receipt {receipt_id}")
+        return False
+
+    def delete_file(self, file_path: str) -> bool:
+        """
+        Delete file from storage.
+
+        Args:
+            file_path: Path to file to delete
+
+        Returns:
+            True if deleted, False if file not found
+        """
+        if not self._unlink(file_path):
             return False
 
+        logger.info(f"File deleted: {file_path}")
+        return True
+
     def list_old_files(self, hours: int = 24) -> List[str]:
         """
         List files older than specified hours.
@@ -91,16 +238,7 @@ class TempStorageService:
         Returns:
             List of file paths older than threshold
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        old_files = []
-
-        for file_path in self.upload_dir.iterdir():
-            if file_path.is_file() and file_path.name != '.gitkeep':
-                # Get file modification time
-                mtime = datetime.utcfromtimestamp(file_path.stat().st_mtime)
-
-                if mtime < cutoff_time:
-                    old_files.append(str(file_path))
+        old_files = list(self._iter_old_files(hours))
 
         logger.info(f"Found {len(old_files)} files older than {hours} hours")
         return old_files
@@ -115,12 +253,139 @@ class TempStorageService:
         Returns:
             Number of files deleted
         """
-        old_files = self.list_old_files(hours)
         deleted_count = 0
 
-        for file_path in old_files:
-            if self.delete_file(file_path):
+        # Unlink each expired file as the sweep reaches it, without first
+        # collecting the whole list
+        for file_path in self._iter_old_files(hours):
+            if self._unlink(file_path):
                 deleted_count += 1
 
         logger.info(f"Cleanup completed: {deleted_count} files deleted")
         return deleted_count
+
+    async def cleanup_old_files_async(
+        self,
+        hours: int = 24,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 32
+    ) -> int:
+        """
+        Delete files older than specified hours without blocking the event loop.
+
+        The sweep and the unlinks run on the executor, with up to
+        max_concurrency unlinks in flight so their I/O waits overlap.
+
+        Args:
+            hours: Age threshold in hours
+            executor: Executor for the blocking calls (None = loop default)
+            max_concurrency: Maximum number of unlinks submitted at once
+
+        Returns:
+            Number of files deleted
+        """
+        loop = asyncio.get_running_loop()
+        old_files = await loop.run_in_executor(executor, self.list_old_files, hours)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def unlink(file_path: str) -> bool:
+            async with semaphore:
+                return await loop.run_in_executor(executor, self._unlink, file_path)
+
+        results = await asyncio.gather(*(unlink(p) for p in old_files), return_exceptions=True)
+
+        deleted_count = 0
+        for file_path, result in zip(old_files, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error deleting file {file_path}: {result}")
+            elif result:
+                deleted_count += 1
+
+        logger.info(f"Cleanup completed: {deleted_count} files deleted")
+        return deleted_count
+
+    @staticmethod
+    def _write_new_file(file_path: str, file_content: bytes) -> None:
+        """
+        Write content to a file that must not exist yet.
+
+        Uses os.open() with O_EXCL and unbuffered os.write() calls, so an
+        existing file is never overwritten and no io.BufferedWriter copy is
+        made. A partially written file is removed if writing fails.
+
+        Args:
+            file_path: Destination path
+            file_content: File binary content
+
+        Raises:
+            FileExistsError: If file_path already exists
+            OSError: If the file cannot be written
+        """
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o640)
+        try:
+            view = memoryview(file_content)
+            while view:
+                # os.write() may write fewer bytes than requested
+                view = view[os.write(fd, view):]
+        except BaseException:
+            os.close(fd)
+            os.unlink(file_path)
+            raise
+        os.close(fd)
+
+    @staticmethod
+    def _unlink(file_path: str) -> bool:
+        """
+        Remove a file with a single os.unlink() call.
+
+        A missing file is reported by the unlink itself, so there is no
+        separate exists() check.
+
+        Args:
+            file_path: Path to file to delete
+
+        Returns:
+            True if deleted, False if not found or not permitted
+        """
+        try:
+            os.unlink(file_path)
+            return True
+        except FileNotFoundError:
+            logger.warning(f"File not found for deletion: {file_path}")
+            return False
+        except PermissionError as e:
+            logger.error(f"Permission error deleting file {file_path}: {e}")
+            return False
+
+    def _iter_old_files(self, hours: int) -> Iterator[str]:
+        """
+        Yield regular files in the upload directory older than hours.
+
+        Uses a single os.scandir() sweep: the file type comes from the
+        directory listing and each entry needs one stat, compared as integer
+        nanoseconds against a cutoff read from the clock once. Symlinks are
+        not followed, so checking the type of an entry costs no syscall on
+        Linux and links placed in the directory are never treated as uploads.
+
+        Args:
+            hours: Age threshold in hours
+
+        Yields:
+            File paths older than threshold
+        """
+        cutoff_ns = time.time_ns() - hours * 3600 * 10**9
+
+        with os.scandir(self._upload_dir_str) as entries:
+            for entry in entries:
+                if entry.name == '.gitkeep' or not entry.is_file(follow_symlinks=False):
+                    continue
+
+                try:
+                    mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                except FileNotFoundError:
+                    # Removed between listing and stat
+                    continue
+
+                if mtime_ns < cutoff_ns:
+                    yield entry.path
@@ -2,26 +2,161 @@
 Pytest fixtures shared across all test modules.
 """
 import pytest
+import pytest_asyncio
+import httpx
+import orjson
 from httpx import AsyncClient, ASGITransport
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Generator
 from frontend.src.main import app
 from backend.src.models.user_preference import UserPreference
+from backend.src.services.sheets_service import SheetsService
 from pathlib import Path
 import json
 import tempfile
 import shutil
 
 
+def _orjson_response_json(self: httpx.Response, **kwargs: Any) -> Any:
+    """httpx.Response.json() decoding with orjson; keyword arguments fall back to stdlib json."""
+    if kwargs:
+        return json.loads(self.content, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_response_decoding() -> Generator[None, None, None]:
+    """Decode test response bodies with orjson for the whole test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_response_json)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one async HTTP client (and ASGI transport) for the whole test session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
 @pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+async def client(session_client: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create an async HTTP client for testing API endpoints.
+    Provide the shared async HTTP client for testing API endpoints.
+
+    Cookies are cleared before each test so a session cookie set by one test
+    never leaks into the next.
 
     Note: Tests use session_id headers for authentication, which the endpoints
     support alongside browser session cookies for flexibility.
     """
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
+    session_client.cookies.clear()
+    yield session_client
+
+
+# Test user preferences, shared read-only by every test
+TEST_PREFERENCES = {
+    # User with configured column mappings
+    "test-session-configured": {
+        "id": "test-id-1",
+        "spreadsheet_id": "1" * 44,
+        "sheet_tab_name": "Sheet1",
+        "column_mappings": {
+            "date": "A",
+            "description": "B",
+            "price": "C"
+        },
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User without column mappings
+    "test-session-unconfigured": {
+        "id": "test-id-2",
+        "spreadsheet_id": "2" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User with duplicate column mappings
+    "test-session-with-duplicates": {
+        "id": "test-id-3",
+        "spreadsheet_id": "3" * 44,
+        "sheet_tab_name": "Sheet1",
+        "column_mappings": {
+            "date": "A",
+            "description": "B",
+            "price": "A"  # Duplicate
+        },
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for valid POST test
+    "test-session-valid": {
+        "id": "test-id-4",
+        "spreadsheet_id": "4" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for non-contiguous test
+    "test-session-non-contiguous": {
+        "id": "test-id-5",
+        "spreadsheet_id": "5" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for duplicates test
+    "test-session-duplicates": {
+        "id": "test-id-6",
+        "spreadsheet_id": "6" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for invalid format test
+    "test-session-invalid": {
+        "id": "test-id-7",
+        "spreadsheet_id": "7" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for lowercase test
+    "test-session-lowercase": {
+        "id": "test-id-8",
+        "spreadsheet_id": "8" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for out of range test
+    "test-session-out-of-range": {
+        "id": "test-id-9",
+        "spreadsheet_id": "9" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for missing field test
+    "test-session-missing": {
+        "id": "test-id-10",
+        "spreadsheet_id": "a" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    },
+    # User for ZZ test
+    "test-session-zz": {
+        "id": "test-id-11",
+        "spreadsheet_id": "b" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    }
+}
+
+# Serialized once at import; each test only writes these bytes
+_TEST_PREFERENCES_JSON = json.dumps(TEST_PREFERENCES, indent=2).encode()
 
 
 @pytest.fixture(autouse=True)
@@ -36,112 +171,11 @@ def setup_test_data(tmp_path, monkeypatch):
 
     # Mock the storage file path
     monkeypatch.setattr(UserPreference, "STORAGE_FILE", test_storage / "user_preferences.json")
-
-    # Create test user preferences
-    test_prefs = {
-        # User with configured column mappings
-        "test-session-configured": {
-            "id": "test-id-1",
-            "spreadsheet_id": "1" * 44,
-            "sheet_tab_name": "Sheet1",
-            "column_mappings": {
-                "date": "A",
-                "description": "B",
-                "price": "C"
-            },
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User without column mappings
-        "test-session-unconfigured": {
-            "id": "test-id-2",
-            "spreadsheet_id": "2" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User with duplicate column mappings
-        "test-session-with-duplicates": {
-            "id": "test-id-3",
-            "spreadsheet_id": "3" * 44,
-            "sheet_tab_name": "Sheet1",
-            "column_mappings": {
-                "date": "A",
-                "description": "B",
-                "price": "A"  # Duplicate
-            },
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for valid POST test
-        "test-session-valid": {
-            "id": "test-id-4",
-            "spreadsheet_id": "4" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for non-contiguous test
-        "test-session-non-contiguous": {
-            "id": "test-id-5",
-            "spreadsheet_id": "5" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for duplicates test
-        "test-session-duplicates": {
-            "id": "test-id-6",
-            "spreadsheet_id": "6" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for invalid format test
-        "test-session-invalid": {
-            "id": "test-id-7",
-            "spreadsheet_id": "7" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for lowercase test
-        "test-session-lowercase": {
-            "id": "test-id-8",
-            "spreadsheet_id": "8" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for out of range test
-        "test-session-out-of-range": {
-            "id": "test-id-9",
-            "spreadsheet_id": "9" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for missing field test
-        "test-session-missing": {
-            "id": "test-id-10",
-            "spreadsheet_id": "a" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        },
-        # User for ZZ test
-        "test-session-zz": {
-            "id": "test-id-11",
-            "spreadsheet_id": "b" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        }
-    }
+    UserPreference.clear_cache()
+    SheetsService.clear_worksheet_cache()
 
     # Write test preferences to file
-    with open(test_storage / "user_preferences.json", "w") as f:
-        json.dump(test_prefs, f, indent=2)
+    (test_storage / "user_preferences.json").write_bytes(_TEST_PREFERENCES_JSON)
 
     yield
 
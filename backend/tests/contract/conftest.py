@@ -0,0 +1,196 @@
+"""
+Pytest fixtures shared across contract test modules.
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import orjson
+import pytest
+import yaml
+
+SPECS_DIR = Path(__file__).parents[3] / "specs"
+
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _load_contract(feature: str, name: str) -> Dict[str, Any]:
+    """
+    Load and parse a contract file from specs/<feature>/contracts/.
+
+    Each contract is parsed once per process; callers share the result and
+    must not mutate it.
+
+    Args:
+        feature: Feature spec directory (e.g. "001-feature-receipt-processing")
+        name: Contract filename, .yaml or .json
+
+    Returns:
+        Parsed contract specification
+    """
+    path = SPECS_DIR / feature / "contracts" / name
+    if path.suffix == ".json":
+        return orjson.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+# JSON Schema type name -> Python types accepted for it
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    # bool is an int subclass but never a JSON number
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+Validator = Callable[[Any, str], List[str]]
+
+
+def _compile(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile one contract schema node into a validator closure.
+
+    Supports the subset of OpenAPI 3 schema keywords used by the contracts in
+    specs/: type, nullable, enum, required, properties, minimum, maximum and
+    maxLength. The schema is walked once here; the returned closure only runs
+    the checks that apply to this node.
+
+    Args:
+        schema: Schema object from a parsed contract
+
+    Returns:
+        Function taking (instance, path) and returning a list of error messages
+    """
+    checks: List[Validator] = []
+
+    type_name = schema.get("type")
+    if type_name is not None:
+        type_check = _TYPE_CHECKS[type_name]
+
+        def check_type(value: Any, path: str) -> List[str]:
+            if type_check(value):
+                return []
+            return [f"{path}: expected {type_name}, got {type(value).__name__}"]
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value: Any, path: str) -> List[str]:
+            return [] if value in allowed else [f"{path}: {value!r} not in {allowed}"]
+
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+
+        def check_range(value: Any, path: str) -> List[str]:
+            if not _TYPE_CHECKS["number"](value):
+                return []
+            if minimum is not None and value < minimum:
+                return [f"{path}: {value} is below minimum {minimum}"]
+            if maximum is not None and value > maximum:
+                return [f"{path}: {value} is above maximum {maximum}"]
+            return []
+
+        checks.append(check_range)
+
+    if "maxLength" in schema:
+        max_length = schema["maxLength"]
+
+        def check_length(value: Any, path: str) -> List[str]:
+            if isinstance(value, str) and len(value) > max_length:
+                return [f"{path}: length {len(value)} exceeds maxLength {max_length}"]
+            return []
+
+        checks.append(check_length)
+
+    required = tuple(schema.get("required", ()))
+    properties = {
+        name: _compile(subschema)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    if required or properties:
+
+        def check_object(value: Any, path: str) -> List[str]:
+            if not isinstance(value, dict):
+                return []
+            errors = [
+                f"{path}: missing required field {name!r}"
+                for name in required
+                if name not in value
+            ]
+            for name, validate in properties.items():
+                if name in value:
+                    errors.extend(validate(value[name], f"{path}.{name}"))
+            return errors
+
+        checks.append(check_object)
+
+    nullable = schema.get("nullable", False)
+
+    def validate(value: Any, path: str = "$") -> List[str]:
+        if value is None and nullable:
+            return []
+        errors: List[str] = []
+        for check in checks:
+            errors.extend(check(value, path))
+        return errors
+
+    return validate
+
+
+@pytest.fixture(scope="session")
+def compile_schema() -> Callable[[Dict[str, Any]], Validator]:
+    """
+    Provide the contract schema compiler.
+
+    Test modules build their response validators from it in session-scoped
+    fixtures, so each schema is compiled once and every test reuses it.
+    """
+    return _compile
+
+
+@pytest.fixture(scope="session")
+def load_contract(pytestconfig: pytest.Config) -> Callable[[str, str], Dict[str, Any]]:
+    """
+    Provide the cached contract loader, called as load_contract(feature, name).
+
+    Parsed YAML contracts are also stored as JSON in the pytest cache
+    directory, keyed by the file's mtime and size, so later sessions skip
+    YAML parsing until the contract changes.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        # cacheprovider plugin disabled (-p no:cacheprovider)
+        return _load_contract
+
+    @lru_cache(maxsize=None)
+    def load(feature: str, name: str) -> Dict[str, Any]:
+        path = SPECS_DIR / feature / "contracts" / name
+        if path.suffix == ".json":
+            return _load_contract(feature, name)
+
+        stat = path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        key = f"contracts/{feature}/{name}"
+        entry = cache.get(key, None)
+        if entry is not None and entry.get("stamp") == stamp:
+            return entry["spec"]
+
+        spec = _load_contract(feature, name)
+        try:
+            cache.set(key, {"stamp": stamp, "spec": spec})
+        except TypeError:
+            # YAML-only values (e.g. unquoted dates) have no JSON form
+            pass
+        return spec
+
+    return load
@@ -5,16 +5,12 @@ These tests MUST FAIL until the auth endpoints are implemented.
 """
 import pytest
 from httpx import AsyncClient
-import yaml
-from pathlib import Path
 
 
-@pytest.fixture
-def auth_contract():
-    """Load auth API contract specification."""
-    contract_path = Path(__file__).parents[3] / "specs" / "001-feature-receipt-processing" / "contracts" / "auth-api.yaml"
-    with open(contract_path) as f:
-        return yaml.safe_load(f)
+@pytest.fixture(scope="session")
+def auth_contract(load_contract):
+    """Load auth API contract specification (parsed once per session)."""
+    return load_contract("001-feature-receipt-processing", "auth-api.yaml")
 
 
 @pytest.mark.contract
@@ -5,22 +5,12 @@ These tests MUST FAIL until the column config POST endpoint is implemented.
 """
 import pytest
 from httpx import AsyncClient
-import json
-from pathlib import Path
-
-
-@pytest.fixture
-def save_column_mappings_contract():
-    """Load POST column mappings API contract specification."""
-    contract_path = (
-        Path(__file__).parents[3]
-        / "specs"
-        / "002-feature-select-column"
-        / "contracts"
-        / "save-column-mappings.json"
-    )
-    with open(contract_path) as f:
-        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def save_column_mappings_contract(load_contract):
+    """Load POST column mappings API contract specification (parsed once per session)."""
+    return load_contract("002-feature-select-column", "save-column-mappings.json")
 
 
 @pytest.mark.contract
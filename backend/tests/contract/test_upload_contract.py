@@ -5,64 +5,97 @@ These tests MUST FAIL until the upload endpoint is implemented.
 """
 import pytest
 from httpx import AsyncClient
-import yaml
-from pathlib import Path
-import io
+from typing import AsyncIterator, Dict, Tuple
 
 
-@pytest.fixture
-def upload_contract():
-    """Load upload API contract specification."""
-    contract_path = Path(__file__).parents[3] / "specs" / "001-feature-receipt-processing" / "contracts" / "upload-api.yaml"
-    with open(contract_path) as f:
-        return yaml.safe_load(f)
+# Mock upload bodies; httpx accepts bytes as file content directly
+FAKE_JPEG = b"fake image content"
+FAKE_PDF = b"%PDF-1.4 fake pdf content"
+
+_BOUNDARY = "contract-test-boundary"
+_ZERO_CHUNK = bytes(64 * 1024)
+
+
+def streamed_upload(
+    filename: str, content_type: str, size: int
+) -> Tuple[Dict[str, str], AsyncIterator[bytes]]:
+    """
+    Build a multipart upload of ``size`` zero bytes without materializing it.
+
+    Args:
+        filename: Filename sent in the form part
+        content_type: Content-Type of the form part
+        size: Number of file bytes
+
+    Returns:
+        Tuple of (request headers including the exact Content-Length,
+        async iterator producing the multipart body in 64KB chunks)
+    """
+    head = (
+        f"--{_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{_BOUNDARY}--\r\n".encode()
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={_BOUNDARY}",
+        "Content-Length": str(len(head) + size + len(tail)),
+    }
+
+    async def body() -> AsyncIterator[bytes]:
+        yield head
+        remaining = size
+        while remaining > 0:
+            chunk = _ZERO_CHUNK[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+        yield tail
+
+    return headers, body()
+
+
+@pytest.fixture(scope="session")
+def upload_contract(load_contract):
+    """Load upload API contract specification (parsed once per session)."""
+    return load_contract("001-feature-receipt-processing", "upload-api.yaml")
+
+
+@pytest.fixture(scope="session")
+def upload_response_validator(upload_contract, compile_schema):
+    """Compile the upload 200 response schema once per session."""
+    responses = upload_contract["paths"]["/api/v1/upload"]["post"]["responses"]
+    return compile_schema(responses["200"]["content"]["application/json"]["schema"])
 
 
 @pytest.mark.contract
 @pytest.mark.asyncio
-async def test_upload_valid_file_returns_200_with_schema(client: AsyncClient, upload_contract):
+async def test_upload_valid_file_returns_200_with_schema(
+    client: AsyncClient, upload_response_validator
+):
     """Test valid multipart/form-data upload returns 200 with correct schema."""
-    # Create a mock JPG file
-    file_content = b"fake image content"
-    files = {"file": ("receipt.jpg", io.BytesIO(file_content), "image/jpeg")}
+    # Upload a mock JPG file
+    files = {"file": ("receipt.jpg", FAKE_JPEG, "image/jpeg")}
 
     response = await client.post("/api/v1/upload", files=files)
 
     assert response.status_code == 200, "Expected 200 OK for valid upload"
 
     data = response.json()
-    schema = upload_contract["paths"]["/api/v1/upload"]["post"]["responses"]["200"]["content"]["application/json"]["schema"]
 
-    # Validate response schema
-    assert "receipt_id" in data, "Missing receipt_id field"
-    assert "status" in data, "Missing status field"
-    assert "extracted_data" in data, "Missing extracted_data field"
-
-    # Validate field types
-    assert isinstance(data["receipt_id"], str), "receipt_id must be string"
-    assert data["status"] in ["completed", "failed"], "status must be 'completed' or 'failed'"
-
-    # Validate extracted_data structure
-    if data["extracted_data"] is not None:
-        extracted = data["extracted_data"]
-        if "transaction_date" in extracted and extracted["transaction_date"] is not None:
-            assert isinstance(extracted["transaction_date"], str), "transaction_date must be string"
-        if "items" in extracted and extracted["items"] is not None:
-            assert isinstance(extracted["items"], str), "items must be string"
-            assert len(extracted["items"]) <= 500, "items must be max 500 chars"
-        if "total_amount" in extracted and extracted["total_amount"] is not None:
-            assert isinstance(extracted["total_amount"], (int, float)), "total_amount must be number"
+    # Validate required fields, field types, status enum and the
+    # extracted_data structure (nullable fields, items max 500 chars)
+    assert upload_response_validator(data) == [], "Response does not match upload contract"
 
 
 @pytest.mark.contract
 @pytest.mark.asyncio
 async def test_upload_file_too_large_returns_400(client: AsyncClient):
     """Test file size >5MB returns 400 with FILE_TOO_LARGE error."""
-    # Create a mock file >5MB
-    large_content = b"x" * (5 * 1024 * 1024 + 1)  # 5MB + 1 byte
-    files = {"file": ("large.jpg", io.BytesIO(large_content), "image/jpeg")}
+    # Stream a mock file >5MB; the body is generated lazily, so a rejection
+    # on Content-Length sends (almost) none of it
+    headers, body = streamed_upload("large.jpg", "image/jpeg", 5 * 1024 * 1024 + 1)  # 5MB + 1 byte
 
-    response = await client.post("/api/v1/upload", files=files)
+    response = await client.post("/api/v1/upload", content=body, headers=headers)
 
     assert response.status_code == 400, "Expected 400 Bad Request for oversized file"
 
@@ -75,8 +108,7 @@ async def test_upload_file_too_large_returns_400(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_upload_invalid_format_returns_400(client: AsyncClient):
     """Test invalid format (PDF) returns 400 with INVALID_FORMAT error."""
-    file_content = b"%PDF-1.4 fake pdf content"
-    files = {"file": ("receipt.pdf", io.BytesIO(file_content), "application/pdf")}
+    files = {"file": ("receipt.pdf", FAKE_PDF, "application/pdf")}
 
     response = await client.post("/api/v1/upload", files=files)
 
@@ -104,8 +136,7 @@ async def test_upload_missing_file_returns_400(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_upload_response_includes_processing_time(client: AsyncClient):
     """Test successful upload includes processing_time_ms in response."""
-    file_content = b"fake image content"
-    files = {"file": ("receipt.jpg", io.BytesIO(file_content), "image/jpeg")}
+    files = {"file": ("receipt.jpg", FAKE_JPEG, "image/jpeg")}
 
     response = await client.post("/api/v1/upload", files=files)
 
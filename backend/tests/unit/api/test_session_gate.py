@@ -0,0 +1,67 @@
+"""
+Unit tests for SessionGateMiddleware.
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from backend.src.api.middleware.session_gate import SessionGateMiddleware
+
+
+async def session_probe(request: Request) -> JSONResponse:
+    """Report whether the request has a session, counting visits in it if so."""
+    if "session" not in request.scope:
+        return JSONResponse({"has_session": False})
+    request.session["visits"] = request.session.get("visits", 0) + 1
+    return JSONResponse({"has_session": True, "visits": request.session["visits"]})
+
+
+@pytest.fixture
+async def gated_client():
+    """Client for an app that probes the session on API and non-API paths."""
+    app = Starlette(
+        routes=[
+            Route("/api/v1/auth/status", session_probe),
+            Route("/", session_probe),
+            Route("/static/css/styles.css", session_probe),
+            Route("/health", session_probe),
+            Route("/apiary", session_probe),
+        ],
+        middleware=[Middleware(SessionGateMiddleware, secret_key="test-secret")],
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestSessionGateMiddleware:
+    """Tests for which paths SessionGateMiddleware gives a session."""
+
+    async def test_api_requests_get_a_session(self, gated_client):
+        """Test /api/ requests have a session and get the signed cookie."""
+        response = await gated_client.get("/api/v1/auth/status")
+
+        assert response.json() == {"has_session": True, "visits": 1}
+        assert "session" in response.cookies
+
+    async def test_api_session_persists_across_requests(self, gated_client):
+        """Test the session cookie is read back on the next /api/ request."""
+        await gated_client.get("/api/v1/auth/status")
+        await gated_client.get("/api/v1/auth/status")
+
+        response = await gated_client.get("/api/v1/auth/status")
+
+        assert response.json() == {"has_session": True, "visits": 3}
+
+    @pytest.mark.parametrize("path", ["/", "/static/css/styles.css", "/health", "/apiary"])
+    async def test_other_paths_skip_the_session(self, gated_client, path):
+        """Test pages, static files and the health check never load or set the session."""
+        await gated_client.get("/api/v1/auth/status")
+
+        response = await gated_client.get(path)
+
+        assert response.json() == {"has_session": False}
+        assert "set-cookie" not in response.headers
@@ -0,0 +1,168 @@
+"""
+Unit tests for CachedStaticFiles.
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from backend.src.api.static_files import CachedStaticFiles
+
+# Compressible and above the gzip minimum size used below
+CSS_CONTENT = b"body { margin: 0; padding: 0; }\n" * 64
+PNG_CONTENT = b"\x89PNG\r\n\x1a\n" + bytes(2048)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a static directory next to a file that must not be served."""
+    directory = tmp_path / "static"
+    (directory / "css").mkdir(parents=True)
+    (directory / "css" / "app.css").write_bytes(CSS_CONTENT)
+    (directory / "logo.png").write_bytes(PNG_CONTENT)
+    (directory / "small.txt").write_bytes(b"tiny")
+    (tmp_path / "secret.txt").write_bytes(b"do not serve")
+    return directory
+
+
+def make_client(static_app) -> AsyncClient:
+    """Build a client for an app with static_app mounted at /static."""
+    app = Starlette(routes=[Mount("/static", static_app)])
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+async def cached_client(static_dir):
+    """Client for CachedStaticFiles over static_dir."""
+    static_app = CachedStaticFiles(directory=static_dir, gzip_minimum_size=1024)
+    async with make_client(static_app) as client:
+        yield client
+
+
+@pytest.fixture
+async def reference_client(static_dir):
+    """Client for Starlette's StaticFiles over the same directory."""
+    async with make_client(StaticFiles(directory=static_dir)) as client:
+        yield client
+
+
+class TestCachedStaticFilesResponses:
+    """Tests for responses served from the in-memory cache."""
+
+    @pytest.mark.parametrize("path", [
+        "/static/css/app.css",
+        "/static/logo.png",
+        "/static/small.txt",
+    ])
+    async def test_matches_static_files(self, cached_client, reference_client, path):
+        """Test body and headers equal what StaticFiles sends."""
+        headers = {"Accept-Encoding": "identity"}
+
+        cached = await cached_client.get(path, headers=headers)
+        reference = await reference_client.get(path, headers=headers)
+
+        assert cached.status_code == 200
+        assert cached.content == reference.content
+        assert dict(cached.headers) == dict(reference.headers)
+
+    async def test_if_none_match_returns_304(self, cached_client):
+        """Test a matching ETag yields 304 Not Modified without a body."""
+        first = await cached_client.get("/static/css/app.css")
+
+        response = await cached_client.get(
+            "/static/css/app.css", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+    async def test_stale_etag_returns_200(self, cached_client):
+        """Test a different ETag gets the full file."""
+        response = await cached_client.get(
+            "/static/css/app.css", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+
+    async def test_range_request_falls_back_to_static_files(self, cached_client):
+        """Test Range requests are answered with a partial response."""
+        response = await cached_client.get(
+            "/static/css/app.css", headers={"Range": "bytes=0-9", "Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == CSS_CONTENT[:10]
+        assert "content-encoding" not in response.headers
+
+    async def test_unknown_file_returns_404(self, cached_client):
+        """Test a path outside the cache is a 404."""
+        response = await cached_client.get("/static/missing.js")
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("path", [
+        "/static/%2e%2e/secret.txt",
+        "/static/..%2fsecret.txt",
+        "/static/css/%2e%2e/%2e%2e/secret.txt",
+    ])
+    async def test_path_traversal_returns_404(self, cached_client, path):
+        """Test a path escaping the directory does not serve the file outside it."""
+        response = await cached_client.get(path)
+
+        assert response.status_code == 404
+        assert b"do not serve" not in response.content
+
+    async def test_other_methods_return_405(self, cached_client):
+        """Test methods other than GET and HEAD are rejected as by StaticFiles."""
+        response = await cached_client.post("/static/css/app.css")
+
+        assert response.status_code == 405
+
+
+class TestCachedStaticFilesGzip:
+    """Tests for the gzip variants built at startup."""
+
+    async def test_gzip_variant_served_when_accepted(self, cached_client):
+        """Test a compressible file is sent precompressed to gzip clients."""
+        response = await cached_client.get(
+            "/static/css/app.css", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(CSS_CONTENT)
+        # httpx decodes the body
+        assert response.content == CSS_CONTENT
+
+    async def test_identity_served_without_gzip(self, cached_client):
+        """Test clients that do not accept gzip get the file as is."""
+        response = await cached_client.get(
+            "/static/css/app.css", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(CSS_CONTENT)
+
+    @pytest.mark.parametrize("path", ["/static/logo.png", "/static/small.txt"])
+    async def test_excluded_and_small_files_are_not_precompressed(self, cached_client, path):
+        """Test images and files under gzip_minimum_size are never gzipped."""
+        response = await cached_client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    async def test_gzip_variant_if_none_match_returns_304(self, cached_client):
+        """Test the gzip variant answers conditional requests too."""
+        headers = {"Accept-Encoding": "gzip"}
+        first = await cached_client.get("/static/css/app.css", headers=headers)
+
+        response = await cached_client.get(
+            "/static/css/app.css", headers={**headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == first.headers["etag"]
+        assert response.headers["vary"] == "Accept-Encoding"
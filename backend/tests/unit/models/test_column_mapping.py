@@ -6,65 +6,99 @@ import pytest
 from backend.src.models.column_mapping import ColumnMappingConfiguration
 
 
+@pytest.fixture(scope="module")
+def abc_mapping():
+    """Shared read-only (A, B, C) mapping for tests that only inspect it."""
+    return ColumnMappingConfiguration(
+        date_column="A",
+        description_column="B",
+        price_column="C"
+    )
+
+
+@pytest.fixture
+def make_mapping():
+    """Factory for fresh mappings, for tests that need their own instance."""
+    def make(
+        date_column: str, description_column: str, price_column: str
+    ) -> ColumnMappingConfiguration:
+        return ColumnMappingConfiguration(
+            date_column=date_column,
+            description_column=description_column,
+            price_column=price_column
+        )
+    return make
+
+
 class TestColumnMappingConfigurationValidate:
     """Tests for ColumnMappingConfiguration.validate() method."""
 
-    def test_validate_valid_config_ABC_returns_true(self):
+    def test_validate_valid_config_ABC_returns_true(self, abc_mapping):
         """Test validate with valid config (A, B, C) returns (True, None)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="C"
-        )
-        is_valid, error = config.validate()
+        is_valid, error = abc_mapping.validate()
         assert is_valid is True
         assert error is None
 
-    def test_validate_with_missing_date_column_returns_false(self):
+    def test_validate_with_missing_date_column_returns_false(self, make_mapping):
         """Test validate with empty date_column returns (False, error)."""
-        config = ColumnMappingConfiguration(
-            date_column="",
-            description_column="B",
-            price_column="C"
-        )
+        config = make_mapping("", "B", "C")
         is_valid, error = config.validate()
         assert is_valid is False
         assert error is not None
 
-    def test_validate_with_invalid_column_format_returns_false(self):
+    def test_validate_with_invalid_column_format_returns_false(self, make_mapping):
         """Test validate with invalid format (A1) returns (False, error)."""
-        config = ColumnMappingConfiguration(
-            date_column="A1",
-            description_column="B",
-            price_column="C"
-        )
+        config = make_mapping("A1", "B", "C")
         is_valid, error = config.validate()
         assert is_valid is False
         assert "INVALID_COLUMN_FORMAT" in error
 
-    def test_validate_with_out_of_range_column_returns_false(self):
+    def test_validate_with_out_of_range_column_returns_false(self, make_mapping):
         """Test validate with out-of-range column (AAA) returns (False, error)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="AAA"
-        )
+        config = make_mapping("A", "B", "AAA")
         is_valid, error = config.validate()
         assert is_valid is False
         assert "COLUMN_OUT_OF_RANGE" in error
 
 
+class TestColumnMappingConfigurationGetValidationError:
+    """Tests for ColumnMappingConfiguration.get_validation_error() method."""
+
+    def test_get_validation_error_returns_none_for_valid_config(self, abc_mapping):
+        """Test get_validation_error with valid config (A, B, C) returns None."""
+        assert abc_mapping.get_validation_error() is None
+
+    def test_get_validation_error_identifies_field_and_code(self, make_mapping):
+        """Test get_validation_error reports the failing field and validator error code."""
+        config = make_mapping("A", "b", "AAA")
+        error = config.get_validation_error()
+
+        assert error.field == "description_column"
+        assert error.error_code == "INVALID_COLUMN_FORMAT"
+        assert error.message == "description_column: INVALID_COLUMN_FORMAT"
+
+    def test_get_validation_error_reports_missing_field(self, make_mapping):
+        """Test get_validation_error with empty price_column returns MISSING_REQUIRED_FIELD."""
+        config = make_mapping("A", "B", "  ")
+        error = config.get_validation_error()
+
+        assert error.field == "price_column"
+        assert error.error_code == "MISSING_REQUIRED_FIELD"
+
+    def test_get_validation_error_shared_by_equal_configs(self, make_mapping):
+        """Test equal configurations reuse one memoized (immutable) error."""
+        first = make_mapping("A", "b", "C").get_validation_error()
+        second = make_mapping("A", "b", "C").get_validation_error()
+
+        assert first is second
+
+
 class TestColumnMappingConfigurationToDict:
     """Tests for ColumnMappingConfiguration.to_dict() method."""
 
-    def test_to_dict_returns_correct_format(self):
+    def test_to_dict_returns_correct_format(self, abc_mapping):
         """Test to_dict returns correct dictionary format."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="C"
-        )
-        result = config.to_dict()
+        result = abc_mapping.to_dict()
 
         assert result == {
             "date": "A",
@@ -72,13 +106,9 @@ class TestColumnMappingConfigurationToDict:
             "price": "C"
         }
 
-    def test_to_dict_with_non_contiguous_columns(self):
+    def test_to_dict_with_non_contiguous_columns(self, make_mapping):
         """Test to_dict with non-contiguous columns (A, C, F)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="C",
-            price_column="F"
-        )
+        config = make_mapping("A", "C", "F")
         result = config.to_dict()
 
         assert result == {
@@ -121,114 +151,73 @@ class TestColumnMappingConfigurationFromDict:
 class TestColumnMappingConfigurationGetColumnIndex:
     """Tests for ColumnMappingConfiguration.get_column_index() method."""
 
-    def test_get_column_index_A_returns_0(self):
+    def test_get_column_index_A_returns_0(self, abc_mapping):
         """Test get_column_index('A') returns 0."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="C"
-        )
-        index = config.get_column_index("A")
+        index = abc_mapping.get_column_index("A")
         assert index == 0
 
-    def test_get_column_index_AA_returns_26(self):
+    def test_get_column_index_AA_returns_26(self, make_mapping):
         """Test get_column_index('AA') returns 26."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="AA",
-            price_column="C"
-        )
+        config = make_mapping("A", "AA", "C")
         index = config.get_column_index("AA")
         assert index == 26
 
-    def test_get_column_index_ZZ_returns_701(self):
+    def test_get_column_index_ZZ_returns_701(self, make_mapping):
         """Test get_column_index('ZZ') returns 701."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="ZZ"
-        )
+        config = make_mapping("A", "B", "ZZ")
         index = config.get_column_index("ZZ")
         assert index == 701
 
 
-class TestColumnMappingConfigurationHasDuplicates:
-    """Tests for ColumnMappingConfiguration.has_duplicates() method."""
+class TestColumnMappingConfigurationGetColumnIndices:
+    """Tests for ColumnMappingConfiguration.get_column_indices() method."""
 
-    def test_has_duplicates_returns_false_for_unique_columns(self):
-        """Test has_duplicates returns False for unique columns (A, B, C)."""
-        config = ColumnMappingConfiguration(
+    def test_get_column_indices_returns_field_order(self, make_mapping):
+        """Test indices are returned as (date, description, price)."""
+        config = make_mapping("C", "AA", "A")
+        assert config.get_column_indices() == (2, 26, 0)
+
+    def test_get_column_indices_is_reused(self, make_mapping):
+        """Test repeated calls return the same tuple."""
+        config = make_mapping("A", "B", "ZZ")
+        assert config.get_column_indices() is config.get_column_indices()
+
+    def test_cached_indices_do_not_affect_equality(self, make_mapping):
+        """Test a config with computed indices still equals a fresh one."""
+        config = make_mapping("A", "B", "C")
+        config.get_column_indices()
+        assert config == ColumnMappingConfiguration(
             date_column="A",
             description_column="B",
             price_column="C"
         )
-        assert config.has_duplicates() is False
 
-    def test_has_duplicates_returns_true_for_duplicate_columns(self):
-        """Test has_duplicates returns True for duplicate columns (A, B, A)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="A"
-        )
-        assert config.has_duplicates() is True
 
-    def test_has_duplicates_returns_true_for_all_same_columns(self):
-        """Test has_duplicates returns True when all columns are the same (A, A, A)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="A",
-            price_column="A"
-        )
-        assert config.has_duplicates() is True
+# (date, description, price) mappings and the fields sharing each column
+DUPLICATE_CASES = [
+    (("A", "B", "C"), {}),
+    (("A", "B", "A"), {"A": {"date", "price"}}),
+    (("A", "A", "A"), {"A": {"date", "description", "price"}}),
+    (("A", "A", "B"), {"A": {"date", "description"}}),  # B is only used once
+]
+DUPLICATE_CASE_IDS = ["ABC", "ABA", "AAA", "AAB"]
 
 
-class TestColumnMappingConfigurationGetDuplicateColumns:
-    """Tests for ColumnMappingConfiguration.get_duplicate_columns() method."""
-
-    def test_get_duplicate_columns_returns_empty_for_unique(self):
-        """Test get_duplicate_columns returns empty dict for unique columns."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="C"
-        )
-        duplicates = config.get_duplicate_columns()
-        assert duplicates == {}
-
-    def test_get_duplicate_columns_returns_correct_mapping_for_date_price_duplicate(self):
-        """Test get_duplicate_columns returns correct mapping for (A, B, A)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="B",
-            price_column="A"
-        )
-        duplicates = config.get_duplicate_columns()
+class TestColumnMappingConfigurationHasDuplicates:
+    """Tests for ColumnMappingConfiguration.has_duplicates() method."""
 
-        assert "A" in duplicates
-        assert set(duplicates["A"]) == {"date", "price"}
+    @pytest.mark.parametrize("columns,duplicates", DUPLICATE_CASES, ids=DUPLICATE_CASE_IDS)
+    def test_has_duplicates(self, make_mapping, columns, duplicates):
+        """Test has_duplicates is True exactly when two fields share a column."""
+        assert make_mapping(*columns).has_duplicates() is bool(duplicates)
 
-    def test_get_duplicate_columns_returns_correct_mapping_for_all_same(self):
-        """Test get_duplicate_columns for all same columns (A, A, A)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="A",
-            price_column="A"
-        )
-        duplicates = config.get_duplicate_columns()
 
-        assert "A" in duplicates
-        assert set(duplicates["A"]) == {"date", "description", "price"}
+class TestColumnMappingConfigurationGetDuplicateColumns:
+    """Tests for ColumnMappingConfiguration.get_duplicate_columns() method."""
 
-    def test_get_duplicate_columns_with_multiple_duplicate_sets(self):
-        """Test get_duplicate_columns with multiple duplicate sets (A, B, A, B would be impossible with 3 fields, so test A, A, B)."""
-        config = ColumnMappingConfiguration(
-            date_column="A",
-            description_column="A",
-            price_column="B"
-        )
-        duplicates = config.get_duplicate_columns()
+    @pytest.mark.parametrize("columns,duplicates", DUPLICATE_CASES, ids=DUPLICATE_CASE_IDS)
+    def test_get_duplicate_columns(self, make_mapping, columns, duplicates):
+        """Test get_duplicate_columns maps each shared column to its fields."""
+        result = make_mapping(*columns).get_duplicate_columns()
 
-        assert "A" in duplicates
-        assert set(duplicates["A"]) == {"date", "description"}
-        assert "B" not in duplicates  # B is only used once
+        assert {column: set(fields) for column, fields in result.items()} == duplicates
@@ -88,19 +88,21 @@ class TestUserPreferenceSetColumnMappings:
             "price": "C"
         }
 
-    def test_set_column_mappings_updates_last_updated_at(self):
+    def test_set_column_mappings_updates_last_updated_at(self, monkeypatch):
         """Test set_column_mappings updates last_updated_at timestamp."""
+        original_updated_at = datetime(2024, 1, 1, 0, 0, 0)
         user_pref = UserPreference(
             user_session_id="test-session",
             spreadsheet_id="1" * 44,
-            sheet_tab_name="Sheet1"
+            sheet_tab_name="Sheet1",
+            last_updated_at=original_updated_at
         )
 
-        original_updated_at = user_pref.last_updated_at
-
-        # Add a small delay to ensure timestamp changes
-        import time
-        time.sleep(0.001)
+        # Controlled clock instead of sleeping until the real one ticks
+        monkeypatch.setattr(
+            "backend.src.models.user_preference._utcnow",
+            lambda: datetime(2024, 1, 1, 0, 0, 1)
+        )
 
         config = ColumnMappingConfiguration(
             date_column="A",
@@ -114,13 +116,20 @@ class TestUserPreferenceSetColumnMappings:
         assert user_pref.last_updated_at > original_updated_at
 
 
+@pytest.fixture
+def captured_save():
+    """Patch the filesystem so save() writes into a mock file; yields (mock_file, mock_replace)."""
+    with patch("pathlib.Path.mkdir"), \
+            patch("pathlib.Path.exists", return_value=False), \
+            patch("builtins.open", new_callable=mock_open) as mock_file, \
+            patch("os.replace") as mock_replace:
+        yield mock_file, mock_replace
+
+
 class TestUserPreferenceSaveWithColumnMappings:
     """Tests for UserPreference.save() method with column_mappings."""
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists", return_value=False)
-    @patch("pathlib.Path.mkdir")
-    def test_save_persists_column_mappings_to_json(self, mock_mkdir, mock_exists, mock_file):
+    def test_save_persists_column_mappings_to_json(self, captured_save):
         """Test save() includes column_mappings in JSON file."""
         user_pref = UserPreference(
             user_session_id="test-session",
@@ -130,14 +139,14 @@ class TestUserPreferenceSaveWithColumnMappings:
         )
 
         user_pref.save()
+        mock_file, mock_replace = captured_save
 
-        # Verify file was written
+        # Verify file was written and moved into place
         mock_file.assert_called()
+        mock_replace.assert_called_once()
 
         # Get the written content
-        written_data = ""
-        for call in mock_file().write.call_args_list:
-            written_data += call[0][0]
+        written_data = b"".join(call[0][0] for call in mock_file().write.call_args_list)
 
         saved_data = json.loads(written_data)
 
@@ -150,20 +159,44 @@ class TestUserPreferenceSaveWithColumnMappings:
         }
 
 
+# Parsed storage contents served to the load_by_session_id() tests
+STORED_WITHOUT_MAPPINGS = {
+    "test-session": {
+        "id": "test-id",
+        "spreadsheet_id": "1" * 44,
+        "sheet_tab_name": "Sheet1",
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    }
+}
+STORED_WITH_MAPPINGS = {
+    "test-session": {
+        "id": "test-id",
+        "spreadsheet_id": "1" * 44,
+        "sheet_tab_name": "Sheet1",
+        "column_mappings": {
+            "date": "A",
+            "description": "B",
+            "price": "C"
+        },
+        "created_at": "2024-01-01T00:00:00",
+        "last_updated_at": "2024-01-01T00:00:00"
+    }
+}
+
+
+@pytest.fixture
+def stored_preferences(request, monkeypatch):
+    """Serve request.param as the stored preferences (use with indirect=True)."""
+    monkeypatch.setattr(UserPreference, "_read_store", classmethod(lambda cls: request.param))
+    return request.param
+
+
 class TestUserPreferenceLoadBySessionIdWithColumnMappings:
     """Tests for UserPreference.load_by_session_id() with column_mappings."""
 
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({
-        "test-session": {
-            "id": "test-id",
-            "spreadsheet_id": "1" * 44,
-            "sheet_tab_name": "Sheet1",
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        }
-    }))
-    def test_load_by_session_id_loads_preference_without_column_mappings(self, mock_file, mock_exists):
+    @pytest.mark.parametrize("stored_preferences", [STORED_WITHOUT_MAPPINGS], indirect=True)
+    def test_load_by_session_id_loads_preference_without_column_mappings(self, stored_preferences):
         """Test load_by_session_id loads preference without column_mappings (backward compat)."""
         user_pref = UserPreference.load_by_session_id("test-session")
 
@@ -171,22 +204,8 @@ class TestUserPreferenceLoadBySessionIdWithColumnMappings:
         assert user_pref.user_session_id == "test-session"
         assert user_pref.has_column_mappings() is False
 
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({
-        "test-session": {
-            "id": "test-id",
-            "spreadsheet_id": "1" * 44,
-            "sheet_tab_name": "Sheet1",
-            "column_mappings": {
-                "date": "A",
-                "description": "B",
-                "price": "C"
-            },
-            "created_at": "2024-01-01T00:00:00",
-            "last_updated_at": "2024-01-01T00:00:00"
-        }
-    }))
-    def test_load_by_session_id_loads_preference_with_column_mappings(self, mock_file, mock_exists):
+    @pytest.mark.parametrize("stored_preferences", [STORED_WITH_MAPPINGS], indirect=True)
+    def test_load_by_session_id_loads_preference_with_column_mappings(self, stored_preferences):
         """Test load_by_session_id loads preference with column_mappings."""
         user_pref = UserPreference.load_by_session_id("test-session")
 
@@ -198,3 +217,68 @@ class TestUserPreferenceLoadBySessionIdWithColumnMappings:
         assert mappings.date_column == "A"
         assert mappings.description_column == "B"
         assert mappings.price_column == "C"
+
+
+class TestUserPreferenceLoadCache:
+    """Tests for the in-process cache behind UserPreference.load_by_session_id()."""
+
+    def test_load_returns_independent_copies(self):
+        """Test mutating a loaded preference does not leak into later loads."""
+        first = UserPreference.load_by_session_id("test-session-configured")
+        first.column_mappings["date"] = "Z"
+
+        second = UserPreference.load_by_session_id("test-session-configured")
+
+        assert second is not first
+        assert second.column_mappings["date"] == "A"
+
+    def test_save_invalidates_cached_preference(self):
+        """Test save() makes the next load reflect the new column mappings."""
+        user_pref = UserPreference.load_by_session_id("test-session-unconfigured")
+        assert user_pref.has_column_mappings() is False
+
+        user_pref.set_column_mappings(ColumnMappingConfiguration(
+            date_column="D",
+            description_column="E",
+            price_column="F"
+        ))
+        user_pref.save()
+
+        reloaded = UserPreference.load_by_session_id("test-session-unconfigured")
+        assert reloaded.column_mappings == {"date": "D", "description": "E", "price": "F"}
+
+    def test_external_file_change_is_picked_up(self):
+        """Test edits to the storage file made outside the model are not masked by the cache."""
+        assert UserPreference.load_by_session_id("test-session-external") is None
+
+        with open(UserPreference.STORAGE_FILE) as f:
+            preferences = json.load(f)
+        preferences["test-session-external"] = dict(preferences["test-session-valid"])
+        with open(UserPreference.STORAGE_FILE, "w") as f:
+            json.dump(preferences, f)
+
+        user_pref = UserPreference.load_by_session_id("test-session-external")
+        assert user_pref is not None
+        assert user_pref.user_session_id == "test-session-external"
+
+    def test_save_replaces_file_without_leaving_temp_file(self):
+        """Test save() swaps in the new file and keeps other users' preferences."""
+        user_pref = UserPreference.load_by_session_id("test-session-valid")
+        user_pref.sheet_tab_name = "Sheet2"
+        user_pref.save()
+
+        storage_dir = UserPreference.STORAGE_FILE.parent
+        assert [p.name for p in storage_dir.iterdir()] == [UserPreference.STORAGE_FILE.name]
+
+        with open(UserPreference.STORAGE_FILE) as f:
+            preferences = json.load(f)
+        assert preferences["test-session-valid"]["sheet_tab_name"] == "Sheet2"
+        assert "test-session-configured" in preferences
+
+    def test_delete_removes_only_that_user(self):
+        """Test delete() drops the user's entry and later loads see it gone."""
+        user_pref = UserPreference.load_by_session_id("test-session-valid")
+        user_pref.delete()
+
+        assert UserPreference.load_by_session_id("test-session-valid") is None
+        assert UserPreference.load_by_session_id("test-session-configured") is not None
@@ -0,0 +1,128 @@
+"""
+Unit tests for OCRService.
+"""
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from backend.src.services.ocr_service import OCRService
+
+
+@pytest.fixture(autouse=True)
+def clear_ocr_cache():
+    """Start and end every test with an empty OCR cache."""
+    OCRService.clear_cache()
+    yield
+    OCRService.clear_cache()
+
+
+def make_image(path, shade: int) -> str:
+    """Write a small grayscale PNG and return its path."""
+    Image.new('L', (32, 16), color=shade).save(path, format='PNG')
+    return str(path)
+
+
+class TestOCRServicePreprocess:
+    """Tests for OCRService.preprocess_image() method."""
+
+    def test_default_keeps_grayscale(self, tmp_path):
+        """Test preprocessing yields a grayscale image by default."""
+        img = OCRService.preprocess_image(make_image(tmp_path / "r.png", 200))
+
+        assert img.mode == 'L'
+        assert img.size == (32, 16)
+
+    def test_binarize_produces_bilevel_image(self, tmp_path, monkeypatch):
+        """Test BINARIZE adds contrast and 1-bit thresholding."""
+        monkeypatch.setattr(OCRService, "BINARIZE", True)
+
+        img = OCRService.preprocess_image(make_image(tmp_path / "r.png", 200))
+
+        assert img.mode == '1'
+        assert img.size == (32, 16)
+
+    def test_resize_to_target_width(self, tmp_path, monkeypatch):
+        """Test wide images are scaled down to TARGET_WIDTH."""
+        monkeypatch.setattr(OCRService, "TARGET_WIDTH", 16)
+
+        img = OCRService.preprocess_image(make_image(tmp_path / "r.png", 200))
+
+        assert img.size == (16, 8)
+
+
+class TestOCRServiceCache:
+    """Tests for OCRService.process_image() result caching."""
+
+    @patch("backend.src.services.ocr_service.pytesseract.image_to_string")
+    def test_same_content_runs_tesseract_once(self, mock_ocr, tmp_path):
+        """Test a second file with identical bytes is served from the cache."""
+        mock_ocr.return_value = "TOTAL 10.00"
+        first = make_image(tmp_path / "a.png", 200)
+        second = tmp_path / "b.png"
+        second.write_bytes((tmp_path / "a.png").read_bytes())
+
+        text1, _ = OCRService.process_image(first)
+        text2, time2 = OCRService.process_image(str(second))
+
+        assert text1 == text2 == "TOTAL 10.00"
+        assert time2 == 0
+        mock_ocr.assert_called_once()
+
+    @patch("backend.src.services.ocr_service.pytesseract.image_to_string")
+    def test_different_content_is_not_shared(self, mock_ocr, tmp_path):
+        """Test images with different bytes are processed separately."""
+        mock_ocr.side_effect = ["first", "second"]
+
+        text1, _ = OCRService.process_image(make_image(tmp_path / "a.png", 20))
+        text2, _ = OCRService.process_image(make_image(tmp_path / "b.png", 220))
+
+        assert (text1, text2) == ("first", "second")
+        assert mock_ocr.call_count == 2
+
+    @pytest.mark.parametrize("setting,value", [
+        ("PSM_MODE", 4),
+        ("TARGET_WIDTH", 16),
+        ("BINARIZE", True),
+    ])
+    @patch("backend.src.services.ocr_service.pytesseract.image_to_string")
+    def test_changed_settings_are_not_served_from_cache(
+        self, mock_ocr, setting, value, tmp_path, monkeypatch
+    ):
+        """Test a settings change reprocesses an image cached under the old settings."""
+        mock_ocr.side_effect = ["old settings", "new settings"]
+        path = make_image(tmp_path / "a.png", 200)
+
+        OCRService.process_image(path)
+        monkeypatch.setattr(OCRService, setting, value)
+        text, _ = OCRService.process_image(path)
+
+        assert text == "new settings"
+        assert mock_ocr.call_count == 2
+
+    @patch("backend.src.services.ocr_service.pytesseract.image_to_string")
+    def test_cache_evicts_least_recently_used(self, mock_ocr, tmp_path, monkeypatch):
+        """Test the cache holds at most CACHE_SIZE images."""
+        monkeypatch.setattr(OCRService, "CACHE_SIZE", 1)
+        mock_ocr.side_effect = ["a", "b", "a again"]
+        path_a = make_image(tmp_path / "a.png", 20)
+        path_b = make_image(tmp_path / "b.png", 220)
+
+        OCRService.process_image(path_a)
+        OCRService.process_image(path_b)
+        text, _ = OCRService.process_image(path_a)
+
+        assert text == "a again"
+        assert mock_ocr.call_count == 3
+
+    @patch("backend.src.services.ocr_service.pytesseract.image_to_string")
+    def test_failures_are_not_cached(self, mock_ocr, tmp_path):
+        """Test a failed OCR run is retried on the next call."""
+        mock_ocr.side_effect = [RuntimeError("tesseract missing"), "ok"]
+        path = make_image(tmp_path / "a.png", 200)
+
+        with pytest.raises(Exception, match="OCR_FAILED"):
+            OCRService.process_image(path)
+        text, _ = OCRService.process_image(path)
+
+        assert text == "ok"
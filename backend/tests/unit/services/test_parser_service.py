@@ -0,0 +1,91 @@
+"""
+Unit tests for ParserService.
+"""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from backend.src.services.parser_service import ParserService
+
+
+class TestParserServiceExtractDate:
+    """Tests for ParserService.extract_date() method."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Receipt\n2025-09-28 10:15", date(2025, 9, 28)),
+        ("09/28/2025", date(2025, 9, 28)),
+        ("28-09-2025", date(2025, 9, 28)),
+        ("Tanggal: 22 Sep 2025", date(2025, 9, 22)),
+        ("22 September 2025", date(2025, 9, 22)),
+        ("22 sept 2025", date(2025, 9, 22)),
+        ("Jan 15, 2025", date(2025, 1, 15)),
+        ("January 15, 2024", date(2024, 1, 15)),
+        ("Sept 5, 2022", date(2022, 9, 5)),
+        ("Dec. 1, 2023", date(2023, 12, 1)),
+        ("March 3 2023", date(2023, 3, 3)),
+    ])
+    def test_extract_date_known_formats(self, text, expected):
+        """Test full-confidence date formats."""
+        assert ParserService.extract_date(text) == (expected, 0.9)
+
+    def test_extract_date_skips_matches_that_are_not_dates(self):
+        """Test a textual match with an unknown month does not hide a later date."""
+        text = "Qty 2 pcs 2000\n15 Jan 2024"
+
+        assert ParserService.extract_date(text) == (date(2024, 1, 15), 0.9)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("28.09.2025", date(2025, 9, 28)),
+        ("9/28/25", date(2025, 9, 28)),
+        ("05.09.2025", date(2025, 5, 9)),
+    ])
+    def test_extract_date_short_numeric(self, text, expected):
+        """Test short numeric dates are month-first unless impossible."""
+        assert ParserService.extract_date(text) == (expected, 0.7)
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "no digits at all",
+        "Total 12.50",
+        "22 Abc 2025",
+        "31.02.2025",
+    ])
+    def test_extract_date_not_found(self, text):
+        """Test text without a recognizable date yields no date."""
+        assert ParserService.extract_date(text) == (None, 0.0)
+
+
+class TestParserServiceExtractTotalAmount:
+    """Tests for ParserService.extract_total_amount() method."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Total $15.95", Decimal("15.95")),
+        ("TOTAL Rp 300.150", Decimal("300150")),
+        ("Total 300,150", Decimal("300150")),
+        ("Total 4,50", Decimal("4.50")),
+        ("Grand Total 1,534.71", Decimal("1534.71")),
+        ("Total 1.534,71", Decimal("1534.71")),
+    ])
+    def test_total_near_keyword(self, text, expected):
+        """Test separator handling for amounts on a Total line."""
+        assert ParserService.extract_total_amount(text) == (expected, 0.95)
+
+    def test_phone_numbers_ignored(self):
+        """Test long digit runs next to a Total line are not amounts."""
+        text = "Total Rp 30.000\nTelp 081234567890"
+
+        assert ParserService.extract_total_amount(text) == (Decimal("30000"), 0.95)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Coffee 4,50\nCake 12,00", Decimal("12.00")),
+        ("Nasi goreng 25.000\nEs teh 5.000", Decimal("25000")),
+        ("Item 1.234,56", Decimal("1234.56")),
+    ])
+    def test_fallback_uses_same_separator_rules(self, text, expected):
+        """Test the no-Total fallback normalizes amounts like the Total path."""
+        assert ParserService.extract_total_amount(text) == (expected, 0.75)
+
+    def test_no_amounts(self):
+        """Test text without amounts yields no total."""
+        assert ParserService.extract_total_amount("Thank you") == (None, 0.0)
@@ -0,0 +1,133 @@
+"""
+Unit tests for SheetsAppendBatcher.
+"""
+import asyncio
+import time
+from datetime import date
+from decimal import Decimal
+
+from backend.src.models.google_sheets_row import GoogleSheetsRow
+from backend.src.models.user_preference import UserPreference
+from backend.src.services.sheets_batcher import SheetsAppendBatcher
+from backend.src.services.sheets_service import SheetsService
+
+
+def make_row(items: str) -> GoogleSheetsRow:
+    """Create a GoogleSheetsRow with the given items string."""
+    return GoogleSheetsRow.from_extracted_data(
+        transaction_date=date(2024, 1, 15),
+        items=items,
+        total_amount=Decimal("15.50")
+    )
+
+
+def make_pref(session_id: str = "test-session") -> UserPreference:
+    """Create a UserPreference with column mappings configured."""
+    return UserPreference(
+        user_session_id=session_id,
+        spreadsheet_id="1" * 44,
+        sheet_tab_name="Sheet1",
+        column_mappings={"date": "A", "description": "B", "price": "C"}
+    )
+
+
+class TestSheetsAppendBatcherSubmit:
+    """Tests for SheetsAppendBatcher.submit() method."""
+
+    async def test_single_row_uses_append_row(self, monkeypatch):
+        """Test a lone row falls back to SheetsService.append_row()."""
+        calls = []
+
+        def fake_append_row(row_data, user_pref, oauth_token, token_expiry):
+            calls.append(row_data.items)
+            return True, {"success": True, "row_number": 2}
+
+        monkeypatch.setattr(SheetsService, "append_row", staticmethod(fake_append_row))
+
+        batcher = SheetsAppendBatcher(max_delay=0.001)
+        expiry = time.time() + 3600
+        result = await batcher.submit(make_row("Coffee"), make_pref(), "token", expiry)
+
+        assert result == (True, {"success": True, "row_number": 2})
+        assert calls == ["Coffee"]
+
+    async def test_concurrent_rows_are_appended_in_one_call_in_order(self, monkeypatch):
+        """Test rows submitted together are coalesced and results fan back out in order."""
+        batches = []
+
+        def fake_append_rows(rows_data, user_pref, oauth_token, token_expiry):
+            batches.append([row.items for row in rows_data])
+            return [(True, {"success": True, "row_number": 10 + i}) for i in range(len(rows_data))]
+
+        monkeypatch.setattr(SheetsService, "append_rows", staticmethod(fake_append_rows))
+
+        batcher = SheetsAppendBatcher(max_delay=0.01)
+        expiry = time.time() + 3600
+        results = await asyncio.gather(*[
+            batcher.submit(make_row(f"Item {i}"), make_pref(), "token", expiry) for i in range(3)
+        ])
+
+        assert batches == [["Item 0", "Item 1", "Item 2"]]
+        assert [response["row_number"] for _, response in results] == [10, 11, 12]
+
+    async def test_different_users_are_not_batched_together(self, monkeypatch):
+        """Test rows for different sessions are flushed as separate appends."""
+        calls = []
+
+        def fake_append_row(row_data, user_pref, oauth_token, token_expiry):
+            calls.append(user_pref.user_session_id)
+            return True, {"success": True, "row_number": 2}
+
+        monkeypatch.setattr(SheetsService, "append_row", staticmethod(fake_append_row))
+
+        batcher = SheetsAppendBatcher(max_delay=0.001)
+        expiry = time.time() + 3600
+        await asyncio.gather(
+            batcher.submit(make_row("Coffee"), make_pref("user-a"), "token-a", expiry),
+            batcher.submit(make_row("Tea"), make_pref("user-b"), "token-b", expiry),
+        )
+
+        assert sorted(calls) == ["user-a", "user-b"]
+
+    async def test_full_batch_flushes_without_waiting(self, monkeypatch):
+        """Test a group reaching max_batch_size is flushed before max_delay elapses."""
+        def fake_append_rows(rows_data, user_pref, oauth_token, token_expiry):
+            return [(True, {"success": True, "row_number": i}) for i in range(len(rows_data))]
+
+        monkeypatch.setattr(SheetsService, "append_rows", staticmethod(fake_append_rows))
+
+        batcher = SheetsAppendBatcher(max_batch_size=2, max_delay=60)
+        expiry = time.time() + 3600
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.submit(make_row("Coffee"), make_pref(), "token", expiry),
+            batcher.submit(make_row("Tea"), make_pref(), "token", expiry),
+        ), timeout=5)
+
+        assert all(success for success, _ in results)
+
+
+class TestSheetsAppendBatcherClose:
+    """Tests for SheetsAppendBatcher.close() method."""
+
+    async def test_close_flushes_pending_rows(self, monkeypatch):
+        """Test close() appends rows still waiting for their batch timer."""
+        calls = []
+
+        def fake_append_row(row_data, user_pref, oauth_token, token_expiry):
+            calls.append(row_data.items)
+            return True, {"success": True, "row_number": 2}
+
+        monkeypatch.setattr(SheetsService, "append_row", staticmethod(fake_append_row))
+
+        batcher = SheetsAppendBatcher(max_delay=60)
+        expiry = time.time() + 3600
+        submitted = asyncio.ensure_future(
+            batcher.submit(make_row("Coffee"), make_pref(), "token", expiry)
+        )
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(batcher.close(), timeout=5)
+
+        assert calls == ["Coffee"]
+        assert submitted.result() == (True, {"success": True, "row_number": 2})
+        assert not batcher._flush_tasks
@@ -3,31 +3,49 @@ Unit tests for SheetsService.build_mapped_row() method.
 These tests MUST FAIL until the build_mapped_row method is implemented.
 """
 import pytest
+import time
+import gspread
 from datetime import date
 from decimal import Decimal
+from unittest.mock import MagicMock
 from backend.src.services.sheets_service import SheetsService
 from backend.src.models.google_sheets_row import GoogleSheetsRow
 from backend.src.models.column_mapping import ColumnMappingConfiguration
+from backend.src.models.user_preference import UserPreference
+
+
+@pytest.fixture(scope="module")
+def coffee_row():
+    """Shared read-only row: 2024-01-15, "Coffee", 15.50."""
+    return GoogleSheetsRow.from_extracted_data(
+        transaction_date=date(2024, 1, 15),
+        items="Coffee",
+        total_amount=Decimal("15.50")
+    )
+
+
+@pytest.fixture(scope="module")
+def coffee_bagel_row():
+    """Shared read-only row: 2024-01-15, "Coffee; Bagel", 15.50."""
+    return GoogleSheetsRow.from_extracted_data(
+        transaction_date=date(2024, 1, 15),
+        items="Coffee; Bagel",
+        total_amount=Decimal("15.50")
+    )
 
 
 class TestSheetsServiceBuildMappedRow:
     """Tests for SheetsService.build_mapped_row() method."""
 
-    def test_build_mapped_row_no_duplicates_ABC(self):
+    def test_build_mapped_row_no_duplicates_ABC(self, coffee_bagel_row):
         """Test build_mapped_row with no duplicates (A, B, C) returns sparse row."""
-        row_data = GoogleSheetsRow.from_extracted_data(
-            transaction_date=date(2024, 1, 15),
-            items="Coffee; Bagel",
-            total_amount=Decimal("15.50")
-        )
-
         mappings = ColumnMappingConfiguration(
             date_column="A",
             description_column="B",
             price_column="C"
         )
 
-        result = SheetsService.build_mapped_row(row_data, mappings)
+        result = SheetsService.build_mapped_row(coffee_bagel_row, mappings)
 
         # Expected: ['2024-01-15', 'Coffee; Bagel', '15.5']
         assert len(result) == 3
@@ -35,21 +53,15 @@ class TestSheetsServiceBuildMappedRow:
         assert result[1] == "Coffee; Bagel"
         assert result[2] == "15.5"
 
-    def test_build_mapped_row_non_contiguous_ACF(self):
+    def test_build_mapped_row_non_contiguous_ACF(self, coffee_row):
         """Test build_mapped_row with non-contiguous columns (A, C, F) returns row with empty strings in gaps."""
-        row_data = GoogleSheetsRow.from_extracted_data(
-            transaction_date=date(2024, 1, 15),
-            items="Coffee",
-            total_amount=Decimal("15.50")
-        )
-
         mappings = ColumnMappingConfiguration(
             date_column="A",
             description_column="C",
             price_column="F"
         )
 
-        result = SheetsService.build_mapped_row(row_data, mappings)
+        result = SheetsService.build_mapped_row(coffee_row, mappings)
 
         # Expected: ['2024-01-15', '', 'Coffee', '', '', '15.5']
         #            A            B   C        D   E   F
@@ -61,21 +73,15 @@ class TestSheetsServiceBuildMappedRow:
         assert result[4] == ""
         assert result[5] == "15.5"
 
-    def test_build_mapped_row_with_duplicates_ABA(self):
+    def test_build_mapped_row_with_duplicates_ABA(self, coffee_row):
         """Test build_mapped_row with duplicates (A, B, A) concatenates values with ' | '."""
-        row_data = GoogleSheetsRow.from_extracted_data(
-            transaction_date=date(2024, 1, 15),
-            items="Coffee",
-            total_amount=Decimal("15.50")
-        )
-
         mappings = ColumnMappingConfiguration(
             date_column="A",
             description_column="B",
             price_column="A"
         )
 
-        result = SheetsService.build_mapped_row(row_data, mappings)
+        result = SheetsService.build_mapped_row(coffee_row, mappings)
 
         # Expected: ['2024-01-15 | 15.5', 'Coffee']
         #            A                     B
@@ -86,31 +92,23 @@ class TestSheetsServiceBuildMappedRow:
         assert "2024-01-15" in result[0]
         assert "15.5" in result[0]
 
-    def test_build_mapped_row_max_column_index_calculation(self):
+    def test_build_mapped_row_max_column_index_calculation(self, coffee_row):
         """Test build_mapped_row with (A, B, ZZ) creates 702-element array."""
-        row_data = GoogleSheetsRow.from_extracted_data(
-            transaction_date=date(2024, 1, 15),
-            items="Coffee",
-            total_amount=Decimal("15.50")
-        )
-
         mappings = ColumnMappingConfiguration(
             date_column="A",
             description_column="B",
             price_column="ZZ"
         )
 
-        result = SheetsService.build_mapped_row(row_data, mappings)
+        result = SheetsService.build_mapped_row(coffee_row, mappings)
 
         # ZZ is index 701, so array should have 702 elements (0-701)
-        assert len(result) == 702
-        assert result[0] == "2024-01-15"
-        assert result[1] == "Coffee"
-        assert result[701] == "15.5"
-
-        # All gaps should be empty strings
-        for i in range(2, 701):
-            assert result[i] == ""
+        # with every gap an empty string
+        expected = [""] * 702
+        expected[0] = "2024-01-15"
+        expected[1] = "Coffee"
+        expected[701] = "15.5"
+        assert result == expected
 
     def test_build_mapped_row_concatenation_order_is_consistent(self):
         """Test concatenation order is consistent when multiple fields map to same column."""
@@ -137,28 +135,150 @@ class TestSheetsServiceBuildMappedRow:
         assert "Coffee; Bagel" in result[0]
         assert "25.5" in result[0]
 
-    def test_build_mapped_row_double_letter_columns(self):
+    def test_build_mapped_row_double_letter_columns(self, coffee_row):
         """Test build_mapped_row with double letter columns (AA, AB, AC)."""
-        row_data = GoogleSheetsRow.from_extracted_data(
-            transaction_date=date(2024, 1, 15),
-            items="Coffee",
-            total_amount=Decimal("15.50")
-        )
-
         mappings = ColumnMappingConfiguration(
             date_column="AA",
             description_column="AB",
             price_column="AC"
         )
 
-        result = SheetsService.build_mapped_row(row_data, mappings)
+        result = SheetsService.build_mapped_row(coffee_row, mappings)
 
         # AA=26, AB=27, AC=28, so array should have 29 elements (0-28)
-        assert len(result) == 29
-        assert result[26] == "2024-01-15"
-        assert result[27] == "Coffee"
-        assert result[28] == "15.5"
-
-        # First 26 elements should be empty
-        for i in range(26):
-            assert result[i] == ""
+        # with the first 26 empty
+        assert result == [""] * 26 + ["2024-01-15", "Coffee", "15.5"]
+
+
+class TestSheetsServiceRowNumber:
+    """Tests for row numbers reported after an append."""
+
+    def test_first_updated_row_from_append_response(self):
+        """Test row number is taken from the updated range start cell."""
+        response = {"updates": {"updatedRange": "'Q1!Budget'!A42:C44"}}
+
+        assert SheetsService._first_updated_row(response) == 42
+
+    def test_first_updated_row_missing_range(self):
+        """Test a response without an updated range yields None."""
+        assert SheetsService._first_updated_row({}) is None
+        assert SheetsService._first_updated_row(None) is None
+
+    def test_append_row_does_not_fetch_all_values(self, monkeypatch):
+        """Test append_row reports the row without reading the whole sheet."""
+        worksheet = MagicMock()
+        worksheet.append_rows.return_value = {"updates": {"updatedRange": "Sheet1!A7:C7"}}
+        monkeypatch.setattr(SheetsService, "_open_worksheet", staticmethod(lambda *_: worksheet))
+        monkeypatch.setattr(
+            SheetsService, "check_token_validity", staticmethod(lambda _: (True, ""))
+        )
+
+        pref = UserPreference(
+            user_session_id="test-session",
+            spreadsheet_id="1" * 44,
+            sheet_tab_name="Sheet1",
+            column_mappings={"date": "A", "description": "B", "price": "C"}
+        )
+        row = GoogleSheetsRow.from_extracted_data(
+            transaction_date=date(2024, 1, 15),
+            items="Coffee",
+            total_amount=Decimal("4.50")
+        )
+
+        success, response = SheetsService.append_row(row, pref, "token", 0.0)
+
+        assert success is True
+        assert response["row_number"] == 7
+        worksheet.get_all_values.assert_not_called()
+
+    def test_append_row_without_updated_range_reports_no_row(self, monkeypatch):
+        """Test row_number is None rather than guessed from the grid size."""
+        worksheet = MagicMock(row_count=1000)
+        worksheet.append_rows.return_value = {}
+        monkeypatch.setattr(SheetsService, "_open_worksheet", staticmethod(lambda *_: worksheet))
+        monkeypatch.setattr(
+            SheetsService, "check_token_validity", staticmethod(lambda _: (True, ""))
+        )
+
+        pref = UserPreference(
+            user_session_id="test-session",
+            spreadsheet_id="1" * 44,
+            sheet_tab_name="Sheet1",
+            column_mappings={"date": "A", "description": "B", "price": "C"}
+        )
+        row = GoogleSheetsRow.from_extracted_data(
+            transaction_date=date(2024, 1, 15),
+            items="Coffee",
+            total_amount=Decimal("4.50")
+        )
+
+        success, response = SheetsService.append_row(row, pref, "token", 0.0)
+
+        assert success is True
+        assert response["row_number"] is None
+
+
+class TestSheetsServiceWorksheetCache:
+    """Tests for reuse of opened worksheet handles."""
+
+    @staticmethod
+    def make_pref() -> UserPreference:
+        """Create a UserPreference pointing at a test spreadsheet."""
+        return UserPreference(
+            user_session_id="test-session",
+            spreadsheet_id="1" * 44,
+            sheet_tab_name="Sheet1",
+            column_mappings={"date": "A", "description": "B", "price": "C"}
+        )
+
+    def test_worksheet_reused_for_same_token(self, monkeypatch):
+        """Test a second open with the same token skips gspread.authorize()."""
+        authorize = MagicMock()
+        monkeypatch.setattr("backend.src.services.sheets_service.gspread.authorize", authorize)
+        pref = self.make_pref()
+        expiry = time.time() + 3600
+
+        first = SheetsService._open_worksheet(pref, "token", expiry)
+        second = SheetsService._open_worksheet(pref, "token", expiry)
+
+        assert first is second
+        authorize.assert_called_once()
+
+    def test_worksheet_not_shared_between_tokens(self, monkeypatch):
+        """Test handles are keyed by token."""
+        authorize = MagicMock()
+        monkeypatch.setattr("backend.src.services.sheets_service.gspread.authorize", authorize)
+        pref = self.make_pref()
+        expiry = time.time() + 3600
+
+        SheetsService._open_worksheet(pref, "token-a", expiry)
+        SheetsService._open_worksheet(pref, "token-b", expiry)
+
+        assert authorize.call_count == 2
+
+    def test_worksheet_not_reused_past_token_margin(self, monkeypatch):
+        """Test a token inside the expiry margin is never served from cache."""
+        authorize = MagicMock()
+        monkeypatch.setattr("backend.src.services.sheets_service.gspread.authorize", authorize)
+        pref = self.make_pref()
+        expiry = time.time() + SheetsService.TOKEN_EXPIRY_MARGIN - 1
+
+        SheetsService._open_worksheet(pref, "token", expiry)
+        SheetsService._open_worksheet(pref, "token", expiry)
+
+        assert authorize.call_count == 2
+
+    def test_auth_error_discards_worksheet(self, monkeypatch):
+        """Test a 403 from the API forgets the cached handle."""
+        authorize = MagicMock()
+        monkeypatch.setattr("backend.src.services.sheets_service.gspread.authorize", authorize)
+        pref = self.make_pref()
+        expiry = time.time() + 3600
+
+        SheetsService._open_worksheet(pref, "token", expiry)
+        error = gspread.exceptions.APIError.__new__(gspread.exceptions.APIError)
+        error.response = MagicMock(status_code=403)
+        SheetsService._discard_worksheet_on_auth_error(error, pref, "token")
+        SheetsService._open_worksheet(pref, "token", expiry)
+
+        assert authorize.call_count == 2
@@ -0,0 +1,163 @@
+"""
+Unit tests for TempStorageService.
+"""
+import io
+import logging
+import os
+import tempfile
+import time
+import uuid
+
+import pytest
+
+from backend.src.storage.temp_storage import TempStorageService
+
+RECEIPT_CONTENT = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """TempStorageService over an empty upload directory."""
+    return TempStorageService(upload_dir=str(tmp_path / "uploads"))
+
+
+@pytest.fixture
+def sendfile_calls(monkeypatch):
+    """Record each os.sendfile() call while still performing it."""
+    calls = []
+    real_sendfile = os.sendfile
+
+    def recording_sendfile(out_fd, in_fd, offset, count):
+        calls.append(offset)
+        return real_sendfile(out_fd, in_fd, offset, count)
+
+    monkeypatch.setattr(os, "sendfile", recording_sendfile)
+    return calls
+
+
+def spooled(content: bytes, max_size: int) -> tempfile.SpooledTemporaryFile:
+    """Build a spool holding content, rewound, as UploadFile.file would be."""
+    spool = tempfile.SpooledTemporaryFile(max_size=max_size)
+    spool.write(content)
+    spool.seek(0)
+    return spool
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile() not available")
+class TestTempStorageSaveReceiptStream:
+    """Tests for TempStorageService.save_receipt_stream() method."""
+
+    def test_in_memory_spool_is_copied_without_rolling_over(self, storage, sendfile_calls):
+        """Test a spool still in memory is copied by read() and stays in memory."""
+        receipt_id = str(uuid.uuid4())
+        with spooled(RECEIPT_CONTENT, max_size=len(RECEIPT_CONTENT) + 1) as src:
+            path = storage.save_receipt_stream(src, receipt_id, "image/jpeg")
+
+            assert not src._rolled
+
+        assert sendfile_calls == []
+        assert path == str(storage.upload_dir / f"{receipt_id}.jpg")
+        with open(path, "rb") as f:
+            assert f.read() == RECEIPT_CONTENT
+
+    def test_rolled_over_spool_is_copied_with_sendfile(self, storage, sendfile_calls):
+        """Test a spool already on disk is copied in the kernel."""
+        with spooled(RECEIPT_CONTENT, max_size=16) as src:
+            assert src._rolled
+
+            path = storage.save_receipt_stream(src, str(uuid.uuid4()), "image/png")
+
+        assert sendfile_calls[0] == 0
+        with open(path, "rb") as f:
+            assert f.read() == RECEIPT_CONTENT
+
+    def test_rolled_over_spool_is_copied_from_current_position(self, storage, sendfile_calls):
+        """Test sendfile starts at src.tell(), not at the start of the file."""
+        with spooled(RECEIPT_CONTENT, max_size=16) as src:
+            src.seek(100)
+
+            path = storage.save_receipt_stream(src, str(uuid.uuid4()), "image/jpeg")
+
+        assert sendfile_calls[0] == 100
+        with open(path, "rb") as f:
+            assert f.read() == RECEIPT_CONTENT[100:]
+
+    def test_in_memory_source_is_copied_from_current_position(self, storage, sendfile_calls):
+        """Test file objects without a descriptor are copied from their position."""
+        src = io.BytesIO(RECEIPT_CONTENT)
+        src.seek(100)
+
+        path = storage.save_receipt_stream(src, str(uuid.uuid4()), "image/jpeg")
+
+        assert sendfile_calls == []
+        with open(path, "rb") as f:
+            assert f.read() == RECEIPT_CONTENT[100:]
+
+    def test_invalid_receipt_id_raises(self, storage):
+        """Test a non-UUID receipt ID is rejected before anything is written."""
+        with pytest.raises(ValueError):
+            storage.save_receipt_stream(io.BytesIO(RECEIPT_CONTENT), "../escape", "image/jpeg")
+
+        assert list(storage.upload_dir.iterdir()) == []
+
+
+def make_files(directory, names, age_hours: float):
+    """Create empty files in directory with mtimes age_hours in the past."""
+    mtime = time.time() - age_hours * 3600
+    paths = []
+    for name in names:
+        path = directory / name
+        path.write_bytes(b"")
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+    return paths
+
+
+class TestTempStorageCleanupOldFilesAsync:
+    """Tests for TempStorageService.cleanup_old_files_async() method."""
+
+    async def test_deletes_only_expired_files(self, storage):
+        """Test files past the threshold are deleted and counted, newer ones kept."""
+        expired = make_files(storage.upload_dir, ["a.jpg", "b.jpg", "c.png"], age_hours=25)
+        recent = make_files(storage.upload_dir, ["d.jpg"], age_hours=1)
+
+        deleted = await storage.cleanup_old_files_async(hours=24, max_concurrency=2)
+
+        assert deleted == 3
+        assert not any(path.exists() for path in expired)
+        assert all(path.exists() for path in recent)
+
+    async def test_failed_unlink_is_logged_and_not_counted(self, storage, monkeypatch, caplog):
+        """Test an unlink error is logged for its file and left out of the count."""
+        expired = make_files(storage.upload_dir, ["a.jpg", "b.jpg", "c.png"], age_hours=25)
+        failing = str(expired[1])
+        real_unlink = os.unlink
+
+        def unlink(path):
+            if path == failing:
+                raise OSError("device busy")
+            real_unlink(path)
+
+        monkeypatch.setattr(os, "unlink", unlink)
+
+        with caplog.at_level(logging.ERROR, logger="backend.src.storage.temp_storage"):
+            deleted = await storage.cleanup_old_files_async(hours=24)
+
+        assert deleted == 2
+        assert expired[1].exists()
+        assert f"Error deleting file {failing}: device busy" in caplog.text
+
+    async def test_permission_error_is_logged_and_not_counted(self, storage, monkeypatch, caplog):
+        """Test an unlink refused by permissions is logged and not counted."""
+        expired = make_files(storage.upload_dir, ["a.jpg"], age_hours=25)
+
+        def unlink(path):
+            raise PermissionError("not permitted")
+
+        monkeypatch.setattr(os, "unlink", unlink)
+
+        with caplog.at_level(logging.ERROR, logger="backend.src.storage.temp_storage"):
+            deleted = await storage.cleanup_old_files_async(hours=24)
+
+        assert deleted == 0
+        assert f"Permission error deleting file {expired[0]}" in caplog.text
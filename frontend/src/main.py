@@ -3,31 +3,132 @@ FastAPI main application entry point.
 """
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.sessions import SessionMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware import Middleware
+from fastapi.responses import HTMLResponse
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from markupsafe import escape
+from typing import Tuple
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
 from pathlib import Path
 import os
+import atexit
+import copy
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Import API routers
 from backend.src.api.v1 import upload, save, auth, column_config
-from backend.src.api.middleware.file_validation import FileValidationMiddleware
+from backend.src.api.responses import ORJSONResponse, encode_json
+from backend.src.api.static_files import CachedStaticFiles
+from backend.src.api.middleware.session_gate import SessionGateMiddleware
 from backend.src.services.cleanup_service import CleanupService
 from backend.src.storage.temp_storage import TempStorageService
 
+
+# Renders tracebacks in prepare(); Formatter.format() uses exc_text as is
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves the Formatter work to the listener thread.
+
+    The stock prepare() runs the full Formatter on the logging thread, which
+    for request logs is the event loop.
+    """
+
+    def __init__(self, records: "queue.SimpleQueue[logging.LogRecord]", freeze_args: bool = True):
+        """
+        Initialize handler.
+
+        Args:
+            records: Queue drained by the listener
+            freeze_args: Merge args into the message before enqueueing; turn
+                off for formatters that read record.args themselves
+        """
+        super().__init__(records)
+        self.freeze_args = freeze_args
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Freeze the record's message and traceback before it is enqueued.
+
+        msg % args and the traceback text are resolved here, so later changes
+        to mutable args and the traceback's frames do not reach the listener
+        thread; the listener only applies the timestamp and layout.
+
+        Args:
+            record: Record being logged
+
+        Returns:
+            Copy of the record safe to format on another thread
+        """
+        record = copy.copy(record)
+        if self.freeze_args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _queue_handlers(target: logging.Logger, freeze_args: bool = True) -> None:
+    """
+    Route a logger's output through a queue drained by a background thread.
+
+    The logger only enqueues records; its current handlers move to the
+    listener thread, where formatting and the stream write happen unchanged.
+    The listener is flushed and stopped at interpreter exit.
+
+    Args:
+        target: Logger whose handlers to move behind the queue
+        freeze_args: Passed on to _DeferredQueueHandler
+    """
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(records, *target.handlers, respect_handler_level=True)
+    target.handlers = [_DeferredQueueHandler(records, freeze_args=freeze_args)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# ENV=prod turns off the API docs, the per-request access log and INFO logs
+PRODUCTION = os.getenv("ENV") == "prod"
+
 # Configure logging
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=logging.WARNING if PRODUCTION else logging.INFO,
+    handlers=[_log_handler]
 )
 logger = logging.getLogger(__name__)
 
+# Write log records from a background thread. The root logger is only
+# rerouted if basicConfig installed the handler above (it is a no-op when
+# the root logger already has handlers, e.g. under pytest); uvicorn has
+# configured its own loggers by the time it imports the app.
+if logging.getLogger().handlers == [_log_handler]:
+    _queue_handlers(logging.getLogger())
+if PRODUCTION:
+    logging.getLogger("uvicorn.access").disabled = True
+if logging.getLogger("uvicorn").handlers:
+    _queue_handlers(logging.getLogger("uvicorn"))
+if logging.getLogger("uvicorn.access").handlers:
+    # uvicorn's AccessFormatter unpacks record.args; they are always a tuple
+    # of strings and ints, so passing them through unformatted is safe
+    _queue_handlers(logging.getLogger("uvicorn.access"), freeze_args=False)
+
 # Initialize cleanup service
 storage_service = TempStorageService()
 cleanup_service = CleanupService(storage_service)
@@ -41,42 +142,119 @@ async def lifespan(app: FastAPI):
     cleanup_service.schedule_cleanup()
     cleanup_service.start()
 
+    # Render the cached pages and compile the per-request one now so no
+    # request pays for template loading
+    _render_static_page("upload.html")
+    _render_static_page("setup.html")
+    _review_page_parts()
+    templates.get_template("column_config.html")
+
     yield
 
     # Shutdown
+    logger.info("Application shutdown: flushing pending Sheets appends")
+    await save.sheets_batcher.close()
+
     logger.info("Application shutdown: stopping cleanup scheduler")
     cleanup_service.stop()
 
 
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-for-development-only")
+if not SECRET_KEY:
+    # An empty key would sign session cookies with no secret at all
+    raise RuntimeError("SECRET_KEY must not be empty")
+
+GZIP_MINIMUM_SIZE = 1024
+
+# Resolved against this file so the app starts from any working directory
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Middleware stack, outermost first. Each request pays for every layer above
+# the one that answers it, so keep the cheap, widely needed layers outside:
+# - CORS: answers preflight requests itself, before any other layer runs;
+#   adds its headers to every other response
+# - GZip: compresses responses of 1KB and more
+# - Session (OAuth2 token storage): only /api/ paths load or sign the cookie
+MIDDLEWARE = [
+    Middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Restrict in production
+        # The pages call the API same-origin; other origins get no cookies
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        max_age=86400,  # Let browsers cache preflight responses for a day
+    ),
+    Middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5),
+    Middleware(SessionGateMiddleware, secret_key=SECRET_KEY),
+]
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Receipt Processing Web App",
     description="Upload receipt images, extract data via OCR, and save to Google Sheets",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    middleware=MIDDLEWARE,
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    openapi_url=None if PRODUCTION else "/openapi.json",
 )
 
-# Add session middleware (for OAuth2 token storage)
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-for-development-only")
-app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Restrict in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure templates; templates only change on deploy, so skip the per-render
+# mtime check, keep every compiled template and share bytecode across workers
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+))
+
+# Stand-in rendered into review.html where the receipt ID goes
+_RECEIPT_ID_SLOT = "\x00receipt_id\x00"
+
 
-# Add file validation middleware
-app.add_middleware(FileValidationMiddleware)
+@lru_cache(maxsize=None)
+def _render_static_page(name: str) -> bytes:
+    """
+    Cached implementation of rendering a page that takes no context.
 
-# Configure templates
-templates = Jinja2Templates(directory="frontend/src/templates")
+    upload.html and setup.html depend on nothing in the request, so they
+    are rendered once and every later request reuses the encoded bytes.
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="frontend/src/static"), name="static")
+    Args:
+        name: Template filename
+
+    Returns:
+        Rendered page as UTF-8 bytes
+    """
+    return templates.get_template(name).render({"request": None}).encode()
+
+
+@lru_cache(maxsize=1)
+def _review_page_parts() -> Tuple[bytes, bytes]:
+    """
+    Cached implementation of splitting review.html around the receipt ID.
+
+    Returns:
+        Tuple of (bytes before the receipt ID, bytes after it)
+    """
+    rendered = templates.get_template("review.html").render(
+        {"request": None, "receipt_id": _RECEIPT_ID_SLOT}
+    )
+    head, tail = rendered.split(_RECEIPT_ID_SLOT)
+    return head.encode(), tail.encode()
+
+
+# Mount static files (loaded and gzipped into memory at startup)
+app.mount(
+    "/static",
+    CachedStaticFiles(directory=STATIC_DIR, gzip_minimum_size=GZIP_MINIMUM_SIZE),
+    name="static",
+)
 
 # Include API routers
 app.include_router(upload.router, tags=["Receipt Processing"])
@@ -88,13 +266,13 @@ app.include_router(column_config.router, tags=["Column Configuration"])
 @app.get("/")
 async def root(request: Request):
     """Render upload page (homepage)."""
-    return templates.TemplateResponse("upload.html", {"request": request})
+    return HTMLResponse(_render_static_page("upload.html"))
 
 
 @app.get("/setup")
 async def setup_page(request: Request):
     """Render Google Sheets setup page."""
-    return templates.TemplateResponse("setup.html", {"request": request})
+    return HTMLResponse(_render_static_page("setup.html"))
 
 
 @app.get("/column-config")
@@ -146,20 +324,38 @@ async def review_page(request: Request, receipt_id: str):
         Rendered review template
     """
     # TODO: Load extracted data from session or storage
-    # For now, pass receipt_id to template
-    return templates.TemplateResponse(
-        "review.html",
-        {
-            "request": request,
-            "receipt_id": receipt_id
-        }
-    )
+    # For now, pass receipt_id to template; escaped as the template would
+    head, tail = _review_page_parts()
+    return HTMLResponse(head + str(escape(receipt_id)).encode() + tail)
+
+
+_HEALTH_BODY = encode_json({"status": "healthy"})
+_HEALTH_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode("latin-1")),
+)
+
+
+class HealthCheckApp:
+    """
+    Health check endpoint as a raw ASGI app.
+
+    Routed with a plain Starlette Route, so requests skip FastAPI's
+    dependency solving, validation and response serialization.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Fresh headers list per request: CORSMiddleware appends to it in place
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": list(_HEALTH_HEADERS),
+        })
+        await send({"type": "http.response.body", "body": _HEALTH_BODY})
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+# Health check endpoint; first in the route table so it matches before any other route
+app.router.routes.insert(0, Route("/health", endpoint=HealthCheckApp(), methods=["GET"]))
 
 
 if __name__ == "__main__":